@@ -1,10 +1,10 @@
 from django.contrib import admin
-from apps.events.models import Event, EventRegistration
+from apps.events.models import Event, EventRegistration, EventReminderDelivery, EventWaitlistEntry
 
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
-    list_display = ("id", "title", "date", "location", "organizer", "created_at")
+    list_display = ("id", "title", "date", "location", "organizer", "capacity", "participants_count", "created_at")
     list_filter = ("date", "location", "organizer")
     search_fields = ("title", "description", "location", "organizer__username")
 
@@ -14,3 +14,17 @@ class EventRegistrationAdmin(admin.ModelAdmin):
     list_display = ("id", "event", "participant", "registered_at")
     list_filter = ("registered_at", "event")
     search_fields = ("event__title", "participant__username", "participant__email")
+
+
+@admin.register(EventWaitlistEntry)
+class EventWaitlistEntryAdmin(admin.ModelAdmin):
+    list_display = ("id", "event", "participant", "joined_at")
+    list_filter = ("joined_at", "event")
+    search_fields = ("event__title", "participant__username", "participant__email")
+
+
+@admin.register(EventReminderDelivery)
+class EventReminderDeliveryAdmin(admin.ModelAdmin):
+    list_display = ("id", "event", "participant", "sent_at")
+    list_filter = ("sent_at", "event")
+    search_fields = ("event__title", "participant__username", "participant__email")
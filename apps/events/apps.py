@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class EventsConfig(AppConfig):
     name = "apps.events"
+
+    def ready(self) -> None:
+        from apps.events import signals  # noqa: F401
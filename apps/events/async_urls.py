@@ -0,0 +1,10 @@
+from django.urls import path
+from apps.events import async_views
+
+app_name = "events-async"
+
+urlpatterns = [
+    path("", async_views.event_list, name="events-list"),
+    path("<int:pk>/", async_views.event_detail, name="events-detail"),
+    path("<int:pk>/participants/", async_views.event_participants, name="events-participants"),
+]
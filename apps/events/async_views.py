@@ -0,0 +1,62 @@
+"""
+Native async versions of the hot read endpoints of `EventViewSet`, served under `/api/async/events/` by an ASGI
+worker. They return the same payloads as the DRF views but wait on Postgres without holding a worker thread.
+"""
+
+from django.http import HttpResponse
+from django.shortcuts import aget_object_or_404
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from apps.events.caching import acached_response
+from apps.events.filters import EventFilter
+from apps.events.models import Event
+from apps.events.pagination import EventKeysetPagination, RegistrationKeysetPagination, is_keyset_requested
+from apps.events.serializers import EventSerializer, ParticipantSerializer, ParticipantsQuerySerializer
+from apps.events.services.participants import get_event_participants
+from event_management.async_api import AsyncLimitOffsetPagination, async_api_view, render_response
+
+
+def get_event_queryset():
+    return Event.objects.select_related("organizer")
+
+
+@async_api_view
+async def event_list(request: Request) -> HttpResponse:
+    async def build() -> dict:
+        filterset = EventFilter(request.query_params, queryset=get_event_queryset(), request=request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        paginator = EventKeysetPagination() if is_keyset_requested(request) else AsyncLimitOffsetPagination()
+        page = await paginator.apaginate_queryset(filterset.qs, request)
+        data = EventSerializer(page, many=True, context={"request": request}).data
+        return paginator.get_paginated_data(data)
+
+    return await acached_response(request, build)
+
+
+@async_api_view
+async def event_detail(request: Request, pk: int) -> HttpResponse:
+    async def build() -> dict:
+        event = await aget_object_or_404(get_event_queryset(), pk=pk)
+        return EventSerializer(event, context={"request": request}).data
+
+    return await acached_response(request, build)
+
+
+@async_api_view
+async def event_participants(request: Request, pk: int) -> HttpResponse:
+    event = await aget_object_or_404(Event.objects.only("id", "participants_count"), pk=pk)
+    params = ParticipantsQuerySerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    ids_only: bool = params.validated_data["ids_only"]
+    if is_keyset_requested(request):
+        paginator = RegistrationKeysetPagination()
+    else:
+        paginator = AsyncLimitOffsetPagination()
+        paginator.known_count = event.participants_count
+    page = await paginator.apaginate_queryset(get_event_participants(event.id, ids_only=ids_only), request)
+    if ids_only:
+        data = [registration.participant_id for registration in page]
+    else:
+        data = ParticipantSerializer(page, many=True, context={"request": request}).data
+    return render_response(paginator.get_paginated_data(data))
@@ -0,0 +1,145 @@
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+import django
+from django.db import connection
+from django.db.models import Max, Min, Model
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    query_counts: list[int] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    wall_time: float = 0.0
+
+    def summary(self) -> dict[str, Any]:
+        latencies_ms = [latency * 1000 for latency in self.latencies]
+        return {
+            "iterations": len(self.latencies),
+            "throughput_rps": round(len(self.latencies) / self.wall_time, 2) if self.wall_time else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(latencies_ms, 50), 3),
+                "p99": round(percentile(latencies_ms, 99), 3),
+                "mean": round(statistics.fmean(latencies_ms), 3) if latencies_ms else 0.0,
+                "max": round(max(latencies_ms, default=0.0), 3),
+            },
+            "queries": {
+                "median": statistics.median(self.query_counts) if self.query_counts else 0,
+                "max": max(self.query_counts, default=0),
+            },
+            "statuses": {str(code): count for code, count in sorted(self.statuses.items())},
+        }
+
+
+def measure(
+    name: str,
+    operation: Callable[[int], Any],
+    *,
+    iterations: int,
+    warmup: int = 0,
+    before_each: Callable[[int], None] | None = None,
+    count_queries: bool = True,
+) -> BenchmarkResult:
+    """
+    Times `operation(i)` for every iteration and records the SQL query count of each call. When the operation
+    returns an HTTP response its status code is tallied too. `before_each` runs outside the timed section.
+    """
+    for i in range(warmup):
+        operation(i)
+    result = BenchmarkResult(name)
+    started = time.perf_counter()
+    for i in range(iterations):
+        if before_each is not None:
+            before_each(i)
+        with CaptureQueriesContext(connection) if count_queries else nullcontext() as queries:
+            start = time.perf_counter()
+            outcome = operation(i)
+            result.latencies.append(time.perf_counter() - start)
+        if count_queries:
+            result.query_counts.append(len(queries))
+        if hasattr(outcome, "status_code"):
+            result.statuses[outcome.status_code] += 1
+    result.wall_time = time.perf_counter() - started
+    return result
+
+
+def measure_concurrent(
+    name: str, operation: Callable[[int], int], *, iterations: int, concurrency: int
+) -> BenchmarkResult:
+    """
+    Runs `operation(i)` from `concurrency` threads at once; it must return an HTTP status code. Used to load
+    real servers over HTTP, so no SQL queries are counted.
+    """
+
+    def timed(i: int) -> tuple[float, int]:
+        start = time.perf_counter()
+        status_code = operation(i)
+        return time.perf_counter() - start, status_code
+
+    result = BenchmarkResult(name)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency, status_code in pool.map(timed, range(iterations)):
+            result.latencies.append(latency)
+            result.statuses[status_code] += 1
+    result.wall_time = time.perf_counter() - started
+    return result
+
+
+def sample_ids(model: type[Model], size: int) -> list[int]:
+    """Picks up to `size` existing primary keys spread over the whole id range without scanning the table."""
+    bounds = model.objects.aggregate(low=Min("pk"), high=Max("pk"))
+    if bounds["low"] is None:
+        return []
+    ids: set[int] = set()
+    for _ in range(size):
+        pivot = random.randint(bounds["low"], bounds["high"])
+        ids.add(model.objects.filter(pk__gte=pivot).order_by("pk").values_list("pk", flat=True).first())
+    return sorted(ids)
+
+
+def _git_commit() -> str | None:
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5, check=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def write_results(path: str | Path, results: list[BenchmarkResult], **metadata: Any) -> dict[str, Any]:
+    """Writes a JSON report that can be diffed between commits."""
+    report = {
+        "meta": {
+            "timestamp": timezone.now().isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            **metadata,
+        },
+        "results": {result.name: result.summary() for result in results},
+    }
+    Path(path).write_text(json.dumps(report, indent=2, sort_keys=True))
+    return report
@@ -0,0 +1,120 @@
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.http import parse_etags, urlencode
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from event_management.async_api import render_response
+from event_management.db_routing import replica_reads_enabled
+
+
+EVENTS_GENERATION_KEY = "events:generation"
+EVENTS_CHANGED_AT_KEY = "events:changed_at"
+
+
+def get_events_generation() -> int:
+    generation = cache.get(EVENTS_GENERATION_KEY)
+    if generation is None:
+        # seed with a timestamp so an evicted counter never reuses an older generation
+        cache.add(EVENTS_GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = cache.get(EVENTS_GENERATION_KEY, 0)
+    return generation
+
+
+async def aget_events_generation() -> int:
+    generation = await cache.aget(EVENTS_GENERATION_KEY)
+    if generation is None:
+        await cache.aadd(EVENTS_GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = await cache.aget(EVENTS_GENERATION_KEY, 0)
+    return generation
+
+
+def bump_events_generation() -> None:
+    try:
+        cache.incr(EVENTS_GENERATION_KEY)
+    except ValueError:
+        cache.set(EVENTS_GENERATION_KEY, time.time_ns(), timeout=None)
+    cache.set(EVENTS_CHANGED_AT_KEY, time.time(), timeout=None)
+
+
+class CachedResponseMixin:
+    """
+    Caches list/retrieve payloads per query string under the current events generation.
+    Any write bumps the generation, which invalidates every cached page at once.
+    """
+
+    cached_actions = ("list", "retrieve")
+    response_cache_prefix = "events:response"
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_response_cache_key(self, request: Request) -> str:
+        return build_response_cache_key(request, get_events_generation(), self.response_cache_prefix)
+
+    def cached_response(self, handler: Callable[..., Response], request: Request, *args, **kwargs) -> Response:
+        key = self.get_response_cache_key(request)
+        etag = build_etag(key)
+        headers = {"ETag": etag}
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        data = cache.get(key)
+        if data is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK or not self.may_store_response():
+                return response
+            cache.set(key, response.data, timeout=getattr(settings, "EVENTS_CACHE_TIMEOUT", 300))
+            response["ETag"] = etag
+            return response
+        return Response(data, headers=headers)
+
+    @staticmethod
+    def may_store_response() -> bool:
+        # a replica may still miss the write behind the current generation; its page must not be cached under it
+        if not replica_reads_enabled.get():
+            return True
+        changed_at = cache.get(EVENTS_CHANGED_AT_KEY)
+        return changed_at is None or time.time() - changed_at > getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 10)
+
+
+def build_response_cache_key(request: Request, generation: int, prefix: str) -> str:
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    # payloads hold absolute pagination links, so responses differ per host and scheme
+    digest = hashlib.sha1(f"{request.scheme}://{request.get_host()}{request.path}?{query}".encode()).hexdigest()
+    return f"{prefix}:{generation}:{digest}"
+
+
+def build_etag(key: str) -> str:
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    return etag in parse_etags(request.headers.get("If-None-Match", ""))
+
+
+async def acached_response(
+    request: Request,
+    handler: Callable[[], Awaitable[Any]],
+    prefix: str = CachedResponseMixin.response_cache_prefix,
+) -> HttpResponse:
+    """
+    `CachedResponseMixin.cached_response` for async views: `handler` returns the payload and raises on errors.
+    """
+    key = build_response_cache_key(request, await aget_events_generation(), prefix)
+    etag = build_etag(key)
+    headers = {"ETag": etag}
+    if etag_matches(request, etag):
+        return render_response(None, status.HTTP_304_NOT_MODIFIED, headers)
+    data = await cache.aget(key)
+    if data is None:
+        data = await handler()
+        await cache.aset(key, data, timeout=getattr(settings, "EVENTS_CACHE_TIMEOUT", 300))
+    return render_response(data, status.HTTP_200_OK, headers)
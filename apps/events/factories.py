@@ -1,9 +1,17 @@
+import random
 import factory
 from django.utils import timezone
 from apps.events.models import Event, EventRegistration
+from apps.events.services.feed import refresh_upcoming_events
+from apps.events.services.participants import rebuild_participants_count
+from apps.events.services.search import update_search_vectors
 from apps.users.factories import UserFactory
 
 
+def _random_event_date():
+    return timezone.now() + timezone.timedelta(hours=random.randint(-30 * 24, 90 * 24))
+
+
 class EventFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Event
@@ -14,6 +22,25 @@ class EventFactory(factory.django.DjangoModelFactory):
     location = factory.Faker("city")
     organizer = factory.SubFactory(UserFactory)
 
+    @classmethod
+    def create_bulk(cls, size: int, organizer_ids: list[int], *, batch_size: int = 5000, **kwargs) -> list[int]:
+        """
+        Inserts events batch by batch with bulk_create, spread over existing organizers, and fills their search
+        documents. Returns the new event ids.
+        """
+        kwargs.setdefault("date", factory.LazyFunction(_random_event_date))
+        ids: list[int] = []
+        for start in range(0, size, batch_size):
+            count = min(batch_size, size - start)
+            events = cls.build_batch(count, organizer=None, **kwargs)
+            for event, organizer_id in zip(events, random.choices(organizer_ids, k=count)):
+                event.organizer_id = organizer_id
+            batch_ids = [event.pk for event in Event.objects.bulk_create(events)]
+            update_search_vectors(Event.objects.filter(pk__in=batch_ids))
+            refresh_upcoming_events(batch_ids)
+            ids.extend(batch_ids)
+        return ids
+
 
 class EventRegistrationFactory(factory.django.DjangoModelFactory):
     class Meta:
@@ -22,3 +49,22 @@ class EventRegistrationFactory(factory.django.DjangoModelFactory):
 
     event = factory.SubFactory(EventFactory)
     participant = factory.SubFactory(UserFactory)
+
+    @classmethod
+    def create_bulk(
+        cls, size: int, event_ids: list[int], participant_ids: list[int], *, batch_size: int = 10000
+    ) -> int:
+        """
+        Inserts about `size` random (event, participant) pairs with bulk_create, skipping duplicates, then
+        rebuilds drifted participant counters. Returns the number of registrations stored.
+        """
+        before = EventRegistration.objects.count()
+        for start in range(0, size, batch_size):
+            count = min(batch_size, size - start)
+            pairs = set(zip(random.choices(event_ids, k=count), random.choices(participant_ids, k=count)))
+            EventRegistration.objects.bulk_create(
+                [EventRegistration(event_id=event_id, participant_id=user_id) for event_id, user_id in pairs],
+                ignore_conflicts=True,
+            )
+        rebuild_participants_count()
+        return EventRegistration.objects.count() - before
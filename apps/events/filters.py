@@ -1,27 +1,76 @@
-from django.db.models import Q, QuerySet
+from django.contrib.postgres.search import SearchRank
+from django.db.models import F, QuerySet, Value
+from django.db.models.functions import Lower, Trim
+from django.utils import timezone
 from django_filters import rest_framework as filters
-from apps.events.models import Event
+from apps.events.models import Event, EventRegistration
+from apps.events.services.search import build_search_query
 
 
 class EventFilter(filters.FilterSet):
     organizer = filters.NumberFilter(field_name="organizer_id")
+    # `date_after` / `date_before`, both inclusive
+    date = filters.IsoDateTimeFromToRangeFilter(field_name="date", label="Date range")
+    upcoming = filters.BooleanFilter(method="filter_upcoming", label="Upcoming")
+    location = filters.CharFilter(method="filter_location", label="Location (case and surrounding spaces ignored)")
+    location_exact = filters.CharFilter(method="filter_location_exact", label="Location (exact)")
     search = filters.CharFilter(method="filter_search", label="Search")
+    ordering = filters.ChoiceFilter(
+        choices=(("relevance", "Relevance"),), method="filter_ordering", label="Ordering"
+    )
 
     class Meta:
         model = Event
-        fields = ["organizer", "search"]
+        fields = ["organizer", "date", "upcoming", "location", "location_exact", "search", "ordering"]
+
+    def filter_upcoming(self, qs, name, value) -> QuerySet:
+        return filter_by_upcoming(qs, "date", value)
+
+    def filter_location(self, qs, name, value) -> QuerySet:
+        # normalize the value with the column's own expression so both sides always agree
+        return qs.filter(location_normalized=Lower(Trim(Value(value))))
+
+    def filter_location_exact(self, qs, name, value) -> QuerySet:
+        # the normalized predicate lets Postgres use the index, the exact one rechecks the rows it finds
+        return self.filter_location(qs, name, value).filter(location=value)
 
     def filter_search(self, qs, name, value) -> QuerySet:
-        if not value:
+        query = build_search_query(value)
+        if query is None:
+            return qs
+        return qs.filter(search_vector=query)
+
+    def filter_ordering(self, qs, name, value) -> QuerySet:
+        query = build_search_query(self.form.cleaned_data.get("search"))
+        if value != "relevance" or query is None:
             return qs
-        terms = [term for term in value.split() if term]
-        for term in terms:
-            qs = qs.filter(
-                Q(title__icontains=term)
-                | Q(description__icontains=term)
-                | Q(location__icontains=term)
-                | Q(organizer__username__icontains=term)
-                | Q(organizer__first_name__icontains=term)
-                | Q(organizer__last_name__icontains=term)
-            )
+        return qs.annotate(relevance=SearchRank(F("search_vector"), query)).order_by("-relevance", "id")
+
+
+def filter_by_upcoming(qs: QuerySet, date_field: str, upcoming: bool | None) -> QuerySet:
+    if upcoming is None:
         return qs
+    lookup = "gte" if upcoming else "lt"
+    return qs.filter(**{f"{date_field}__{lookup}": timezone.now()})
+
+
+class MyEventFilter(filters.FilterSet):
+    upcoming = filters.BooleanFilter(method="filter_upcoming", label="Upcoming")
+
+    class Meta:
+        model = Event
+        fields = ["upcoming"]
+
+    def filter_upcoming(self, qs, name, value) -> QuerySet:
+        return filter_by_upcoming(qs, "date", value)
+
+
+class MyRegistrationFilter(filters.FilterSet):
+    upcoming = filters.BooleanFilter(method="filter_upcoming", label="Upcoming")
+
+    class Meta:
+        model = EventRegistration
+        fields = ["upcoming"]
+
+    def filter_upcoming(self, qs, name, value) -> QuerySet:
+        return filter_by_upcoming(qs, "event__date", value)
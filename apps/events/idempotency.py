@@ -0,0 +1,71 @@
+import functools
+import hashlib
+import json
+from collections.abc import Callable
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyKeyInProgress(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "A request with this Idempotency-Key is still being processed."
+    default_code = "idempotency_key_in_progress"
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "This Idempotency-Key was already used with a different request payload."
+    default_code = "idempotency_key_reused"
+
+
+def _fingerprint(request: Request) -> str:
+    payload = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(f"{request.method}:{request.path}:{payload}".encode()).hexdigest()
+
+
+def idempotent(scope: str) -> Callable:
+    """
+    Replays the stored response of a viewset action when a client retries with the same Idempotency-Key.
+    Keys are scoped per user and per object, and expire after IDEMPOTENCY_KEY_TTL seconds.
+    """
+
+    def decorator(handler: Callable[..., Response]) -> Callable[..., Response]:
+        @functools.wraps(handler)
+        def wrapper(view, request: Request, *args, **kwargs) -> Response:
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if not key:
+                return handler(view, request, *args, **kwargs)
+            digest = hashlib.sha256(key.encode()).hexdigest()
+            cache_key = f"idempotency:{scope}:{request.user.pk}:{kwargs.get('pk')}:{digest}"
+            fingerprint = _fingerprint(request)
+            stored = cache.get(cache_key)
+            if stored is None:
+                lock_key = f"{cache_key}:lock"
+                if not cache.add(lock_key, 1, timeout=getattr(settings, "IDEMPOTENCY_LOCK_TIMEOUT", 60)):
+                    raise IdempotencyKeyInProgress()
+                try:
+                    # a concurrent request may have stored its response and released the lock since the first read
+                    stored = cache.get(cache_key)
+                    if stored is None:
+                        response = handler(view, request, *args, **kwargs)
+                        if response.status_code < 500:
+                            stored = {"fingerprint": fingerprint, "status": response.status_code, "data": response.data}
+                            cache.set(cache_key, stored, timeout=getattr(settings, "IDEMPOTENCY_KEY_TTL", 86400))
+                        return response
+                finally:
+                    cache.delete(lock_key)
+            if stored["fingerprint"] != fingerprint:
+                raise IdempotencyKeyReused()
+            return Response(stored["data"], status=stored["status"], headers={IDEMPOTENCY_REPLAYED_HEADER: "true"})
+
+        return wrapper
+
+    return decorator
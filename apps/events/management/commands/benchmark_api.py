@@ -0,0 +1,155 @@
+import random
+import time
+from contextlib import ExitStack
+from unittest.mock import patch
+import factory
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.events.benchmarking import BenchmarkResult, measure, sample_ids, write_results
+from apps.events.caching import bump_events_generation
+from apps.events.factories import EventFactory, EventRegistrationFactory
+from apps.events.models import Event, EventRegistration
+from apps.users.factories import UserFactory
+
+
+User = get_user_model()
+
+ENDPOINTS = ("list", "search", "retrieve", "participants", "register", "unregister")
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a benchmark dataset and measure throughput, p50/p99 latency and SQL query counts of the events API. "
+        "Full scale is e.g. --users 100000 --events 1000000 --registrations 10000000."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--users", type=int, default=10_000, help="Users to seed")
+        parser.add_argument("--events", type=int, default=50_000, help="Events to seed")
+        parser.add_argument("--registrations", type=int, default=200_000, help="Registrations to seed")
+        parser.add_argument("--skip-seed", action="store_true", help="Benchmark the data already in the database")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per bulk INSERT while seeding")
+        parser.add_argument("--iterations", type=int, default=200, help="Measured requests per endpoint")
+        parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per endpoint")
+        parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS))
+        parser.add_argument(
+            "--cold-cache", action="store_true", help="Invalidate the response cache before each request"
+        )
+        parser.add_argument("--with-emails", action="store_true", help="Queue registration emails through Celery")
+        parser.add_argument("--random-seed", type=int, default=0)
+        parser.add_argument("--output", default="benchmark-results.json", help="JSON report path")
+
+    def handle(self, *args, **options) -> None:
+        random.seed(options["random_seed"])
+        if not options["skip_seed"]:
+            self.seed(options["users"], options["events"], options["registrations"], options["batch_size"])
+        event_ids = sample_ids(Event, 200)
+        user_ids = sample_ids(User, 200)
+        if not event_ids or not user_ids:
+            self.stderr.write(self.style.ERROR("Nothing to benchmark: seed users and events first."))
+            return
+        client = self.get_client()
+        operations = self.build_operations(client, event_ids, user_ids)
+        before_each = (lambda i: bump_events_generation()) if options["cold_cache"] else None
+
+        results: list[BenchmarkResult] = []
+        with ExitStack() as stack:
+            stack.enter_context(
+                override_settings(
+                    ALLOWED_HOSTS=["testserver"],
+                    DEBUG=False,
+                    DEBUG_TOOLBAR_CONFIG={"SHOW_TOOLBAR_CALLBACK": lambda request: False},
+                )
+            )
+            if not options["with_emails"]:
+                stack.enter_context(patch("apps.events.services.registration.queue_registration_emails"))
+            for name in options["endpoints"]:
+                self.stdout.write(f"Benchmarking {name}...")
+                results.append(
+                    measure(
+                        name,
+                        operations[name],
+                        iterations=options["iterations"],
+                        warmup=options["warmup"] if name not in ("register", "unregister") else 0,
+                        before_each=before_each,
+                    )
+                )
+
+        report = write_results(
+            options["output"],
+            results,
+            dataset={
+                "users": User.objects.count(),
+                "events": Event.objects.count(),
+                "registrations": EventRegistration.objects.count(),
+            },
+            iterations=options["iterations"],
+            cold_cache=options["cold_cache"],
+        )
+        for name, summary in report["results"].items():
+            latency = summary["latency_ms"]
+            self.stdout.write(
+                f"{name:<13} {summary['throughput_rps']:>9.1f} req/s  p50 {latency['p50']:>8.2f} ms  "
+                f"p99 {latency['p99']:>8.2f} ms  queries {summary['queries']['median']}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def seed(self, users: int, events: int, registrations: int, batch_size: int) -> None:
+        started = time.perf_counter()
+        prefix = f"bench{int(time.time())}_"
+        self.stdout.write(f"Seeding {users} users...")
+        user_ids = UserFactory.create_bulk(
+            users, batch_size=batch_size, username=factory.Sequence(lambda n: f"{prefix}{n}")
+        )
+        self.stdout.write(f"Seeding {events} events...")
+        event_ids = EventFactory.create_bulk(events, user_ids, batch_size=batch_size)
+        self.stdout.write(f"Seeding {registrations} registrations...")
+        EventRegistrationFactory.create_bulk(registrations, event_ids, user_ids, batch_size=batch_size * 2)
+        self.stdout.write(self.style.SUCCESS(f"Seeded in {time.perf_counter() - started:.1f}s"))
+
+    @staticmethod
+    def get_client() -> APIClient:
+        user, _ = User.objects.get_or_create(username="benchmark_client", defaults={"email": "bench@example.com"})
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+        return client
+
+    @staticmethod
+    def build_operations(client: APIClient, event_ids: list[int], user_ids: list[int]) -> dict:
+        list_url = reverse("events:events-list")
+        total_events = Event.objects.count()
+        words = [
+            word
+            for location in Event.objects.filter(pk__in=event_ids).values_list("location", flat=True)
+            for word in location.split()
+        ] or ["event"]
+        registered: list[tuple[int, list[int]]] = []
+
+        def register(i: int):
+            event_id = event_ids[i % len(event_ids)]
+            participant_ids = random.sample(user_ids, k=min(10, len(user_ids)))
+            registered.append((event_id, participant_ids))
+            url = reverse("events:events-register", args=[event_id])
+            return client.post(url, {"participant_ids": participant_ids}, format="json")
+
+        def unregister(i: int):
+            event_id, participant_ids = registered[i % len(registered)] if registered else (event_ids[0], user_ids[:1])
+            url = reverse("events:events-unregister", args=[event_id])
+            return client.post(url, {"participant_ids": participant_ids}, format="json")
+
+        return {
+            "list": lambda i: client.get(
+                list_url, {"offset": random.randint(0, max(0, min(total_events, 10_000) - 25))}
+            ),
+            "search": lambda i: client.get(list_url, {"search": random.choice(words)}),
+            "retrieve": lambda i: client.get(reverse("events:events-detail", args=[random.choice(event_ids)])),
+            "participants": lambda i: client.get(
+                reverse("events:events-participants", args=[random.choice(event_ids)])
+            ),
+            "register": register,
+            "unregister": unregister,
+        }
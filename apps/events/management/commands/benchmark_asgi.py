@@ -0,0 +1,96 @@
+import random
+import urllib.error
+import urllib.request
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.events.benchmarking import BenchmarkResult, measure_concurrent, sample_ids, write_results
+from apps.events.models import Event
+
+
+User = get_user_model()
+
+ENDPOINTS = ("list", "retrieve", "participants", "users")
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the synchronous (WSGI) endpoints and their async (ASGI) twins under /api/async/ over HTTP with the "
+        "same concurrent client and compare throughput and p50/p99 latency. Start both servers first, e.g. "
+        "`docker compose up web web-asgi`."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--wsgi-url", default="http://localhost:8000", help="Base URL of the WSGI server")
+        parser.add_argument("--asgi-url", default="http://localhost:8001", help="Base URL of the ASGI server")
+        parser.add_argument("--requests", type=int, default=500, help="Measured requests per endpoint and server")
+        parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight at once")
+        parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS))
+        parser.add_argument("--cold-cache", action="store_true", help="Make every request miss the response cache")
+        parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+        parser.add_argument("--random-seed", type=int, default=0)
+        parser.add_argument("--output", default="benchmark-asgi-results.json", help="JSON report path")
+
+    def handle(self, *args, **options) -> None:
+        random.seed(options["random_seed"])
+        event_ids = sample_ids(Event, 200)
+        user_ids = sample_ids(User, 200)
+        if not event_ids or not user_ids:
+            self.stderr.write(self.style.ERROR("Nothing to benchmark: seed users and events first."))
+            return
+        user, _ = User.objects.get_or_create(username="benchmark_client", defaults={"email": "bench@example.com"})
+        headers = {"Authorization": f"Bearer {RefreshToken.for_user(user).access_token}", "Accept": "application/json"}
+        total_events = Event.objects.count()
+        paths = {
+            "list": lambda: f"events/?limit=25&offset={random.randint(0, max(0, min(total_events, 10_000) - 25))}",
+            "retrieve": lambda: f"events/{random.choice(event_ids)}/",
+            "participants": lambda: f"events/{random.choice(event_ids)}/participants/",
+            "users": lambda: f"users/all/{random.choice(user_ids)}/",
+        }
+
+        servers = (("wsgi", f"{options['wsgi_url']}/api/"), ("asgi", f"{options['asgi_url']}/api/async/"))
+        results: list[BenchmarkResult] = []
+        for name in options["endpoints"]:
+            for server, prefix in servers:
+                self.stdout.write(f"Benchmarking {server}:{name}...")
+
+                def operation(i: int, prefix=prefix, build_path=paths[name]) -> int:
+                    url = prefix + build_path()
+                    if options["cold_cache"]:
+                        url += f"{'&' if '?' in url else '?'}nocache={random.random()}"
+                    return self.fetch(url, headers, options["timeout"])
+
+                result = measure_concurrent(
+                    f"{server}:{name}", operation, iterations=options["requests"], concurrency=options["concurrency"]
+                )
+                results.append(result)
+
+        report = write_results(
+            options["output"],
+            results,
+            wsgi_url=options["wsgi_url"],
+            asgi_url=options["asgi_url"],
+            requests=options["requests"],
+            concurrency=options["concurrency"],
+            cold_cache=options["cold_cache"],
+        )
+        for name, summary in report["results"].items():
+            latency = summary["latency_ms"]
+            self.stdout.write(
+                f"{name:<18} {summary['throughput_rps']:>9.1f} req/s  p50 {latency['p50']:>8.2f} ms  "
+                f"p99 {latency['p99']:>8.2f} ms  statuses {summary['statuses']}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    @staticmethod
+    def fetch(url: str, headers: dict, timeout: float) -> int:
+        """Returns the response status, or 0 when the server could not be reached."""
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as exc:
+            return exc.code
+        except (urllib.error.URLError, TimeoutError):
+            return 0
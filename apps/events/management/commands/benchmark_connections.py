@@ -0,0 +1,94 @@
+import copy
+from django.core.management.base import BaseCommand
+from django.db import connections
+from apps.events.benchmarking import measure, write_results
+
+
+MODES = {
+    # Django's default before this setting existed: connect on the first query, close when the request ends
+    "per-request": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+    "persistent": {"CONN_MAX_AGE": None, "CONN_HEALTH_CHECKS": True},
+    "pooled": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": True, "pool": {"min_size": 1, "max_size": 2}},
+}
+
+
+def pool_available() -> bool:
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the database side of a request under each connection mode: the connection is prepared as on "
+        "request_started, one query runs, and it is released as on request_finished. Reports latency and how "
+        "many server connections (distinct backend pids) were opened."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--modes", nargs="+", choices=tuple(MODES), default=list(MODES))
+        parser.add_argument("--iterations", type=int, default=500)
+        parser.add_argument("--warmup", type=int, default=10)
+        parser.add_argument("--output", default="benchmark-connections-results.json", help="JSON report path")
+
+    def handle(self, *args, **options) -> None:
+        results = []
+        backend_connections = {}
+        for mode in options["modes"]:
+            if mode == "pooled" and not pool_available():
+                self.stderr.write(self.style.WARNING("Skipping pooled: psycopg_pool is not installed."))
+                continue
+            self.stdout.write(f"Benchmarking {mode}...")
+            alias = f"benchmark_{mode}"
+            connections.settings[alias] = self.settings_for(mode)
+            wrapper = connections[alias]
+            pids: set[int] = set()
+
+            def request_cycle(i: int, wrapper=wrapper, pids=pids) -> None:
+                wrapper.close_if_unusable_or_obsolete()
+                with wrapper.cursor() as cursor:
+                    cursor.execute("SELECT pg_backend_pid()")
+                    pids.add(cursor.fetchone()[0])
+                wrapper.close_if_unusable_or_obsolete()
+
+            try:
+                results.append(
+                    measure(
+                        mode,
+                        request_cycle,
+                        iterations=options["iterations"],
+                        warmup=options["warmup"],
+                        count_queries=False,
+                    )
+                )
+            finally:
+                wrapper.close()
+                if mode == "pooled":
+                    wrapper.close_pool()
+                del connections[alias]
+                del connections.settings[alias]
+            backend_connections[mode] = len(pids)
+
+        report = write_results(
+            options["output"], results, iterations=options["iterations"], backend_connections=backend_connections
+        )
+        for name, summary in report["results"].items():
+            latency = summary["latency_ms"]
+            self.stdout.write(
+                f"{name:<12} p50 {latency['p50']:>8.3f} ms  p99 {latency['p99']:>8.3f} ms  "
+                f"{backend_connections[name]} server connection(s)"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    @staticmethod
+    def settings_for(mode: str) -> dict:
+        settings_dict = copy.deepcopy(connections["default"].settings_dict)
+        options = MODES[mode]
+        settings_dict["OPTIONS"].pop("pool", None)
+        if "pool" in options:
+            settings_dict["OPTIONS"]["pool"] = options["pool"]
+        settings_dict["CONN_MAX_AGE"] = options["CONN_MAX_AGE"]
+        settings_dict["CONN_HEALTH_CHECKS"] = options["CONN_HEALTH_CHECKS"]
+        return settings_dict
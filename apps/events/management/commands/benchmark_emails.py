@@ -0,0 +1,94 @@
+from collections.abc import Callable
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.events.benchmarking import measure, write_results
+from apps.events.models import Event
+from apps.events.services.mail import get_event_email, render_event_email
+from apps.events.services.registration_email import REGISTRATION_EMAIL_TEMPLATE
+
+
+User = get_user_model()
+
+
+def build_fstring_message(user: User, event: Event) -> EmailMessage:
+    # how confirmation emails were built before the templates: everything formatted again for every recipient
+    event_dt = timezone.localtime(event.date) if timezone.is_aware(event.date) else event.date
+    return EmailMessage(
+        f"Registration confirmed: {event.title}",
+        (
+            f"Hi {user.get_username()},\n\n"
+            f"You are registered for '{event.title}' on {event_dt:%Y-%m-%d %H:%M} at {event.location}.\n"
+            f"Organizer: {event.organizer.get_username()}\n"
+        ),
+        getattr(settings, "DEFAULT_FROM_EMAIL", None),
+        [user.email],
+    )
+
+
+def build_uncached_message(user: User, event: Event) -> EmailMessage:
+    rendered = render_event_email.__wrapped__(
+        REGISTRATION_EMAIL_TEMPLATE,
+        event.title,
+        event.date,
+        event.location,
+        event.organizer.get_username(),
+        timezone.get_current_timezone_name(),
+    )
+    return rendered.message_for(user)
+
+
+def build_cached_message(user: User, event: Event) -> EmailMessage:
+    return get_event_email(REGISTRATION_EMAIL_TEMPLATE, event).message_for(user)
+
+
+class Command(BaseCommand):
+    help = (
+        "Times building registration confirmation messages for one event: the former per-recipient f-strings, the "
+        "templates rendered for every recipient, and the cached per-event rendering with only the greeting filled "
+        "in. Nothing is sent; recipients are unsaved users."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--iterations", type=int, default=100_000, help="Messages built per variant")
+        parser.add_argument("--warmup", type=int, default=1000)
+        parser.add_argument("--recipients", type=int, default=1000, help="Distinct recipients, reused in turn")
+        parser.add_argument("--output", default="benchmark-emails-results.json", help="JSON report path")
+
+    def handle(self, *args, **options) -> None:
+        event = Event.objects.select_related("organizer").order_by("id").first()
+        if event is None:
+            self.stderr.write(self.style.ERROR("Nothing to benchmark: seed events first."))
+            return
+        users = [
+            User(username=f"recipient{i}", email=f"recipient{i}@example.com") for i in range(options["recipients"])
+        ]
+        variants: dict[str, Callable[[User, Event], EmailMessage]] = {
+            "f-string": build_fstring_message,
+            "templates": build_uncached_message,
+            "cached": build_cached_message,
+        }
+
+        results = []
+        for name, build in variants.items():
+            self.stdout.write(f"Benchmarking {name}...")
+            results.append(
+                measure(
+                    name,
+                    lambda i, build=build: build(users[i % len(users)], event),
+                    iterations=options["iterations"],
+                    warmup=options["warmup"],
+                    count_queries=False,
+                )
+            )
+
+        report = write_results(options["output"], results, iterations=options["iterations"])
+        for name, summary in report["results"].items():
+            latency = summary["latency_ms"]
+            self.stdout.write(
+                f"{name:<10} {summary['throughput_rps']:>12.0f} messages/s  p50 {latency['p50'] * 1000:>8.1f} us  "
+                f"p99 {latency['p99'] * 1000:>8.1f} us"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
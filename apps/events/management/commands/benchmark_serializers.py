@@ -0,0 +1,68 @@
+from collections.abc import Callable
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from apps.events.benchmarking import measure, write_results
+from apps.events.models import Event
+from apps.events.serializers import EventSerializer
+from event_management.renderers import ORJSONRenderer
+from event_management.serializers import CompiledListSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Micro-benchmark of the event list response body: DRF's ListSerializer and JSONRenderer against the "
+        "compiled list serializer, alone and with the orjson renderer. Events are loaded once, so only "
+        "serialization and rendering are timed. Outputs are checked to be byte-identical first."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--rows", type=int, default=25, help="Events per serialized page")
+        parser.add_argument("--iterations", type=int, default=2000)
+        parser.add_argument("--warmup", type=int, default=100)
+        parser.add_argument("--output", default="benchmark-serializers-results.json", help="JSON report path")
+
+    def handle(self, *args, **options) -> None:
+        events = list(Event.objects.select_related("organizer").order_by("id")[: options["rows"]])
+        if not events:
+            self.stderr.write(self.style.ERROR("Nothing to benchmark: seed events first."))
+            return
+
+        def drf_list(instances: list[Event]) -> list:
+            return serializers.ListSerializer(instances, child=EventSerializer()).data
+
+        def compiled_list(instances: list[Event]) -> list:
+            return CompiledListSerializer(instances, child=EventSerializer()).data
+
+        variants: dict[str, tuple[Callable, JSONRenderer]] = {
+            "drf": (drf_list, JSONRenderer()),
+            "compiled": (compiled_list, JSONRenderer()),
+            "compiled+orjson": (compiled_list, ORJSONRenderer()),
+        }
+        expected = JSONRenderer().render(drf_list(events))
+        for name, (serialize, renderer) in variants.items():
+            if renderer.render(serialize(events)) != expected:
+                raise CommandError(f"{name} output differs from DRF's")
+
+        results = []
+        for name, (serialize, renderer) in variants.items():
+            self.stdout.write(f"Benchmarking {name}...")
+            results.append(
+                measure(
+                    name,
+                    lambda i, serialize=serialize, renderer=renderer: renderer.render(serialize(events)),
+                    iterations=options["iterations"],
+                    warmup=options["warmup"],
+                    count_queries=False,
+                )
+            )
+
+        report = write_results(options["output"], results, rows=len(events), iterations=options["iterations"])
+        baseline = report["results"]["drf"]["latency_ms"]["mean"]
+        for name, summary in report["results"].items():
+            latency = summary["latency_ms"]
+            speedup = baseline / latency["mean"] if latency["mean"] else 0.0
+            self.stdout.write(
+                f"{name:<16} p50 {latency['p50']:>8.3f} ms  p99 {latency['p99']:>8.3f} ms  x{speedup:.2f} vs drf"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from apps.events.caching import bump_events_generation
+from apps.events.models import Event
+from apps.events.services.feed import refresh_upcoming_events
+from apps.events.services.participants import rebuild_participants_count
+
+
+class Command(BaseCommand):
+    help = "Recount Event.participants_count from registrations and fix drifted counters"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--event", type=int, action="append", dest="event_ids", help="Limit to these event ids")
+
+    def handle(self, *args, **options) -> None:
+        queryset = Event.objects.all()
+        if options["event_ids"]:
+            queryset = queryset.filter(pk__in=options["event_ids"])
+        fixed = rebuild_participants_count(queryset)
+        if fixed:
+            refresh_upcoming_events(options["event_ids"])
+            bump_events_generation()
+        self.stdout.write(self.style.SUCCESS(f"Participant counters fixed: {fixed}"))
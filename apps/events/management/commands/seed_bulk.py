@@ -0,0 +1,250 @@
+import io
+import random
+import time
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+from typing import Any
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Max, Model
+from django.utils import timezone
+from apps.events.caching import bump_events_generation
+from apps.events.models import Event, EventRegistration
+from apps.events.services.feed import refresh_upcoming_events
+from apps.events.services.search import update_search_vectors
+
+
+User = get_user_model()
+
+CITIES = (
+    "Kyiv", "Lviv", "Odesa", "Kharkiv", "Dnipro", "Warsaw", "Krakow", "Berlin", "Munich", "Prague", "Vienna",
+    "Budapest", "Paris", "Lyon", "Madrid", "Barcelona", "Lisbon", "Rome", "Milan", "Amsterdam", "London",
+    "Dublin", "Oslo", "Stockholm", "Helsinki", "Copenhagen", "New York", "Boston", "Chicago", "Toronto",
+)
+TOPICS = (
+    "Jazz", "Python", "Startup", "Design", "Data", "Cloud", "Chess", "Film", "Poetry", "Robotics", "Wine",
+    "Running", "Yoga", "Photography", "Security", "Music", "Cooking", "History", "Climate", "Gaming",
+)
+KINDS = ("Meetup", "Conference", "Workshop", "Night", "Festival", "Summit", "Hackathon", "Talk", "Fair", "Camp")
+
+USER_COLUMNS = (
+    "id", "password", "is_superuser", "username", "first_name", "last_name", "email", "is_staff", "is_active",
+    "date_joined",
+)
+EVENT_COLUMNS = (
+    "id", "title", "description", "date", "location", "organizer_id", "capacity", "participants_count", "created_at",
+    "updated_at",
+)
+REGISTRATION_COLUMNS = ("id", "event_id", "participant_id", "registered_at")
+
+
+def copy_escape(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def zipf_counts(total: int, size: int, exponent: float, cap: int) -> list[int]:
+    """Splits `total` over `size` buckets following a Zipf law, with no bucket above `cap`, in random order."""
+    weights = [1 / rank**exponent for rank in range(1, size + 1)]
+    counts = [0] * size
+    remaining = min(total, size * cap)
+    for _ in range(50):
+        open_buckets = [i for i in range(size) if counts[i] < cap]
+        if remaining <= 0 or not open_buckets:
+            break
+        scale = remaining / sum(weights[i] for i in open_buckets)
+        added = 0
+        for i in open_buckets:
+            extra = min(cap - counts[i], int(weights[i] * scale))
+            counts[i] += extra
+            added += extra
+        if not added:
+            for i in open_buckets[:remaining]:
+                counts[i] += 1
+                added += 1
+        remaining -= added
+    random.shuffle(counts)
+    return counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate large volumes of users, events and registrations with Postgres COPY. Registrations follow a Zipf "
+        "popularity distribution; indexes and constraints are rebuilt once after the load."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--users", type=int, default=100_000)
+        parser.add_argument("--events", type=int, default=1_000_000)
+        parser.add_argument("--registrations", type=int, default=10_000_000)
+        parser.add_argument("--zipf-exponent", type=float, default=1.1, help="Skew of event popularity")
+        parser.add_argument("--capacity-ratio", type=float, default=0.0, help="Share of events that get a capacity")
+        parser.add_argument("--chunk-size", type=int, default=100_000, help="Rows per in-memory COPY buffer")
+        parser.add_argument("--password", default="password123", help="Password shared by every generated user")
+        parser.add_argument("--keep-indexes", action="store_true", help="Load with indexes and constraints in place")
+        parser.add_argument("--random-seed", type=int, default=None)
+
+    def handle(self, *args, **options) -> None:
+        if options["random_seed"] is not None:
+            random.seed(options["random_seed"])
+        started = time.perf_counter()
+        tables = [model._meta.db_table for model in (User, Event, EventRegistration)]
+        with transaction.atomic(), connection.cursor() as cursor:
+            deferred = [] if options["keep_indexes"] else self.drop_indexes_and_constraints(cursor, tables)
+            first_user = self.next_id(User)
+            first_event = self.next_id(Event)
+            user_count = options["users"]
+            event_count = options["events"] if user_count else 0
+            counts = zipf_counts(options["registrations"], event_count, options["zipf_exponent"], user_count)
+
+            self.stdout.write(f"Copying {user_count} users...")
+            user_rows = self.user_rows(first_user, user_count, options["password"])
+            self.copy(cursor, User, USER_COLUMNS, user_rows, options["chunk_size"])
+            self.stdout.write(f"Copying {event_count} events...")
+            event_rows = self.event_rows(first_event, counts, first_user, user_count, options["capacity_ratio"])
+            self.copy(cursor, Event, EVENT_COLUMNS, event_rows, options["chunk_size"])
+            self.stdout.write(f"Copying {sum(counts)} registrations...")
+            first_registration = self.next_id(EventRegistration)
+            registration_rows = self.registration_rows(first_registration, first_event, counts, first_user, user_count)
+            self.copy(cursor, EventRegistration, REGISTRATION_COLUMNS, registration_rows, options["chunk_size"])
+
+            for table in tables:
+                cursor.execute(
+                    f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE((SELECT MAX(id) FROM {table}), 1))",
+                    [table],
+                )
+            if deferred:
+                self.stdout.write("Rebuilding indexes and constraints...")
+                for statement in deferred:
+                    cursor.execute(statement)
+            self.stdout.write("Building search documents...")
+            update_search_vectors(Event.objects.filter(pk__gte=first_event))
+            self.stdout.write("Refreshing the upcoming events feed...")
+            refresh_upcoming_events()
+            for table in tables:
+                cursor.execute(f"ANALYZE {table}")
+            transaction.on_commit(bump_events_generation)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {user_count} users, {event_count} events, {sum(counts)} registrations "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+        )
+
+    @staticmethod
+    def next_id(model: type[Model]) -> int:
+        return (model.objects.aggregate(last=Max("pk"))["last"] or 0) + 1
+
+    @staticmethod
+    def drop_indexes_and_constraints(cursor, tables: list[str]) -> list[str]:
+        """Drops secondary indexes, unique and foreign key constraints, returning the DDL that recreates them."""
+        quote = connection.ops.quote_name
+        foreign_keys: list[tuple[str, str, str]] = []
+        uniques: list[tuple[str, str, str]] = []
+        indexes: list[tuple[str, str]] = []
+        for table in tables:
+            cursor.execute(
+                "SELECT conname, pg_get_constraintdef(oid), contype FROM pg_constraint "
+                "WHERE conrelid = %s::regclass AND contype IN ('u', 'f')",
+                [table],
+            )
+            for name, definition, kind in cursor.fetchall():
+                (foreign_keys if kind == "f" else uniques).append((table, name, definition))
+            # indexes backing a constraint of this table go away with the constraint itself
+            cursor.execute(
+                "SELECT i.relname, pg_get_indexdef(x.indexrelid) FROM pg_index x "
+                "JOIN pg_class i ON i.oid = x.indexrelid "
+                "WHERE x.indrelid = %s::regclass AND NOT x.indisprimary AND NOT EXISTS ("
+                "SELECT 1 FROM pg_constraint c WHERE c.conrelid = x.indrelid AND c.conindid = x.indexrelid)",
+                [table],
+            )
+            indexes.extend(cursor.fetchall())
+        for table, name, _ in foreign_keys + uniques:
+            cursor.execute(f"ALTER TABLE {quote(table)} DROP CONSTRAINT {quote(name)}")
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {quote(name)}")
+        return [definition for _, definition in indexes] + [
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}"
+            for table, name, definition in uniques + foreign_keys
+        ]
+
+    @staticmethod
+    def copy(cursor, model: type[Model], columns: tuple[str, ...], rows: Iterable[tuple], chunk_size: int) -> None:
+        """Streams rows into COPY ... FROM STDIN (text format) through in-memory buffers of `chunk_size` rows."""
+        sql = f"COPY {connection.ops.quote_name(model._meta.db_table)} ({', '.join(columns)}) FROM STDIN"
+        buffer = io.StringIO()
+        pending = 0
+        for row in rows:
+            buffer.write("\t".join(copy_escape(value) for value in row))
+            buffer.write("\n")
+            pending += 1
+            if pending >= chunk_size:
+                Command.flush(cursor, sql, buffer)
+                buffer, pending = io.StringIO(), 0
+        if pending:
+            Command.flush(cursor, sql, buffer)
+
+    @staticmethod
+    def flush(cursor, sql: str, buffer: io.StringIO) -> None:
+        buffer.seek(0)
+        raw = cursor.cursor
+        if hasattr(raw, "copy_expert"):  # psycopg2
+            raw.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with raw.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+    @staticmethod
+    def user_rows(first_id: int, size: int, password: str) -> Iterator[tuple]:
+        hashed = make_password(password)
+        now = timezone.now()
+        for user_id in range(first_id, first_id + size):
+            username = f"seed_user_{user_id}"
+            first_name = random.choice(TOPICS)
+            yield (user_id, hashed, False, username, first_name, "", f"{username}@example.com", False, True, now)
+
+    @staticmethod
+    def event_rows(
+        first_id: int, counts: list[int], first_user: int, user_count: int, capacity_ratio: float
+    ) -> Iterator[tuple]:
+        now = timezone.now()
+        for offset, participants in enumerate(counts):
+            event_id = first_id + offset
+            topic, kind = random.choice(TOPICS), random.choice(KINDS)
+            city = random.choice(CITIES)
+            date = now + timedelta(minutes=random.randint(-30 * 24 * 60, 180 * 24 * 60))
+            created = now - timedelta(seconds=len(counts) - offset)
+            capacity = None
+            if capacity_ratio and random.random() < capacity_ratio:
+                capacity = participants + random.randint(0, 100)
+            yield (
+                event_id,
+                f"{topic} {kind} #{event_id}",
+                f"A {kind.lower()} about {topic.lower()} in {city}.",
+                date,
+                city,
+                first_user + random.randrange(user_count),
+                capacity,
+                participants,
+                created,
+                created,
+            )
+
+    @staticmethod
+    def registration_rows(
+        first_id: int, first_event: int, counts: list[int], first_user: int, user_count: int
+    ) -> Iterator[tuple]:
+        now = timezone.now()
+        registration_id = first_id
+        users = range(first_user, first_user + user_count)
+        for offset, participants in enumerate(counts):
+            for participant_id in random.sample(users, participants):
+                yield (registration_id, first_event + offset, participant_id, now)
+                registration_id += 1
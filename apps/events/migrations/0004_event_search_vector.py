@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-18 18:53
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+from django.db.models import CharField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_search_vector(apps, schema_editor) -> None:
+    # the search document as defined when this migration was written, built from historical models only
+    Event = apps.get_model("events", "Event")
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    SearchVector = django.contrib.postgres.search.SearchVector
+    vector = SearchVector("title", weight="A", config="simple")
+    vector += SearchVector("location", weight="B", config="simple")
+    vector += SearchVector("description", weight="C", config="simple")
+    for field in ("username", "first_name", "last_name"):
+        organizer_value = Coalesce(
+            Subquery(User.objects.filter(pk=OuterRef("organizer_id")).values(field)[:1]),
+            Value(""),
+            output_field=CharField(),
+        )
+        vector += SearchVector(organizer_value, weight="B", config="simple")
+    Event.objects.update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_keyset_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search Document'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='event_search_vector_idx'),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-18 18:53
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_participants_count(apps, schema_editor) -> None:
+    Event = apps.get_model("events", "Event")
+    EventRegistration = apps.get_model("events", "EventRegistration")
+    counts = (
+        EventRegistration.objects.filter(event=OuterRef("pk"))
+        .order_by()
+        .values("event")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Event.objects.update(participants_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_event_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='capacity',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Event Capacity'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='participants_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Participants Count'),
+        ),
+        migrations.RunPython(populate_participants_count, migrations.RunPython.noop),
+    ]
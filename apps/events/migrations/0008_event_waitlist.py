@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-18 19:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_date_location_filters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='waitlist_enabled',
+            field=models.BooleanField(db_default=False, default=False, verbose_name='Waitlist Enabled'),
+        ),
+        migrations.CreateModel(
+            name='EventWaitlistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('joined_at', models.DateTimeField(auto_now_add=True, verbose_name='Waitlist Join Date and Time')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist_entries', to='events.event', verbose_name='Event')),
+                ('participant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='event_waitlist_entries', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'ordering': ('id',),
+                'indexes': [models.Index(fields=['event', 'id'], name='eventwait_event_order_idx')],
+                'constraints': [models.UniqueConstraint(fields=('event', 'participant'), name='unique_event_waitlist_participant')],
+            },
+        ),
+    ]
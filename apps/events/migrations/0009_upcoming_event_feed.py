@@ -0,0 +1,61 @@
+# Generated by Django 6.0 on 2026-10-18 20:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+# frozen copy of the feed refresh as of this migration, so later changes to apps.events.services.feed cannot break it
+POPULATE_SQL = """
+INSERT INTO {feed_table} (
+    event_id, date, title, location, organizer_id, organizer_username, organizer_email, capacity, participants_count
+)
+SELECT e.id, e.date, e.title, e.location, e.organizer_id, u.username, u.email, e.capacity, e.participants_count
+FROM {event_table} e JOIN {user_table} u ON u.id = e.organizer_id
+WHERE e.date >= %(now)s
+"""
+
+
+def populate_upcoming_events(apps, schema_editor) -> None:
+    Event = apps.get_model("events", "Event")
+    UpcomingEvent = apps.get_model("events", "UpcomingEvent")
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    quote = schema_editor.connection.ops.quote_name
+    sql = POPULATE_SQL.format(
+        feed_table=quote(UpcomingEvent._meta.db_table),
+        event_table=quote(Event._meta.db_table),
+        user_table=quote(User._meta.db_table),
+    )
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(sql, {"now": timezone.now()})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_event_waitlist'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UpcomingEvent',
+            fields=[
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='upcoming_entry', serialize=False, to='events.event', verbose_name='Event')),
+                ('date', models.DateTimeField(verbose_name='Event Date and Time')),
+                ('title', models.CharField(max_length=255, verbose_name='Event Title')),
+                ('location', models.CharField(max_length=255, verbose_name='Event Location')),
+                ('organizer_username', models.CharField(max_length=150, verbose_name='Organizer Username')),
+                ('organizer_email', models.EmailField(blank=True, max_length=254, verbose_name='Organizer Email')),
+                ('capacity', models.PositiveIntegerField(blank=True, null=True, verbose_name='Event Capacity')),
+                ('participants_count', models.PositiveIntegerField(default=0, verbose_name='Participants Count')),
+                ('organizer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Organizer')),
+            ],
+            options={
+                'ordering': ('date', 'event'),
+                'indexes': [models.Index(fields=['date', 'event'], name='upcoming_date_event_idx')],
+            },
+        ),
+        migrations.RunPython(populate_upcoming_events, migrations.RunPython.noop),
+    ]
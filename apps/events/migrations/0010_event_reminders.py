@@ -0,0 +1,37 @@
+# Generated by Django 6.0 on 2026-10-18 21:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_upcoming_event_feed'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='reminders_queued_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Reminder Emails Queued Date and Time'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('reminders_queued_at__isnull', True)), fields=['date'], name='event_reminder_due_idx'),
+        ),
+        migrations.CreateModel(
+            name='EventReminderDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Reminder Sent Date and Time')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminder_deliveries', to='events.event', verbose_name='Event')),
+                ('participant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='event_reminder_deliveries', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('event', 'participant'), name='unique_event_reminder_participant')],
+            },
+        ),
+    ]
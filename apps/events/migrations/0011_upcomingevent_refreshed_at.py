@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-18 23:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_event_reminders'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='upcomingevent',
+            name='refreshed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Refreshed At'),
+        ),
+    ]
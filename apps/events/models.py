@@ -1,5 +1,9 @@
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Lower, Trim
+from django.utils import timezone
 
 
 User = get_user_model()
@@ -15,9 +19,34 @@ class Event(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Event Creation Date and Time")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Event Last Update Date and Time")
+    capacity = models.PositiveIntegerField(null=True, blank=True, verbose_name="Event Capacity")
+    # bulk loaders (COPY) skip this column, so the database supplies the default too
+    waitlist_enabled = models.BooleanField(default=False, db_default=False, verbose_name="Waitlist Enabled")
+    participants_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="Participants Count")
+    search_vector = SearchVectorField(null=True, editable=False, verbose_name="Search Document")
+    reminders_queued_at = models.DateTimeField(
+        null=True, blank=True, editable=False, verbose_name="Reminder Emails Queued Date and Time"
+    )
+    location_normalized = models.GeneratedField(
+        expression=Lower(Trim("location")),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
+        verbose_name="Normalized Location",
+    )
 
     class Meta:
         ordering = ("created_at",)
+        indexes = [
+            models.Index(fields=("created_at", "id"), name="event_created_at_id_idx"),
+            models.Index(fields=("organizer", "date", "id"), name="event_organizer_date_idx"),
+            models.Index(fields=("date", "id"), name="event_date_id_idx"),
+            models.Index(fields=("location_normalized", "date"), name="event_location_date_idx"),
+            # only events still waiting for their reminders, so the scheduler's scan stays small
+            models.Index(
+                fields=("date",), condition=models.Q(reminders_queued_at__isnull=True), name="event_reminder_due_idx"
+            ),
+            GinIndex(fields=("search_vector",), name="event_search_vector_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} @ {self.location} on {self.date:%Y-%m-%d %H:%M}"
@@ -32,7 +61,77 @@ class EventRegistration(models.Model):
 
     class Meta:
         constraints = [models.UniqueConstraint(fields=("event", "participant"), name="unique_event_participant")]
+        indexes = [
+            models.Index(fields=("event", "registered_at", "id"), name="eventreg_event_registered_idx"),
+            models.Index(fields=("participant", "registered_at", "id"), name="eventreg_participant_reg_idx"),
+        ]
         ordering = ["-registered_at"]
 
     def __str__(self) -> str:
         return f"{self.participant} -> {self.event}"
+
+
+class EventWaitlistEntry(models.Model):
+    """A user waiting for a seat of a full event; entries are promoted in `id` (arrival) order."""
+
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="waitlist_entries", verbose_name="Event")
+    participant = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="event_waitlist_entries", verbose_name="User"
+    )
+    joined_at = models.DateTimeField(auto_now_add=True, verbose_name="Waitlist Join Date and Time")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=("event", "participant"), name="unique_event_waitlist_participant")
+        ]
+        indexes = [models.Index(fields=("event", "id"), name="eventwait_event_order_idx")]
+        ordering = ("id",)
+
+    def __str__(self) -> str:
+        return f"{self.participant} waiting for {self.event}"
+
+
+class EventReminderDelivery(models.Model):
+    """Reminder email of one registrant; `sent_at` stays empty until the SMTP server accepted the message."""
+
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="reminder_deliveries", verbose_name="Event")
+    participant = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="event_reminder_deliveries", verbose_name="User"
+    )
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="Reminder Sent Date and Time")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=("event", "participant"), name="unique_event_reminder_participant")
+        ]
+
+    def __str__(self) -> str:
+        return f"Reminder of {self.event} for {self.participant}"
+
+
+class UpcomingEvent(models.Model):
+    """
+    Feed row of an event that has not started yet, with its organizer summary and participant count copied in,
+    so the upcoming-events page is one range scan of `(date, event)`. Maintained by apps.events.services.feed.
+    """
+
+    event = models.OneToOneField(
+        Event, on_delete=models.CASCADE, primary_key=True, related_name="upcoming_entry", verbose_name="Event"
+    )
+    date = models.DateTimeField(verbose_name="Event Date and Time")
+    title = models.CharField(max_length=255, verbose_name="Event Title")
+    location = models.CharField(max_length=255, verbose_name="Event Location")
+    organizer = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+", verbose_name="Organizer")
+    organizer_username = models.CharField(max_length=150, verbose_name="Organizer Username")
+    organizer_email = models.EmailField(blank=True, verbose_name="Organizer Email")
+    capacity = models.PositiveIntegerField(null=True, blank=True, verbose_name="Event Capacity")
+    participants_count = models.PositiveIntegerField(default=0, verbose_name="Participants Count")
+    # start of the statement that last wrote the row; refreshes reading an older snapshot leave it alone
+    refreshed_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="Refreshed At")
+
+    class Meta:
+        ordering = ("date", "event")
+        indexes = [models.Index(fields=("date", "event"), name="upcoming_date_event_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.title} on {self.date:%Y-%m-%d %H:%M}"
@@ -0,0 +1,177 @@
+import base64
+import binascii
+import json
+from typing import Any
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+PAGINATION_MODE_QUERY_PARAM = "pagination"
+KEYSET_PAGINATION_MODE = "cursor"
+
+
+def is_keyset_requested(request: Request | None) -> bool:
+    if request is None:
+        return False
+    params = request.query_params
+    return (
+        params.get(PAGINATION_MODE_QUERY_PARAM) == KEYSET_PAGINATION_MODE
+        or KeysetPagination.cursor_query_param in params
+    )
+
+
+class KnownCountLimitOffsetPagination(LimitOffsetPagination):
+    """Limit/offset pagination that uses a count supplied by the view (e.g. a counter column) instead of COUNT(*)."""
+
+    known_count: int | None = None
+
+    def get_count(self, queryset) -> int:
+        if self.known_count is not None:
+            return self.known_count
+        return super().get_count(queryset)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset pagination over a unique ordering. The cursor is an opaque
+    token holding the ordering values of the last row, and no COUNT(*) is issued.
+    """
+
+    ordering: tuple[str, ...] = ("created_at", "id")
+    cursor_query_param = "cursor"
+    page_size_query_param = "limit"
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 1000
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> list[Model]:
+        return self.get_page(list(self.get_page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request) -> list[Model]:
+        return self.get_page([obj async for obj in self.get_page_queryset(queryset, request)])
+
+    def get_page_queryset(self, queryset: QuerySet, request: Request) -> QuerySet:
+        self.request = request
+        self.limit = self.get_limit(request)
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.build_keyset_filter(position))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+        return queryset[: self.limit + 1]
+
+    def get_page(self, rows: list[Model]) -> list[Model]:
+        page = rows[: self.limit]
+        self.next_position = self.get_position(page[-1]) if len(rows) > self.limit else None
+        return page
+
+    def get_paginated_response(self, data: list) -> Response:
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data: list) -> dict:
+        return {"next": self.get_next_link(), "results": data}
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> list[dict]:
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    def get_limit(self, request: Request) -> int:
+        try:
+            limit = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if limit <= 0:
+            return self.page_size
+        return min(limit, self.max_page_size)
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, PAGINATION_MODE_QUERY_PARAM, KEYSET_PAGINATION_MODE)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_position(self, obj: Model) -> list[Any]:
+        position = []
+        for field in self.ordering:
+            value = obj
+            for attr in field.lstrip("-").split("__"):
+                value = getattr(value, attr)
+            position.append(value.isoformat() if hasattr(value, "isoformat") else value)
+        return position
+
+    def build_keyset_filter(self, position: list[Any]) -> Q:
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            equal = {prev.lstrip("-"): value for prev, value in zip(self.ordering[:index], position[:index])}
+            condition |= Q(**equal, **{f"{name}__{lookup}": position[index]})
+        return condition
+
+    def encode_cursor(self, position: list[Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, request: Request) -> list[Any] | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+
+class EventKeysetPagination(KeysetPagination):
+    ordering = ("created_at", "id")
+
+
+class RegistrationKeysetPagination(KeysetPagination):
+    ordering = ("registered_at", "id")
+
+
+class EventDateKeysetPagination(KeysetPagination):
+    ordering = ("date", "id")
+
+
+class RecentRegistrationKeysetPagination(KeysetPagination):
+    ordering = ("-registered_at", "-id")
+
+
+class UpcomingEventKeysetPagination(KeysetPagination):
+    ordering = ("date", "event_id")
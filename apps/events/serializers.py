@@ -1,10 +1,18 @@
+from typing import Any
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from apps.events.models import Event
-from apps.users.models import User
+from rest_framework.utils import html
+from apps.events.models import Event, EventRegistration, UpcomingEvent
+from apps.events.services.export import EXPORT_FORMATS
+from apps.events.services.reminders import reset_reminders
+from apps.events.services.registration import find_existing_user_ids
 from apps.users.serializers import UserShortSerializer
+from event_management.serializers import CompiledListSerializer, MeasuredDataMixin
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(MeasuredDataMixin, serializers.ModelSerializer):
     organizer = UserShortSerializer(read_only=True)
 
     class Meta:
@@ -16,22 +24,171 @@ class EventSerializer(serializers.ModelSerializer):
             "date",
             "location",
             "organizer",
+            "capacity",
+            "waitlist_enabled",
+            "participants_count",
             "created_at",
             "updated_at",
         )
-        read_only_fields = ("id", "organizer", "created_at", "updated_at")
+        read_only_fields = ("id", "organizer", "participants_count", "created_at", "updated_at")
+        list_serializer_class = CompiledListSerializer
+
+    def validate(self, attrs: dict) -> dict:
+        # checked here rather than in `validate_capacity`: it depends on `waitlist_enabled`, which may change in the
+        # same request, and bulk updates validate items with `run_validation` on one shared instance
+        capacity = attrs.get("capacity")
+        if self.instance is not None and capacity is not None and capacity < self.instance.participants_count:
+            if not attrs.get("waitlist_enabled", self.instance.waitlist_enabled):
+                raise serializers.ValidationError(
+                    {"capacity": [_("Ensure this value is at least the current participants count.")]}
+                )
+        return attrs
+
+    def update(self, instance: Event, validated_data: dict) -> Event:
+        rescheduled = "date" in validated_data and validated_data["date"] != instance.date
+        event = super().update(instance, validated_data)
+        if rescheduled:
+            reset_reminders([event.pk])
+        return event
+
+
+class UpcomingOrganizerSerializer(serializers.Serializer):
+    id = serializers.IntegerField(source="organizer_id", read_only=True)
+    username = serializers.CharField(source="organizer_username", read_only=True)
+    email = serializers.EmailField(source="organizer_email", read_only=True)
+
+
+class UpcomingEventSerializer(MeasuredDataMixin, serializers.ModelSerializer):
+    """A feed row shaped like the matching fields of `EventSerializer`."""
+
+    id = serializers.IntegerField(source="event_id", read_only=True)
+    organizer = UpcomingOrganizerSerializer(source="*", read_only=True)
+
+    class Meta:
+        model = UpcomingEvent
+        fields = ("id", "title", "date", "location", "organizer", "capacity", "participants_count")
+        read_only_fields = fields
+        list_serializer_class = CompiledListSerializer
+
+
+class ParticipantSerializer(MeasuredDataMixin, serializers.ModelSerializer):
+    id = serializers.IntegerField(source="participant.id", read_only=True)
+    username = serializers.CharField(source="participant.username", read_only=True)
+    email = serializers.EmailField(source="participant.email", read_only=True)
+
+    class Meta:
+        model = EventRegistration
+        fields = ("id", "username", "email", "registered_at")
+        read_only_fields = fields
+        list_serializer_class = CompiledListSerializer
+
+
+class MyRegistrationSerializer(MeasuredDataMixin, serializers.ModelSerializer):
+    event = EventSerializer(read_only=True)
+
+    class Meta:
+        model = EventRegistration
+        fields = ("id", "registered_at", "event")
+        read_only_fields = fields
+        list_serializer_class = CompiledListSerializer
+
+
+class ParticipantsQuerySerializer(serializers.Serializer):
+    ids_only = serializers.BooleanField(default=False)
+
+
+BIGINT_MAX = 2**63 - 1
+
+
+@extend_schema_field({"type": "array", "items": {"type": "integer", "minimum": 1}})
+class ParticipantIdsField(serializers.Field):
+    """
+    List of user ids checked in one pass, instead of one `IntegerField` validation run per element as with
+    `ListField(child=IntegerField())`. Integers and digit strings are accepted; the validated value is the
+    sorted ids without duplicates.
+    """
+
+    default_error_messages = {
+        "not_a_list": _('Expected a list of ids but got type "{input_type}".'),
+        "empty": _("This list may not be empty."),
+        "max_length": _("Ensure this field has no more than {max_length} ids."),
+        "invalid": _("Ids must be positive integers; invalid values at positions {positions}."),
+    }
+
+    def __init__(self, max_length: int | None = None, **kwargs) -> None:
+        self.max_length = max_length
+        super().__init__(**kwargs)
+
+    def get_value(self, dictionary: Any) -> Any:
+        if html.is_html_input(dictionary) and self.field_name in dictionary:
+            return dictionary.getlist(self.field_name)
+        return super().get_value(dictionary)
+
+    def to_internal_value(self, data: Any) -> list[int]:
+        if not isinstance(data, list):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not data:
+            self.fail("empty")
+        max_length = self.max_length or getattr(settings, "EVENTS_PARTICIPANTS_MAX_IDS", 50_000)
+        if len(data) > max_length:
+            self.fail("max_length", max_length=max_length)
+        ids = set()
+        invalid = []
+        for position, value in enumerate(data):
+            if value.__class__ is str and value.isascii() and value.isdigit():
+                value = int(value)
+            if value.__class__ is not int or not 0 < value <= BIGINT_MAX:
+                invalid.append(position)
+            else:
+                ids.add(value)
+        if invalid:
+            self.fail("invalid", positions=invalid[:20])
+        return sorted(ids)
+
+    def to_representation(self, value: list[int]) -> list[int]:
+        return value
 
 
 class BulkParticipantsSerializer(serializers.Serializer):
-    participant_ids = serializers.ListField(
-        child=serializers.IntegerField(min_value=1), allow_empty=False, required=True, write_only=True
+    participant_ids = ParticipantIdsField(write_only=True)
+    job = serializers.BooleanField(
+        default=False, write_only=True, help_text="Process the ids on Celery in chunks and answer 202 with a job id"
     )
+    verify_existence = True
 
     def validate(self, attrs: dict) -> dict:
-        ids_set: set[int] = set(attrs["participant_ids"])
-        existing_ids: set[int] = set(User.objects.filter(id__in=ids_set).values_list("id", flat=True))
-        if len(existing_ids) != len(ids_set):
-            missing = sorted(ids_set - existing_ids)
+        # a job reports unknown users per chunk instead of rejecting the request
+        if not self.verify_existence or attrs["job"]:
+            return attrs
+        existing_ids = find_existing_user_ids(attrs["participant_ids"])
+        if len(existing_ids) != len(attrs["participant_ids"]):
+            missing = [uid for uid in attrs["participant_ids"] if uid not in existing_ids]
             raise serializers.ValidationError({"participant_ids": f"Users not found: {missing}"})
-        attrs["participant_ids"] = sorted(existing_ids)
         return attrs
+
+
+class RegisterParticipantsSerializer(BulkParticipantsSerializer):
+    # existence is checked by the registration INSERT itself
+    verify_existence = False
+
+
+class ExportFormatSerializer(serializers.Serializer):
+    export_format = serializers.ChoiceField(choices=tuple(EXPORT_FORMATS), default="ndjson")
+
+
+class BulkEventsSerializer(serializers.Serializer):
+    items = serializers.ListField(
+        child=serializers.JSONField(),
+        allow_empty=False,
+        max_length=getattr(settings, "EVENTS_BULK_MAX_ITEMS", 5000),
+    )
+    atomic = serializers.BooleanField(default=True, help_text="All-or-nothing when true, partial success when false")
+
+
+class BulkEventsDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=getattr(settings, "EVENTS_BULK_MAX_ITEMS", 5000),
+    )
+    atomic = serializers.BooleanField(default=True, help_text="All-or-nothing when true, partial success when false")
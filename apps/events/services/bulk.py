@@ -0,0 +1,155 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+from apps.events.caching import bump_events_generation
+from apps.events.models import Event
+from apps.events.serializers import BIGINT_MAX, EventSerializer
+from apps.events.services.feed import refresh_upcoming_events
+from apps.events.services.reminders import reset_reminders
+from apps.events.services.search import update_search_vectors
+from apps.events.tasks import queue_waitlist_promotion
+
+
+@dataclass
+class BulkResult:
+    results: list[dict[str, Any]] = field(default_factory=list)
+    written: bool = False
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for item in self.results if item["status"] == "error")
+
+    @property
+    def succeeded(self) -> int:
+        return len(self.results) - self.failed
+
+    def add_error(self, index: int, errors: Any) -> None:
+        self.results.append({"index": index, "status": "error", "errors": errors})
+
+    def finish(self, succeeded: Iterable[tuple[int, dict[str, Any]]]) -> "BulkResult":
+        self.results.extend({"index": index, **item} for index, item in succeeded)
+        self.results.sort(key=lambda item: item["index"])
+        return self
+
+
+def _validate(serializer: EventSerializer, data: Any) -> tuple[dict | None, Any]:
+    """Runs one shared serializer instance per item, so fields are bound once for the whole batch."""
+    if not isinstance(data, dict):
+        return None, {"non_field_errors": ["Expected an object."]}
+    try:
+        return serializer.run_validation(data), None
+    except serializers.ValidationError as exc:
+        return None, exc.detail
+
+
+def bulk_create_events(items: list[dict], organizer, *, atomic: bool) -> BulkResult:
+    result = BulkResult()
+    serializer = EventSerializer()
+    pending: list[tuple[int, Event]] = []
+    for index, data in enumerate(items):
+        validated, errors = _validate(serializer, data)
+        if errors is not None:
+            result.add_error(index, errors)
+        else:
+            pending.append((index, Event(organizer=organizer, **validated)))
+    if atomic and result.failed:
+        return result.finish([])
+    with transaction.atomic():
+        created = Event.objects.bulk_create([event for _, event in pending], batch_size=_batch_size())
+        if created:
+            update_search_vectors(Event.objects.filter(pk__in=[event.pk for event in created]))
+            refresh_upcoming_events(event.pk for event in created)
+            transaction.on_commit(bump_events_generation)
+    result.written = bool(created)
+    return result.finish((index, {"status": "created", "id": event.pk}) for index, event in pending)
+
+
+def _item_id(data: Any) -> int | None:
+    pk = data.get("id") if isinstance(data, dict) else None
+    # items are free-form JSON: lists and objects are unhashable, and `true` is an int equal to 1
+    if isinstance(pk, int) and not isinstance(pk, bool) and 1 <= pk <= BIGINT_MAX:
+        return pk
+    return None
+
+
+def bulk_update_events(items: list[dict], *, atomic: bool) -> BulkResult:
+    result = BulkResult()
+    ids = [_item_id(data) for data in items]
+    instances = Event.objects.in_bulk({pk for pk in ids if pk is not None})
+    serializer = EventSerializer(partial=True)
+    pending: list[tuple[int, Event]] = []
+    seen_ids: set[int] = set()
+    changed_fields: set[str] = set()
+    resized: list[Event] = []
+    rescheduled_ids: list[int] = []
+    for index, (data, pk) in enumerate(zip(items, ids)):
+        if pk is None:
+            result.add_error(index, {"id": ["A positive integer event id is required."]})
+            continue
+        if pk in seen_ids:
+            result.add_error(index, {"id": ["This event is already updated by another item."]})
+            continue
+        seen_ids.add(pk)
+        instance = instances.get(pk)
+        if instance is None:
+            result.add_error(index, {"id": ["Event not found."]})
+            continue
+        serializer.instance = instance
+        validated, errors = _validate(serializer, {k: v for k, v in data.items() if k != "id"})
+        if errors is not None:
+            result.add_error(index, errors)
+            continue
+        if "capacity" in validated and validated["capacity"] != instance.capacity:
+            resized.append(instance)
+        if "date" in validated and validated["date"] != instance.date:
+            rescheduled_ids.append(instance.pk)
+        for attr, value in validated.items():
+            setattr(instance, attr, value)
+        changed_fields.update(validated)
+        pending.append((index, instance))
+    if atomic and result.failed:
+        return result.finish([])
+    events = [event for _, event in pending]
+    if events:
+        now = timezone.now()
+        for event in events:
+            event.updated_at = now
+        with transaction.atomic():
+            Event.objects.bulk_update(events, [*changed_fields, "updated_at"], batch_size=_batch_size())
+            update_search_vectors(Event.objects.filter(pk__in=[event.pk for event in events]))
+            refresh_upcoming_events(event.pk for event in events)
+            if rescheduled_ids:
+                reset_reminders(rescheduled_ids)
+            transaction.on_commit(bump_events_generation)
+            for event in resized:
+                if event.waitlist_enabled:
+                    # as in EventViewSet.perform_update: a larger capacity frees seats for waiting users
+                    transaction.on_commit(lambda event_id=event.pk: queue_waitlist_promotion(event_id))
+        result.written = True
+    return result.finish((index, {"status": "updated", "id": event.pk}) for index, event in pending)
+
+
+def bulk_delete_events(ids: list[int], *, atomic: bool) -> BulkResult:
+    result = BulkResult()
+    existing = set(Event.objects.filter(pk__in=ids).values_list("pk", flat=True))
+    pending: list[tuple[int, int]] = []
+    for index, pk in enumerate(ids):
+        if pk in existing:
+            pending.append((index, pk))
+        else:
+            result.add_error(index, {"id": ["Event not found."]})
+    if atomic and result.failed:
+        return result.finish([])
+    if pending:
+        with transaction.atomic():
+            Event.objects.filter(pk__in=[pk for _, pk in pending]).delete()
+        result.written = True
+    return result.finish((index, {"status": "deleted", "id": pk}) for index, pk in pending)
+
+
+def _batch_size() -> int:
+    return getattr(settings, "EVENTS_BULK_BATCH_SIZE", 1000)
@@ -0,0 +1,92 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, QuerySet
+from django.http import StreamingHttpResponse
+from apps.events.models import Event, EventRegistration
+
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+EVENT_EXPORT_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "date",
+    "location",
+    "capacity",
+    "participants_count",
+    "organizer_id",
+    "created_at",
+    "updated_at",
+)
+EVENT_EXPORT_ALIASES = {
+    "organizer_username": F("organizer__username"),
+    "organizer_email": F("organizer__email"),
+}
+
+# leading characters spreadsheets read as the start of a formula in a CSV cell
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+REGISTRATION_EXPORT_FIELDS = ("id", "event_id", "participant_id", "registered_at")
+REGISTRATION_EXPORT_ALIASES = {
+    "participant_username": F("participant__username"),
+    "participant_email": F("participant__email"),
+}
+
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def _csv_value(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    # user-entered text such as "=HYPERLINK(...)" must stay text when the file is opened in a spreadsheet
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def iter_csv(rows: Iterable[dict], fieldnames: list[str]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fieldnames)
+    for row in rows:
+        yield writer.writerow(_csv_value(row[name]) for name in fieldnames)
+
+
+def stream_export(
+    queryset: QuerySet, fields: tuple[str, ...], aliases: dict[str, F], export_format: str, filename: str
+) -> StreamingHttpResponse:
+    """Stream rows from a server-side cursor, so memory stays flat regardless of the row count."""
+    chunk_size = getattr(settings, "EVENTS_EXPORT_CHUNK_SIZE", 2000)
+    rows = queryset.values(*fields, **aliases).iterator(chunk_size=chunk_size)
+    if export_format == "csv":
+        content = iter_csv(rows, [*fields, *aliases])
+    else:
+        content = iter_ndjson(rows)
+    response = StreamingHttpResponse(content, content_type=EXPORT_FORMATS[export_format])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    return response
+
+
+def export_events(queryset: QuerySet[Event], export_format: str) -> StreamingHttpResponse:
+    queryset = queryset.order_by("created_at", "id")
+    return stream_export(queryset, EVENT_EXPORT_FIELDS, EVENT_EXPORT_ALIASES, export_format, "events")
+
+
+def export_registrations(event: Event, export_format: str) -> StreamingHttpResponse:
+    queryset = EventRegistration.objects.filter(event=event).order_by("registered_at", "id")
+    filename = f"event-{event.id}-registrations"
+    return stream_export(queryset, REGISTRATION_EXPORT_FIELDS, REGISTRATION_EXPORT_ALIASES, export_format, filename)
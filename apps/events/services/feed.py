@@ -0,0 +1,102 @@
+from collections.abc import Iterable
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.db.models.functions import Now
+from django.utils import timezone
+from apps.events.models import Event, UpcomingEvent
+from apps.events.services.participants import bigint_array
+
+
+User = get_user_model()
+
+FEED_COLUMNS = (
+    "date",
+    "title",
+    "location",
+    "organizer_id",
+    "organizer_username",
+    "organizer_email",
+    "capacity",
+    "participants_count",
+)
+
+# Copies the given (or all) events that have not started yet into the feed, rewriting only rows that changed, and
+# drops the feed rows of those events that are gone or started. Rows are stamped with the statement's start, which
+# under READ COMMITTED is when its snapshot was taken: a slower refresh that read older values cannot overwrite a
+# row written from a newer snapshot, nor delete it.
+REFRESH_SQL = """
+WITH source AS (
+    SELECT e.id, e.date, e.title, e.location, e.organizer_id, u.username, u.email, e.capacity, e.participants_count
+    FROM {event_table} e JOIN {user_table} u ON u.id = e.organizer_id
+    WHERE e.date >= %(now)s{event_filter}
+),
+removed AS (
+    DELETE FROM {feed_table} f
+    WHERE {feed_filter} AND f.refreshed_at <= STATEMENT_TIMESTAMP()
+        AND NOT EXISTS (SELECT 1 FROM source WHERE source.id = f.event_id)
+)
+INSERT INTO {feed_table} (event_id, {columns}, refreshed_at)
+SELECT source.*, STATEMENT_TIMESTAMP() FROM source
+ON CONFLICT (event_id) DO UPDATE SET {updates}, refreshed_at = EXCLUDED.refreshed_at
+WHERE {feed_table}.refreshed_at <= EXCLUDED.refreshed_at AND ({current}) IS DISTINCT FROM ({excluded})
+"""
+
+
+def build_refresh_sql(event_table: str, user_table: str, feed_table: str, *, filtered: bool) -> str:
+    quote = connection.ops.quote_name
+    return REFRESH_SQL.format(
+        event_table=quote(event_table),
+        user_table=quote(user_table),
+        feed_table=quote(feed_table),
+        event_filter=" AND e.id = ANY(%(event_ids)s::bigint[])" if filtered else "",
+        feed_filter="f.event_id = ANY(%(event_ids)s::bigint[])" if filtered else "TRUE",
+        columns=", ".join(FEED_COLUMNS),
+        updates=", ".join(f"{column} = EXCLUDED.{column}" for column in FEED_COLUMNS),
+        current=", ".join(f"{quote(feed_table)}.{column}" for column in FEED_COLUMNS),
+        excluded=", ".join(f"EXCLUDED.{column}" for column in FEED_COLUMNS),
+    )
+
+
+def refresh_upcoming_events(event_ids: Iterable[int] | None = None) -> None:
+    """Brings the feed rows of `event_ids` (all events when None) in line with the events, in one statement."""
+    params: dict = {"now": timezone.now()}
+    if event_ids is not None:
+        event_ids = sorted(set(event_ids))
+        if not event_ids:
+            return
+        params["event_ids"] = bigint_array(event_ids)
+    sql = build_refresh_sql(
+        Event._meta.db_table, User._meta.db_table, UpcomingEvent._meta.db_table, filtered=event_ids is not None
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def refresh_upcoming_events_on_commit(event_ids: list[int]) -> None:
+    transaction.on_commit(lambda: refresh_upcoming_events(event_ids))
+
+
+def refresh_organizer_summaries(organizer: User) -> int:
+    return UpcomingEvent.objects.filter(organizer=organizer).update(
+        organizer_username=organizer.get_username(), organizer_email=organizer.email, refreshed_at=Now()
+    )
+
+
+def prune_upcoming_events(batch_size: int | None = None) -> int:
+    """
+    Deletes feed rows of events that have started, oldest first and `batch_size` rows per transaction. Reads
+    already skip them, so this only keeps the feed table small. Returns the number of removed rows.
+    """
+    batch_size = batch_size or getattr(settings, "UPCOMING_EVENTS_PRUNE_BATCH_SIZE", 5000)
+    expired = UpcomingEvent.objects.filter(date__lt=timezone.now()).order_by("date", "event")
+    pruned = 0
+    while ids := list(expired.values_list("event_id", flat=True)[:batch_size]):
+        with transaction.atomic():
+            pruned += UpcomingEvent.objects.filter(event_id__in=ids).delete()[0]
+    return pruned
+
+
+def get_upcoming_events() -> QuerySet[UpcomingEvent]:
+    return UpcomingEvent.objects.filter(date__gte=timezone.now())
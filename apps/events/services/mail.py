@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.template import Context
+from django.template.loader import get_template, render_to_string
+from django.utils import timezone
+from django.utils.html import escape
+from apps.events.models import Event
+
+
+User = get_user_model()
+
+# rendered in place of the recipient's name, then split on, so the name is the only per-recipient part
+RECIPIENT_PLACEHOLDER = "\x00recipient\x00"
+# distinct event renderings kept per process
+EVENT_EMAIL_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class EventEmail:
+    """
+    An email about one event, rendered from `<template>_subject.txt`, `<template>_body.txt` and
+    `<template>_body.html`, with both bodies split around the recipient's name.
+    """
+
+    subject: str
+    text_parts: tuple[str, ...]
+    html_parts: tuple[str, ...]
+
+    def text_for(self, name: str) -> str:
+        return name.join(self.text_parts)
+
+    def html_for(self, name: str) -> str:
+        return escape(name).join(self.html_parts)
+
+    def message_for(self, user: User) -> EmailMultiAlternatives:
+        name = user.get_username()
+        message = EmailMultiAlternatives(
+            self.subject, self.text_for(name), getattr(settings, "DEFAULT_FROM_EMAIL", None), [user.email]
+        )
+        message.attach_alternative(self.html_for(name), "text/html")
+        return message
+
+
+def _render_text(template_name: str, context: dict) -> str:
+    # plain text parts must not be HTML-escaped
+    return get_template(template_name).template.render(Context(context, autoescape=False))
+
+
+@lru_cache(maxsize=EVENT_EMAIL_CACHE_SIZE)
+def render_event_email(
+    template: str, title: str, date: datetime, location: str, organizer: str, timezone_name: str
+) -> EventEmail:
+    event_dt = timezone.localtime(date) if timezone.is_aware(date) else date
+    context = {
+        "recipient_name": RECIPIENT_PLACEHOLDER,
+        "title": title,
+        "date": f"{event_dt:%Y-%m-%d %H:%M}",
+        "location": location,
+        "organizer": organizer,
+    }
+    subject = _render_text(f"{template}_subject.txt", context)
+    return EventEmail(
+        subject=" ".join(subject.split()),
+        text_parts=tuple(_render_text(f"{template}_body.txt", context).split(RECIPIENT_PLACEHOLDER)),
+        html_parts=tuple(render_to_string(f"{template}_body.html", context).split(RECIPIENT_PLACEHOLDER)),
+    )
+
+
+def get_event_email(template: str, event: Event) -> EventEmail:
+    """
+    The rendering of `template` for the event's current title, date, location and organizer name, so any change to
+    them (saves, bulk updates, organizer renames) is a new cache entry and unchanged events are rendered once.
+    """
+    return render_event_email(
+        template,
+        event.title,
+        event.date,
+        event.location,
+        event.organizer.get_username(),
+        timezone.get_current_timezone_name(),
+    )
+
+
+class MailConnectionPool:
+    """
+    Open email backend connections kept per process and handed out one task at a time, so a worker sending many
+    chunks pays for the SMTP handshake, TLS and login once instead of once per chunk. Connections idle for longer
+    than EMAIL_POOL_MAX_IDLE seconds are closed instead of reused (servers drop them), and one that raised while
+    in use is discarded.
+    """
+
+    def __init__(self) -> None:
+        self._idle: deque[tuple[BaseEmailBackend, float]] = deque()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[BaseEmailBackend]:
+        backend = self._acquire()
+        try:
+            yield backend
+        except BaseException:
+            backend.close()
+            raise
+        self._release(backend)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for backend, _ in idle:
+            backend.close()
+
+    def _acquire(self) -> BaseEmailBackend:
+        max_idle = getattr(settings, "EMAIL_POOL_MAX_IDLE", 60)
+        now = time.monotonic()
+        expired = []
+        backend = None
+        with self._lock:
+            while self._idle:
+                candidate, released_at = self._idle.pop()
+                if now - released_at <= max_idle:
+                    backend = candidate
+                    break
+                expired.append(candidate)
+        for candidate in expired:
+            candidate.close()
+        if backend is None:
+            backend = get_connection(fail_silently=False)
+            backend.open()
+        return backend
+
+    def _release(self, backend: BaseEmailBackend) -> None:
+        with self._lock:
+            if len(self._idle) < getattr(settings, "EMAIL_POOL_SIZE", 2):
+                self._idle.append((backend, time.monotonic()))
+                return
+        backend.close()
+
+
+mail_connections = MailConnectionPool()
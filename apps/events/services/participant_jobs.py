@@ -0,0 +1,108 @@
+from collections.abc import Callable
+from typing import Any
+from django.conf import settings
+from apps.events.services.participants import CapacityExceeded
+from apps.events.services.registration import ParticipantsNotFound, register_participants, unregister_participants
+
+
+JOB_OPERATIONS = ("register", "unregister")
+
+# result backend states of a participants job besides Celery's SUCCESS; FAILED keeps the partial results, where
+# Celery's FAILURE (e.g. a time limit) only stores the exception
+JOB_QUEUED = "QUEUED"
+JOB_PROGRESS = "PROGRESS"
+JOB_FAILED = "FAILED"
+
+JOB_STATUSES = {
+    JOB_QUEUED: "queued",
+    JOB_PROGRESS: "running",
+    JOB_FAILED: "failed",
+    "SUCCESS": "succeeded",
+    "FAILURE": "failed",
+}
+
+RESULT_KEYS = {
+    "register": ("created_ids", "already_registered_ids", "waitlisted_ids", "not_found_ids", "capacity_exceeded_ids"),
+    "unregister": ("deleted_ids", "left_waitlist_ids", "not_found_ids"),
+}
+
+
+def new_job_progress(
+    job_id: str, event_id: int, operation: str, participant_ids: list[int], user_id: int, *, waitlist: bool = False
+) -> dict:
+    chunk_size = getattr(settings, "EVENTS_PARTICIPANTS_JOB_CHUNK_SIZE", 1000)
+    progress = {
+        "job_id": job_id,
+        "event_id": event_id,
+        "operation": operation,
+        "waitlist": waitlist,
+        "requested_by": user_id,
+        "total": len(participant_ids),
+        "processed": 0,
+        "chunks_total": -(-len(participant_ids) // chunk_size),
+        "chunks_done": 0,
+    }
+    progress.update({key: [] for key in RESULT_KEYS[operation]})
+    return progress
+
+
+def _register_chunk(event_id: int, chunk: list[int], progress: dict) -> None:
+    waitlist = progress.get("waitlist", False)
+    try:
+        outcome = register_participants(event_id, chunk, waitlist=waitlist)
+    except ParticipantsNotFound as exc:
+        # unlike the synchronous endpoint, a job skips unknown users instead of failing the whole list
+        progress["not_found_ids"].extend(exc.missing_ids)
+        missing = set(exc.missing_ids)
+        chunk = [uid for uid in chunk if uid not in missing]
+        if not chunk:
+            return
+        try:
+            outcome = register_participants(event_id, chunk, waitlist=waitlist)
+        except CapacityExceeded:
+            progress["capacity_exceeded_ids"].extend(chunk)
+            return
+    except CapacityExceeded:
+        progress["capacity_exceeded_ids"].extend(chunk)
+        return
+    progress["created_ids"].extend(outcome.created_ids)
+    progress["already_registered_ids"].extend(outcome.already_registered_ids)
+    progress["waitlisted_ids"].extend(outcome.waitlisted_ids)
+
+
+def _unregister_chunk(event_id: int, chunk: list[int], progress: dict) -> None:
+    outcome = unregister_participants(event_id, chunk, waitlist=progress.get("waitlist", False))
+    progress["deleted_ids"].extend(outcome.deleted_ids)
+    progress["left_waitlist_ids"].extend(outcome.left_waitlist_ids)
+    progress["not_found_ids"].extend(outcome.not_found_ids)
+
+
+def run_participants_job(
+    progress: dict, participant_ids: list[int], report: Callable[[dict], Any] | None = None
+) -> dict:
+    """
+    Registers or unregisters the ids in chunks of EVENTS_PARTICIPANTS_JOB_CHUNK_SIZE, one transaction per chunk.
+    Each committed chunk queues its own confirmation emails and is passed to `report`, so progress and partial
+    results are visible while the job runs. A chunk over capacity is recorded and the job moves on.
+    """
+    chunk_size = getattr(settings, "EVENTS_PARTICIPANTS_JOB_CHUNK_SIZE", 1000)
+    process_chunk = _register_chunk if progress["operation"] == "register" else _unregister_chunk
+    for start in range(progress["processed"], len(participant_ids), chunk_size):
+        chunk = participant_ids[start : start + chunk_size]
+        process_chunk(progress["event_id"], chunk, progress)
+        progress["processed"] = start + len(chunk)
+        progress["chunks_done"] += 1
+        if report is not None:
+            report(progress)
+    return progress
+
+
+def job_representation(state: str, info: Any) -> dict:
+    if isinstance(info, dict):
+        representation = dict(info)
+    else:
+        representation = {}
+        if state == "FAILURE":
+            representation["error"] = str(info)
+    representation["status"] = JOB_STATUSES.get(state, state.lower())
+    return representation
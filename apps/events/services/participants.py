@@ -0,0 +1,60 @@
+from django.db.models import Count, F, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from apps.events.models import Event, EventRegistration
+
+
+class CapacityExceeded(Exception):
+    pass
+
+
+def bigint_array(ids: list[int]) -> str:
+    """
+    Postgres array literal for `%s::bigint[]`: one short text parameter, parsed once by the server, where an
+    `IN (...)` list or an `ARRAY[...]` expression carries one element per id through the client and the planner.
+    """
+    return "{" + ",".join(map(str, ids)) + "}"
+
+
+def increment_participants_count(event_id: int, amount: int) -> None:
+    """Atomically add seats, refusing the update when it would push the event past its capacity."""
+    updated = (
+        Event.objects.filter(pk=event_id)
+        .filter(Q(capacity__isnull=True) | Q(capacity__gte=F("participants_count") + amount))
+        .update(participants_count=F("participants_count") + amount)
+    )
+    if not updated:
+        raise CapacityExceeded
+
+
+def decrement_participants_count(event_id: int, amount: int) -> None:
+    Event.objects.filter(pk=event_id).update(participants_count=Greatest(F("participants_count") - amount, 0))
+
+
+def rebuild_participants_count(queryset: QuerySet[Event] | None = None) -> int:
+    """Recount registrations for events whose counter drifted; returns the number of fixed events."""
+    queryset = Event.objects.all() if queryset is None else queryset
+    counts = (
+        EventRegistration.objects.filter(event=OuterRef("pk"))
+        .order_by()
+        .values("event")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    actual = Coalesce(Subquery(counts), 0)
+    return queryset.alias(actual_count=actual).exclude(participants_count=F("actual_count")).update(
+        participants_count=actual
+    )
+
+
+def get_event_participants(event_id: int, *, ids_only: bool = False) -> QuerySet[EventRegistration]:
+    """
+    Registrations of one event in `(registered_at, id)` order, served by `eventreg_event_registered_idx`.
+    The unique (event, participant) constraint makes DISTINCT unnecessary; users come from one JOIN, or not
+    at all when only ids are needed.
+    """
+    registrations = EventRegistration.objects.filter(event_id=event_id).order_by("registered_at", "id")
+    if ids_only:
+        return registrations.only("id", "participant_id", "registered_at")
+    return registrations.select_related("participant").only(
+        "id", "registered_at", "participant__id", "participant__username", "participant__email"
+    )
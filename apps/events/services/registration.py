@@ -0,0 +1,164 @@
+from dataclasses import dataclass, field
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils import timezone
+from apps.events.caching import bump_events_generation
+from apps.events.models import EventRegistration
+from apps.events.services.feed import refresh_upcoming_events_on_commit
+from apps.events.services.participants import (
+    bigint_array,
+    decrement_participants_count,
+    increment_participants_count,
+)
+from apps.events.services.waitlist import (
+    claim_seats,
+    join_waitlist,
+    leave_waitlist,
+    move_to_waitlist,
+    queue_promotion_if_seats_free,
+    seats_open,
+)
+from apps.events.tasks import queue_registration_emails, queue_waitlist_promotion
+
+
+User = get_user_model()
+
+
+class ParticipantsNotFound(Exception):
+    def __init__(self, missing_ids: list[int]) -> None:
+        super().__init__(missing_ids)
+        self.missing_ids = missing_ids
+
+
+@dataclass(frozen=True)
+class RegistrationOutcome:
+    created_ids: list[int]
+    already_registered_ids: list[int]
+    waitlisted_ids: list[int] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class UnregistrationOutcome:
+    deleted_ids: list[int]
+    not_found_ids: list[int]
+    left_waitlist_ids: list[int] = field(default_factory=list)
+
+
+EXISTING_USERS_SQL = "SELECT id FROM {user_table} WHERE id = ANY(%s::bigint[])"
+
+
+def find_existing_user_ids(ids: list[int]) -> set[int]:
+    sql = EXISTING_USERS_SQL.format(user_table=connection.ops.quote_name(User._meta.db_table))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [bigint_array(ids)])
+        return {uid for (uid,) in cursor.fetchall()}
+
+
+# Resolves existing users, inserts the missing registrations and reports which rows were new, in one round trip.
+# ON CONFLICT makes concurrent registrations for the same pair wait for each other instead of double counting.
+REGISTER_SQL = """
+WITH requested AS (
+    SELECT id FROM {user_table} WHERE id = ANY(%(participant_ids)s::bigint[])
+),
+inserted AS (
+    INSERT INTO {registration_table} (event_id, participant_id, registered_at)
+    SELECT %(event_id)s, id, %(registered_at)s FROM requested
+    ON CONFLICT (event_id, participant_id) DO NOTHING
+    RETURNING participant_id
+)
+SELECT requested.id, inserted.participant_id IS NOT NULL
+FROM requested LEFT JOIN inserted ON inserted.participant_id = requested.id
+ORDER BY requested.id
+"""
+
+
+def register_participants(
+    event_id: int, participant_ids: list[int], *, waitlist: bool = False
+) -> RegistrationOutcome:
+    """
+    Registers users for an event. Raises ParticipantsNotFound or CapacityExceeded, in which case nothing is written.
+    With `waitlist`, users who get no seat are put on the event's waitlist instead of raising CapacityExceeded.
+    Confirmation emails and cache invalidation are scheduled for after the commit.
+    """
+    if waitlist and not seats_open(event_id):
+        return join_waitlist_only(event_id, participant_ids)
+    sql = REGISTER_SQL.format(
+        user_table=connection.ops.quote_name(User._meta.db_table),
+        registration_table=connection.ops.quote_name(EventRegistration._meta.db_table),
+    )
+    params = {"participant_ids": bigint_array(participant_ids), "event_id": event_id, "registered_at": timezone.now()}
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+        found_ids = {uid for uid, _ in rows}
+        if len(found_ids) != len(set(participant_ids)):
+            raise ParticipantsNotFound(sorted(set(participant_ids) - found_ids))
+        created_ids = [uid for uid, created in rows if created]
+        waitlisted_ids: list[int] = []
+        if created_ids and waitlist:
+            granted = claim_seats(event_id, len(created_ids))
+            created_ids, waitlisted_ids = created_ids[:granted], created_ids[granted:]
+            if waitlisted_ids:
+                move_to_waitlist(event_id, waitlisted_ids)
+                transaction.on_commit(lambda: queue_promotion_if_seats_free(event_id))
+        elif created_ids:
+            increment_participants_count(event_id, len(created_ids))
+        if created_ids:
+            transaction.on_commit(lambda: queue_registration_emails(event_id, created_ids))
+            transaction.on_commit(bump_events_generation)
+            refresh_upcoming_events_on_commit([event_id])
+    return RegistrationOutcome(
+        created_ids=created_ids,
+        already_registered_ids=[uid for uid, created in rows if not created],
+        waitlisted_ids=waitlisted_ids,
+    )
+
+
+def join_waitlist_only(event_id: int, participant_ids: list[int]) -> RegistrationOutcome:
+    """Registration path of a full event: no seat is claimed, so the event row is neither locked nor written."""
+    with transaction.atomic():
+        rows = join_waitlist(event_id, participant_ids)
+        if len(rows) != len(set(participant_ids)):
+            raise ParticipantsNotFound(sorted(set(participant_ids) - {uid for uid, _ in rows}))
+        waitlisted_ids = [uid for uid, registered in rows if not registered]
+        if waitlisted_ids:
+            transaction.on_commit(lambda: queue_promotion_if_seats_free(event_id))
+    return RegistrationOutcome(
+        created_ids=[],
+        already_registered_ids=[uid for uid, registered in rows if registered],
+        waitlisted_ids=waitlisted_ids,
+    )
+
+
+UNREGISTER_SQL = """
+DELETE FROM {registration_table}
+WHERE event_id = %(event_id)s AND participant_id = ANY(%(participant_ids)s::bigint[])
+RETURNING participant_id
+"""
+
+
+def unregister_participants(
+    event_id: int, participant_ids: list[int], *, waitlist: bool = False
+) -> UnregistrationOutcome:
+    """
+    Deletes the registrations and learns which existed from the same statement. With `waitlist`, the users also
+    leave the waitlist and freed seats are offered to waiting users after the commit.
+    """
+    sql = UNREGISTER_SQL.format(registration_table=connection.ops.quote_name(EventRegistration._meta.db_table))
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {"event_id": event_id, "participant_ids": bigint_array(participant_ids)})
+            deleted_ids = {uid for (uid,) in cursor.fetchall()}
+        left_ids = leave_waitlist(event_id, participant_ids) if waitlist else set()
+        if deleted_ids:
+            decrement_participants_count(event_id, len(deleted_ids))
+            transaction.on_commit(bump_events_generation)
+            refresh_upcoming_events_on_commit([event_id])
+            if waitlist:
+                transaction.on_commit(lambda: queue_waitlist_promotion(event_id))
+    return UnregistrationOutcome(
+        deleted_ids=sorted(deleted_ids),
+        not_found_ids=sorted(set(participant_ids) - deleted_ids - left_ids),
+        left_waitlist_ids=sorted(left_ids),
+    )
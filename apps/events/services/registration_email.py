@@ -1,36 +1,37 @@
 from __future__ import annotations
+from collections.abc import Iterable
 from dataclasses import dataclass
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
-from django.utils import timezone
+from django.core.mail import EmailMessage, get_connection, send_mail
 from apps.events.models import Event
+from apps.events.services.mail import get_event_email
 
 
 User = get_user_model()
 
+REGISTRATION_EMAIL_TEMPLATE = "events/emails/registration_confirmation"
+
 
 @dataclass(frozen=True)
 class RegistrationEmail:
     subject: str
     message: str
+    html_message: str
     from_email: str | None
     to_email: str
 
 
 def build_registration_email(user: User, event: Event) -> RegistrationEmail:
+    """The confirmation email for `user`; the event's parts come from the per-event rendering cache."""
     if not getattr(user, "email", None):
         raise ValueError("User has no email")
-    event_dt = timezone.localtime(event.date) if timezone.is_aware(event.date) else event.date
-    subject = f"Registration confirmed: {event.title}"
-    message = (
-        f"Hi {user.get_username()},\n\n"
-        f"You are registered for '{event.title}' on {event_dt:%Y-%m-%d %H:%M} at {event.location}.\n"
-        f"Organizer: {event.organizer.get_username()}\n"
-    )
+    rendered = get_event_email(REGISTRATION_EMAIL_TEMPLATE, event)
+    name = user.get_username()
     return RegistrationEmail(
-        subject=subject,
-        message=message,
+        subject=rendered.subject,
+        message=rendered.text_for(name),
+        html_message=rendered.html_for(name),
         from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
         to_email=user.email,
     )
@@ -51,5 +52,26 @@ def send_registration_confirmation_email(user_id: int, event_id: int, *, fail_si
         email.from_email,
         [email.to_email],
         fail_silently=fail_silently,
+        html_message=email.html_message,
     )
     return bool(sent_email)
+
+
+def send_registration_confirmation_emails(
+    user_ids: Iterable[int], event_id: int, *, fail_silently: bool = True, batch_size: int | None = None
+) -> int:
+    try:
+        event = Event.objects.select_related("organizer").get(pk=event_id)
+    except Event.DoesNotExist:
+        return 0
+    users = User.objects.filter(pk__in=list(user_ids)).exclude(email="").order_by("pk")
+    rendered = get_event_email(REGISTRATION_EMAIL_TEMPLATE, event)
+    messages: list[EmailMessage] = [rendered.message_for(user) for user in users]
+    if not messages:
+        return 0
+    batch_size = batch_size or getattr(settings, "REGISTRATION_EMAIL_BATCH_SIZE", 100)
+    sent = 0
+    with get_connection(fail_silently=fail_silently) as connection:
+        for start in range(0, len(messages), batch_size):
+            sent += connection.send_messages(messages[start : start + batch_size]) or 0
+    return sent
@@ -0,0 +1,142 @@
+from collections.abc import Iterator
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from apps.events.models import Event, EventRegistration, EventReminderDelivery
+from apps.events.services.mail import get_event_email, mail_connections
+from apps.events.tasks import queue_event_reminder_fan_outs, queue_event_reminders
+
+
+User = get_user_model()
+
+REMINDER_EMAIL_TEMPLATE = "events/emails/event_reminder"
+# upper bound of an open-ended registrant range
+MAX_PARTICIPANT_ID = 2**63 - 1
+
+
+def _lead_time() -> timedelta:
+    return timedelta(hours=getattr(settings, "EVENT_REMINDER_LEAD_HOURS", 24))
+
+
+def get_due_events(now=None) -> QuerySet[Event]:
+    """Events starting within EVENT_REMINDER_LEAD_HOURS and not reminded yet, found via `event_reminder_due_idx`."""
+    now = now or timezone.now()
+    return Event.objects.filter(reminders_queued_at__isnull=True, date__gt=now, date__lte=now + _lead_time())
+
+
+def reset_reminders(event_ids: list[int]) -> None:
+    """Makes rescheduled events due again, so their registrants are reminded of the new date."""
+    Event.objects.filter(pk__in=event_ids).update(reminders_queued_at=None)
+    EventReminderDelivery.objects.filter(event_id__in=event_ids).delete()
+
+
+def schedule_due_reminders() -> list[int]:
+    """
+    Marks the due events as queued and starts a fan-out per event once that commits. Rows locked by a concurrent
+    run are skipped, so overlapping beat ticks never queue an event twice. Returns the scheduled event ids.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        event_ids = list(
+            get_due_events(now).order_by("date").select_for_update(skip_locked=True).values_list("id", flat=True)
+        )
+        if event_ids:
+            Event.objects.filter(pk__in=event_ids).update(reminders_queued_at=now)
+            transaction.on_commit(lambda: queue_event_reminder_fan_outs(event_ids))
+    return event_ids
+
+
+def iter_reminder_ranges(event_id: int, chunk_size: int | None = None) -> Iterator[tuple[int, int]]:
+    """
+    Splits the registrants of an event into `(after_id, up_to_id]` participant id ranges of `chunk_size` users,
+    streaming the ids through a server-side cursor over the `(event, participant)` unique index. The last range is
+    open-ended, so users registering after the split are still reminded.
+    """
+    chunk_size = chunk_size or getattr(settings, "EVENT_REMINDER_CHUNK_SIZE", 1000)
+    participant_ids = (
+        EventRegistration.objects.filter(event_id=event_id)
+        .order_by("participant_id")
+        .values_list("participant_id", flat=True)
+        .iterator(chunk_size=chunk_size)
+    )
+    after_id, count = 0, 0
+    for participant_id in participant_ids:
+        count += 1
+        if count == chunk_size:
+            yield after_id, participant_id
+            after_id, count = participant_id, 0
+    yield after_id, MAX_PARTICIPANT_ID
+
+
+def fan_out_reminders(event_id: int) -> int:
+    """Queues one `send_event_reminders` task per range of registrants; returns the number of tasks."""
+    tasks = 0
+    for after_id, up_to_id in iter_reminder_ranges(event_id):
+        queue_event_reminders(event_id, after_id, up_to_id)
+        tasks += 1
+    return tasks
+
+
+# Records a pending delivery for every registrant with an email in the range; rows of earlier runs are kept as they
+# are, so a rerun only adds the users that registered since.
+CLAIM_DELIVERIES_SQL = """
+INSERT INTO {delivery_table} (event_id, participant_id)
+SELECT r.event_id, r.participant_id
+FROM {registration_table} r JOIN {user_table} u ON u.id = r.participant_id
+WHERE r.event_id = %(event_id)s AND r.participant_id > %(after_id)s AND r.participant_id <= %(up_to_id)s
+    AND u.email <> ''
+ORDER BY r.participant_id
+ON CONFLICT (event_id, participant_id) DO NOTHING
+"""
+
+
+def claim_deliveries(event_id: int, after_id: int, up_to_id: int) -> None:
+    quote = connection.ops.quote_name
+    sql = CLAIM_DELIVERIES_SQL.format(
+        delivery_table=quote(EventReminderDelivery._meta.db_table),
+        registration_table=quote(EventRegistration._meta.db_table),
+        user_table=quote(User._meta.db_table),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {"event_id": event_id, "after_id": after_id, "up_to_id": up_to_id})
+
+
+def send_reminder_range(event_id: int, after_id: int, up_to_id: int, *, batch_size: int | None = None) -> int:
+    """
+    Sends the reminders of one registrant range over a pooled connection, EVENT_REMINDER_BATCH_SIZE messages per
+    transaction: the batch's delivery rows are locked (SKIP LOCKED, so a duplicate task works on other rows), the
+    messages sent and the rows marked sent. A failed send rolls the batch back and raises, and the retry resends
+    only what was never marked sent. Returns the number of messages sent.
+    """
+    event = Event.objects.select_related("organizer").filter(pk=event_id).first()
+    now = timezone.now()
+    # started, or postponed beyond the lead time after the task was queued
+    if event is None or not now < event.date <= now + _lead_time():
+        return 0
+    claim_deliveries(event_id, after_id, up_to_id)
+    batch_size = batch_size or getattr(settings, "EVENT_REMINDER_BATCH_SIZE", 100)
+    pending = (
+        EventReminderDelivery.objects.filter(
+            event_id=event_id, participant_id__gt=after_id, participant_id__lte=up_to_id, sent_at__isnull=True
+        )
+        .select_related("participant")
+        .select_for_update(skip_locked=True, of=("self",))
+        .order_by("participant_id")
+    )
+    rendered = get_event_email(REMINDER_EMAIL_TEMPLATE, event)
+    sent = 0
+    with mail_connections.connection() as mail_connection:
+        while True:
+            with transaction.atomic():
+                deliveries = list(pending[:batch_size])
+                if not deliveries:
+                    break
+                mail_connection.send_messages([rendered.message_for(delivery.participant) for delivery in deliveries])
+                EventReminderDelivery.objects.filter(pk__in=[delivery.pk for delivery in deliveries]).update(
+                    sent_at=timezone.now()
+                )
+            sent += len(deliveries)
+    return sent
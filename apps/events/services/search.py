@@ -0,0 +1,43 @@
+import re
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db.models import CharField, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce
+from apps.events.models import Event
+
+
+User = get_user_model()
+
+# "simple" skips stemming so that prefix queries behave like the former "starts with" matching.
+SEARCH_CONFIG = "simple"
+SEARCH_FIELDS = ("title", "description", "location")
+ORGANIZER_SEARCH_FIELDS = ("username", "first_name", "last_name")
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _organizer_value(user_model, field: str) -> Coalesce:
+    subquery = Subquery(user_model.objects.filter(pk=OuterRef("organizer_id")).values(field)[:1])
+    return Coalesce(subquery, Value(""), output_field=CharField())
+
+
+def build_event_search_vector(user_model=None) -> SearchVector:
+    """Organizer columns come from correlated subqueries, since UPDATE cannot reference joined fields."""
+    user_model = user_model or User
+    vector = SearchVector("title", weight="A", config=SEARCH_CONFIG)
+    vector += SearchVector("location", weight="B", config=SEARCH_CONFIG)
+    vector += SearchVector("description", weight="C", config=SEARCH_CONFIG)
+    for field in ORGANIZER_SEARCH_FIELDS:
+        vector += SearchVector(_organizer_value(user_model, field), weight="B", config=SEARCH_CONFIG)
+    return vector
+
+
+def update_search_vectors(queryset: QuerySet[Event]) -> int:
+    return queryset.update(search_vector=build_event_search_vector())
+
+
+def build_search_query(value: str) -> SearchQuery | None:
+    terms = _TERM_RE.findall(value or "")
+    if not terms:
+        return None
+    raw = " & ".join(f"{term}:*" for term in terms)
+    return SearchQuery(raw, search_type="raw", config=SEARCH_CONFIG)
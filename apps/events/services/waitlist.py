@@ -0,0 +1,209 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+from apps.events.caching import bump_events_generation
+from apps.events.models import Event, EventRegistration, EventWaitlistEntry
+from apps.events.services.feed import refresh_upcoming_events_on_commit
+from apps.events.services.participants import bigint_array
+from apps.events.tasks import queue_registration_emails, queue_waitlist_promotion
+
+
+User = get_user_model()
+
+
+def _tables() -> dict[str, str]:
+    quote = connection.ops.quote_name
+    return {
+        "user_table": quote(User._meta.db_table),
+        "registration_table": quote(EventRegistration._meta.db_table),
+        "waitlist_table": quote(EventWaitlistEntry._meta.db_table),
+    }
+
+
+def seats_open(event_id: int) -> bool:
+    """
+    Lock-free check whether a waitlist event can still admit anyone: it has free seats and nobody is waiting.
+    Once an event is full, registrations go straight to the waitlist without queueing on the event row.
+    """
+    row = (
+        Event.objects.filter(pk=event_id)
+        .annotate(waiting=Exists(EventWaitlistEntry.objects.filter(event=OuterRef("pk"))))
+        .values_list("capacity", "participants_count", "waiting")
+        .first()
+    )
+    if row is None:
+        return False
+    capacity, participants_count, waiting = row
+    return not waiting and (capacity is None or participants_count < capacity)
+
+
+def claim_seats(event_id: int, amount: int) -> int:
+    """
+    Takes up to `amount` free seats under the event row lock and returns how many were taken; none while
+    someone is waiting, so newcomers never overtake the waitlist. Must run inside a transaction.
+    """
+    row = (
+        Event.objects.select_for_update(of=("self",))
+        .filter(pk=event_id)
+        .annotate(waiting=Exists(EventWaitlistEntry.objects.filter(event=OuterRef("pk"))))
+        .values_list("capacity", "participants_count", "waiting")
+        .first()
+    )
+    if row is None:
+        return 0
+    capacity, participants_count, waiting = row
+    granted = amount if capacity is None else max(0, min(amount, capacity - participants_count))
+    if waiting:
+        granted = 0
+    if granted:
+        Event.objects.filter(pk=event_id).update(participants_count=F("participants_count") + granted)
+    return granted
+
+
+def queue_promotion_if_seats_free(event_id: int) -> None:
+    """
+    Queues a promotion when the event has free seats. Paths that add waitlist entries call this after their commit:
+    a seat freed concurrently may have been offered to the waitlist before the new entries were visible, and while
+    anyone waits no newcomer takes it, so without a promotion it would stay empty.
+    """
+    has_free_seats = (
+        Event.objects.filter(pk=event_id)
+        .filter(Q(capacity__isnull=True) | Q(capacity__gt=F("participants_count")))
+        .exists()
+    )
+    if has_free_seats:
+        queue_waitlist_promotion(event_id)
+
+
+# Adds the requested users who are not registered to the waitlist (keeping the place of those already on it) and
+# reports which of them were registered already.
+JOIN_WAITLIST_SQL = """
+WITH requested AS (
+    SELECT id FROM {user_table} WHERE id = ANY(%(participant_ids)s::bigint[])
+),
+registered AS (
+    SELECT participant_id FROM {registration_table}
+    WHERE event_id = %(event_id)s AND participant_id = ANY(%(participant_ids)s::bigint[])
+),
+joined AS (
+    INSERT INTO {waitlist_table} (event_id, participant_id, joined_at)
+    SELECT %(event_id)s, requested.id, %(joined_at)s FROM requested
+    WHERE NOT EXISTS (SELECT 1 FROM registered WHERE registered.participant_id = requested.id)
+    ORDER BY requested.id
+    ON CONFLICT (event_id, participant_id) DO NOTHING
+)
+SELECT requested.id, registered.participant_id IS NOT NULL
+FROM requested LEFT JOIN registered ON registered.participant_id = requested.id
+ORDER BY requested.id
+"""
+
+
+def join_waitlist(event_id: int, participant_ids: list[int]) -> list[tuple[int, bool]]:
+    """`(user id, already registered)` for every existing user among `participant_ids`; the others now wait."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            JOIN_WAITLIST_SQL.format(**_tables()),
+            {"participant_ids": bigint_array(participant_ids), "event_id": event_id, "joined_at": timezone.now()},
+        )
+        return cursor.fetchall()
+
+
+MOVE_TO_WAITLIST_SQL = """
+WITH moved AS (
+    DELETE FROM {registration_table}
+    WHERE event_id = %(event_id)s AND participant_id = ANY(%(participant_ids)s::bigint[])
+    RETURNING participant_id
+)
+INSERT INTO {waitlist_table} (event_id, participant_id, joined_at)
+SELECT %(event_id)s, participant_id, %(joined_at)s FROM moved
+ORDER BY participant_id
+ON CONFLICT (event_id, participant_id) DO NOTHING
+"""
+
+
+def move_to_waitlist(event_id: int, participant_ids: list[int]) -> None:
+    """Turns registrations that did not get a seat into waitlist entries."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            MOVE_TO_WAITLIST_SQL.format(**_tables()),
+            {"participant_ids": bigint_array(participant_ids), "event_id": event_id, "joined_at": timezone.now()},
+        )
+
+
+LEAVE_WAITLIST_SQL = """
+DELETE FROM {waitlist_table}
+WHERE event_id = %(event_id)s AND participant_id = ANY(%(participant_ids)s::bigint[])
+RETURNING participant_id
+"""
+
+
+def leave_waitlist(event_id: int, participant_ids: list[int]) -> set[int]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            LEAVE_WAITLIST_SQL.format(**_tables()),
+            {"participant_ids": bigint_array(participant_ids), "event_id": event_id},
+        )
+        return {uid for (uid,) in cursor.fetchall()}
+
+
+# Pops the first entries of the waitlist and registers them, in one statement. Callers hold the event row lock, so
+# concurrent promotions of the same event take turns and the order stays strictly FIFO.
+PROMOTE_SQL = """
+WITH popped AS (
+    DELETE FROM {waitlist_table}
+    WHERE id IN (
+        SELECT id FROM {waitlist_table} WHERE event_id = %(event_id)s ORDER BY id LIMIT %(limit)s
+    )
+    RETURNING id, participant_id
+),
+inserted AS (
+    INSERT INTO {registration_table} (event_id, participant_id, registered_at)
+    SELECT %(event_id)s, participant_id, %(registered_at)s FROM popped
+    ORDER BY id
+    ON CONFLICT (event_id, participant_id) DO NOTHING
+    RETURNING participant_id
+)
+SELECT popped.participant_id, inserted.participant_id IS NOT NULL
+FROM popped LEFT JOIN inserted ON inserted.participant_id = popped.participant_id
+ORDER BY popped.id
+"""
+
+
+def promote_waitlist(event_id: int, *, batch_size: int | None = None) -> list[int]:
+    """
+    Fills the free seats of an event from its waitlist in FIFO order, one transaction per batch of
+    EVENTS_WAITLIST_PROMOTION_BATCH_SIZE users. Promoted users get the registration email once their batch
+    commits. Returns the promoted user ids.
+    """
+    batch_size = batch_size or getattr(settings, "EVENTS_WAITLIST_PROMOTION_BATCH_SIZE", 500)
+    sql = PROMOTE_SQL.format(**_tables())
+    promoted: list[int] = []
+    while True:
+        with transaction.atomic():
+            row = (
+                Event.objects.select_for_update()
+                .filter(pk=event_id)
+                .values_list("capacity", "participants_count")
+                .first()
+            )
+            if row is None:
+                break
+            capacity, participants_count = row
+            limit = batch_size if capacity is None else min(batch_size, capacity - participants_count)
+            if limit <= 0:
+                break
+            with connection.cursor() as cursor:
+                cursor.execute(sql, {"event_id": event_id, "limit": limit, "registered_at": timezone.now()})
+                rows = cursor.fetchall()
+            batch = [uid for uid, registered in rows if registered]
+            if batch:
+                Event.objects.filter(pk=event_id).update(participants_count=F("participants_count") + len(batch))
+                transaction.on_commit(lambda batch=batch: queue_registration_emails(event_id, batch))
+                transaction.on_commit(bump_events_generation)
+                refresh_upcoming_events_on_commit([event_id])
+        promoted.extend(batch)
+        if len(rows) < limit:
+            break
+    return promoted
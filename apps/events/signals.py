@@ -0,0 +1,65 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.events.caching import bump_events_generation
+from apps.events.models import Event
+from apps.events.services.feed import refresh_organizer_summaries, refresh_upcoming_events
+from apps.events.services.search import ORGANIZER_SEARCH_FIELDS, SEARCH_FIELDS, update_search_vectors
+
+
+User = get_user_model()
+
+FEED_SOURCE_FIELDS = {"date", "title", "location", "organizer", "organizer_id", "capacity", "participants_count"}
+
+
+@receiver(post_save, sender=Event, dispatch_uid="events_refresh_event_search_vector")
+def refresh_event_search_vector(sender, instance: Event, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and not set(update_fields) & {*SEARCH_FIELDS, "organizer", "organizer_id"}:
+        return
+    update_search_vectors(Event.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Event, dispatch_uid="events_refresh_upcoming_event")
+def refresh_upcoming_event(sender, instance: Event, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and not set(update_fields) & FEED_SOURCE_FIELDS:
+        return
+    refresh_upcoming_events([instance.pk])
+
+
+@receiver(post_save, sender=User, dispatch_uid="events_refresh_upcoming_organizer_summaries")
+def refresh_upcoming_organizer_summaries(sender, instance: User, created: bool, update_fields=None, **kwargs) -> None:
+    if created:
+        return
+    if update_fields is not None and not set(update_fields) & {"username", "email"}:
+        return
+    refresh_organizer_summaries(instance)
+
+
+@receiver(post_save, sender=User, dispatch_uid="events_refresh_organizer_search_vectors")
+def refresh_organizer_search_vectors(sender, instance: User, created: bool, update_fields=None, **kwargs) -> None:
+    if created:
+        return
+    if update_fields is not None and not set(update_fields) & set(ORGANIZER_SEARCH_FIELDS):
+        return
+    update_search_vectors(Event.objects.filter(organizer=instance))
+
+
+@receiver(post_save, sender=Event, dispatch_uid="events_invalidate_on_event_save")
+@receiver(post_delete, sender=Event, dispatch_uid="events_invalidate_on_event_delete")
+def invalidate_on_event_change(sender, instance: Event, **kwargs) -> None:
+    transaction.on_commit(bump_events_generation)
+
+
+@receiver(post_save, sender=User, dispatch_uid="events_invalidate_on_user_save")
+def invalidate_on_organizer_save(sender, instance: User, created: bool, update_fields=None, **kwargs) -> None:
+    if created:
+        return
+    if update_fields is not None and not set(update_fields) & {"email", *ORGANIZER_SEARCH_FIELDS}:
+        return
+    transaction.on_commit(bump_events_generation)
+
+
+@receiver(post_delete, sender=User, dispatch_uid="events_invalidate_on_user_delete")
+def invalidate_on_user_delete(sender, instance: User, **kwargs) -> None:
+    transaction.on_commit(bump_events_generation)
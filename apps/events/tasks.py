@@ -1,7 +1,114 @@
+import uuid
+from smtplib import SMTPException
 from celery import shared_task
-from apps.events.services.registration_email import send_registration_confirmation_email
+from celery.exceptions import Ignore
+from django.conf import settings
+from apps.events.services.feed import prune_upcoming_events as prune_upcoming_event_rows
+from apps.events.services.registration_email import (
+    send_registration_confirmation_email,
+    send_registration_confirmation_emails,
+)
 
 
 @shared_task(name="send_registration_email")
 def send_registration_email(user_id: int, event_id: int) -> None:
     send_registration_confirmation_email(user_id, event_id)
+
+
+@shared_task(name="send_registration_emails")
+def send_registration_emails(event_id: int, user_ids: list[int]) -> int:
+    return send_registration_confirmation_emails(user_ids, event_id)
+
+
+def queue_registration_emails(event_id: int, user_ids: list[int]) -> None:
+    chunk_size = getattr(settings, "REGISTRATION_EMAIL_CHUNK_SIZE", 500)
+    for start in range(0, len(user_ids), chunk_size):
+        send_registration_emails.delay(event_id, user_ids[start : start + chunk_size])
+
+
+@shared_task(name="promote_waitlist")
+def promote_waitlist(event_id: int) -> int:
+    # imported here: the waitlist service imports this module to queue emails
+    from apps.events.services.waitlist import promote_waitlist as promote_waitlisted_users
+
+    return len(promote_waitlisted_users(event_id))
+
+
+def queue_waitlist_promotion(event_id: int) -> None:
+    promote_waitlist.delay(event_id)
+
+
+@shared_task(name="prune_upcoming_events")
+def prune_upcoming_events() -> int:
+    return prune_upcoming_event_rows()
+
+
+@shared_task(name="schedule_event_reminders")
+def schedule_event_reminders() -> int:
+    # imported here: the reminders service imports this module to queue its fan-out
+    from apps.events.services.reminders import schedule_due_reminders
+
+    return len(schedule_due_reminders())
+
+
+@shared_task(name="fan_out_event_reminders")
+def fan_out_event_reminders(event_id: int) -> int:
+    from apps.events.services.reminders import fan_out_reminders
+
+    return fan_out_reminders(event_id)
+
+
+def queue_event_reminder_fan_outs(event_ids: list[int]) -> None:
+    for event_id in event_ids:
+        fan_out_event_reminders.delay(event_id)
+
+
+# SMTP errors roll back the failed batch, so a retry resumes with the messages that were not marked sent
+@shared_task(
+    name="send_event_reminders",
+    autoretry_for=(SMTPException, OSError),
+    retry_backoff=True,
+    max_retries=5,
+)
+def send_event_reminders(event_id: int, after_id: int, up_to_id: int) -> int:
+    from apps.events.services.reminders import send_reminder_range
+
+    return send_reminder_range(event_id, after_id, up_to_id)
+
+
+def queue_event_reminders(event_id: int, after_id: int, up_to_id: int) -> None:
+    send_event_reminders.delay(event_id, after_id, up_to_id)
+
+
+# the job reports its own states; STARTED would replace the stored progress (and its owner) with worker details
+@shared_task(bind=True, name="process_participants_job", track_started=False)
+def process_participants_job(self, progress: dict, participant_ids: list[int]) -> dict:
+    # imported here: the registration service imports this module to queue emails
+    from apps.events.services.participant_jobs import JOB_FAILED, JOB_PROGRESS, run_participants_job
+
+    try:
+        return run_participants_job(
+            progress, participant_ids, report=lambda current: self.update_state(state=JOB_PROGRESS, meta=current)
+        )
+    except Exception as exc:
+        self.update_state(state=JOB_FAILED, meta={**progress, "error": f"{type(exc).__name__}: {exc}"})
+        raise Ignore() from exc
+
+
+def queue_participants_job(
+    event_id: int, operation: str, participant_ids: list[int], user_id: int, *, waitlist: bool = False
+) -> dict:
+    """Stores the job as queued in the Celery result backend and hands it to a worker; returns its progress."""
+    from apps.events.services.participant_jobs import JOB_QUEUED, new_job_progress
+
+    job_id = str(uuid.uuid4())
+    progress = new_job_progress(job_id, event_id, operation, participant_ids, user_id, waitlist=waitlist)
+    process_participants_job.backend.store_result(job_id, progress, JOB_QUEUED)
+    process_participants_job.apply_async((progress, participant_ids), task_id=job_id)
+    return progress
+
+
+def get_participants_job(job_id: str) -> tuple[str, object]:
+    """State and stored progress (or exception) of a job; PENDING means unknown or expired."""
+    result = process_participants_job.AsyncResult(job_id)
+    return result.state, result.info
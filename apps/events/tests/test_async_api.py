@@ -0,0 +1,79 @@
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.events.factories import EventFactory
+from apps.events.models import EventRegistration
+from apps.users.factories import UserFactory
+
+
+class AsyncReadApiTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = UserFactory()
+        self.headers = {"Authorization": f"Bearer {RefreshToken.for_user(self.user).access_token}"}
+        self.event = EventFactory(organizer=self.user)
+        EventFactory.create_batch(2)
+        for participant in UserFactory.create_batch(3):
+            EventRegistration.objects.create(event=self.event, participant=participant)
+
+    async def assert_same_as_sync(self, async_url: str, sync_url: str, params: dict | None = None) -> None:
+        async_res = await self.async_client.get(async_url, params or {}, headers=self.headers)
+        sync_res = await sync_to_async(self.client.get)(sync_url, params or {}, headers=self.headers)
+        self.assertEqual(async_res.status_code, status.HTTP_200_OK)
+        self.assertEqual(sync_res.status_code, status.HTTP_200_OK)
+        self.assertEqual(async_res.content.replace(b"/api/async/", b"/api/"), sync_res.content)
+
+    async def test_requires_authentication(self) -> None:
+        res = await self.async_client.get(reverse("events-async:events-list"))
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("WWW-Authenticate", res.headers)
+
+        res = await self.async_client.get(
+            reverse("users-async:all-users-list"), headers={"Authorization": "Bearer broken"}
+        )
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(res.json()["code"], "token_not_valid")
+
+    async def test_rejects_unsafe_methods(self) -> None:
+        res = await self.async_client.post(reverse("events-async:events-list"), headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    async def test_list_matches_sync_endpoint(self) -> None:
+        cases = ({}, {"limit": 1, "offset": 1}, {"organizer": self.user.id}, {"pagination": "cursor", "limit": 2})
+        for params in cases:
+            with self.subTest(params=params):
+                await self.assert_same_as_sync(
+                    reverse("events-async:events-list"), reverse("events:events-list"), params
+                )
+
+    async def test_list_is_cached_with_etag(self) -> None:
+        url = reverse("events-async:events-list")
+        res = await self.async_client.get(url, headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        res = await self.async_client.get(url, headers={**self.headers, "If-None-Match": res["ETag"]})
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_retrieve_and_participants_match_sync_endpoints(self) -> None:
+        cases = (
+            ("events-async:events-detail", "events:events-detail", {}),
+            ("events-async:events-participants", "events:events-participants", {}),
+            ("events-async:events-participants", "events:events-participants", {"pagination": "cursor", "limit": 2}),
+        )
+        for async_name, sync_name, params in cases:
+            with self.subTest(name=async_name, params=params):
+                await self.assert_same_as_sync(
+                    reverse(async_name, args=[self.event.id]), reverse(sync_name, args=[self.event.id]), params
+                )
+
+        res = await self.async_client.get(reverse("events-async:events-detail", args=[0]), headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_users_match_sync_endpoints(self) -> None:
+        await self.assert_same_as_sync(reverse("users-async:all-users-list"), reverse("users:all-users-list"))
+        await self.assert_same_as_sync(
+            reverse("users-async:all-users-detail", args=[self.user.id]),
+            reverse("users:all-users-detail", args=[self.user.id]),
+        )
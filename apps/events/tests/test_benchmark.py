@@ -0,0 +1,95 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from django.core.management import call_command
+from django.test import LiveServerTestCase, TestCase
+from apps.events.benchmarking import percentile
+from apps.events.factories import EventFactory
+from apps.events.models import Event, EventRegistration
+from apps.users.factories import UserFactory
+
+
+class BenchmarkCommandTests(TestCase):
+    def test_percentile_uses_nearest_rank(self) -> None:
+        values = [float(v) for v in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 99), 0.0)
+
+    def test_benchmark_api_seeds_and_writes_report(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "bench.json"
+            call_command(
+                "benchmark_api",
+                users=5,
+                events=4,
+                registrations=10,
+                iterations=2,
+                warmup=0,
+                output=str(output),
+                stdout=StringIO(),
+            )
+            report = json.loads(output.read_text())
+        self.assertEqual(Event.objects.count(), 4)
+        self.assertEqual(Event.objects.filter(search_vector__isnull=True).count(), 0)
+        self.assertEqual(
+            sum(Event.objects.values_list("participants_count", flat=True)), EventRegistration.objects.count()
+        )
+        self.assertEqual(
+            set(report["results"]), {"list", "search", "retrieve", "participants", "register", "unregister"}
+        )
+        for name, summary in report["results"].items():
+            self.assertEqual(summary["iterations"], 2)
+            self.assertGreater(summary["queries"]["max"], 0, name)
+            self.assertTrue(all(code.startswith("2") for code in summary["statuses"]), (name, summary["statuses"]))
+
+    def test_benchmark_emails_writes_report(self) -> None:
+        EventFactory()
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "bench.json"
+            call_command(
+                "benchmark_emails", iterations=3, warmup=0, recipients=2, output=str(output), stdout=StringIO()
+            )
+            report = json.loads(output.read_text())
+        self.assertEqual(set(report["results"]), {"f-string", "templates", "cached"})
+        self.assertTrue(all(summary["iterations"] == 3 for summary in report["results"].values()))
+
+    def test_benchmark_connections_reuses_connections(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "bench.json"
+            call_command(
+                "benchmark_connections",
+                modes=["per-request", "persistent"],
+                iterations=5,
+                warmup=0,
+                output=str(output),
+                stdout=StringIO(),
+            )
+            report = json.loads(output.read_text())
+        self.assertGreater(report["meta"]["backend_connections"]["per-request"], 1)
+        self.assertEqual(report["meta"]["backend_connections"]["persistent"], 1)
+        self.assertEqual(report["results"]["persistent"]["iterations"], 5)
+
+
+class AsgiBenchmarkCommandTests(LiveServerTestCase):
+    def test_benchmark_asgi_loads_both_paths(self) -> None:
+        user = UserFactory()
+        event = EventFactory(organizer=user)
+        EventRegistration.objects.create(event=event, participant=user)
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "bench.json"
+            # the test server is WSGI-only, but it serves the async views too, which is enough for a smoke test
+            call_command(
+                "benchmark_asgi",
+                wsgi_url=self.live_server_url,
+                asgi_url=self.live_server_url,
+                requests=4,
+                concurrency=2,
+                output=str(output),
+                stdout=StringIO(),
+            )
+            report = json.loads(output.read_text())
+        self.assertEqual(len(report["results"]), 8)
+        for name, summary in report["results"].items():
+            self.assertEqual(summary["statuses"], {"200": 4}, name)
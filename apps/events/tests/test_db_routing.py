@@ -0,0 +1,66 @@
+from datetime import timedelta
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.events.caching import bump_events_generation
+from apps.events.factories import EventFactory
+from apps.events.models import Event
+from apps.users.factories import UserFactory
+from event_management.db_routing import PrimaryReplicaRouter, replica_reads_enabled
+
+
+# the replica alias points at the primary, so the test only observes where reads are routed
+@override_settings(DATABASE_REPLICAS=("default",))
+@patch("event_management.db_routing.pick_replica", return_value="default")
+class ReplicaRoutingTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(self.user)
+        EventFactory()
+
+    def test_router_uses_replicas_only_when_enabled(self, mock_pick) -> None:
+        router = PrimaryReplicaRouter()
+        self.assertEqual(router.db_for_read(Event), "default")
+        token = replica_reads_enabled.set(True)
+        try:
+            router.db_for_read(Event)
+            self.assertEqual(router.db_for_write(Event), "default")
+        finally:
+            replica_reads_enabled.reset(token)
+        self.assertEqual(mock_pick.call_count, 1)
+        self.assertFalse(router.allow_migrate("replica1", "events"))
+
+    def test_reads_go_to_replicas_until_the_user_writes(self, mock_pick) -> None:
+        users_url = reverse("users:all-users-list")
+        self.assertEqual(self.client.get(users_url).status_code, status.HTTP_200_OK)
+        self.assertTrue(mock_pick.called)
+        self.assertFalse(replica_reads_enabled.get())
+
+        payload = {"title": "Conf", "date": (timezone.now() + timedelta(days=1)).isoformat(), "location": "Kyiv"}
+        res = self.client.post(reverse("events:events-list"), payload, format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        mock_pick.reset_mock()
+        self.client.get(users_url)
+        self.assertFalse(mock_pick.called)
+
+        self.client.force_authenticate(UserFactory())
+        self.client.get(users_url)
+        self.assertTrue(mock_pick.called)
+
+    def test_replica_pages_are_not_cached_right_after_a_write(self, mock_pick) -> None:
+        url = reverse("events:events-list")
+        bump_events_generation()
+        self.client.get(url)
+        replica_queries = mock_pick.call_count
+        self.client.get(url)
+        self.assertEqual(mock_pick.call_count, 2 * replica_queries)
+        mock_pick.reset_mock()
+        with self.settings(DATABASE_REPLICA_STICKY_SECONDS=-1):
+            self.client.get(url)
+            self.client.get(url)
+        self.assertEqual(mock_pick.call_count, replica_queries)
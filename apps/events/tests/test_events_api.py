@@ -1,16 +1,28 @@
+import csv
+import json
 from datetime import timedelta
+from io import StringIO
 from unittest.mock import patch
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 from apps.events.factories import EventFactory
-from apps.events.models import Event, EventRegistration
+from apps.events.models import Event, EventRegistration, EventWaitlistEntry, UpcomingEvent
+from apps.events.services.feed import refresh_upcoming_events
 from apps.users.factories import UserFactory
 
 
 class EventApiTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
     def authenticate(self, user=None) -> None:
         if user is None:
             user = UserFactory()
@@ -46,9 +58,8 @@ class EventApiTests(APITestCase):
         event = Event.objects.get(id=res.data["id"])
         self.assertEqual(event.organizer_id, self._auth_user.id)
 
-    @patch("apps.events.views.send_registration_email")
+    @patch("apps.events.services.registration.queue_registration_emails")
     def test_register_and_unregister_participants(self, mock_task) -> None:
-        mock_task.delay.return_value = None
         self.authenticate()
         event = EventFactory(organizer=self._auth_user)
         users = UserFactory.create_batch(3)
@@ -72,3 +83,599 @@ class EventApiTests(APITestCase):
         res4 = self.client.get(participants_url)
         self.assertEqual(res4.status_code, status.HTTP_200_OK)
         self.assertTrue(isinstance(res4.data, list) or "results" in res4.data)
+
+    def test_list_keyset_pagination_walks_all_events_without_count(self) -> None:
+        self.authenticate()
+        events = EventFactory.create_batch(5)
+        url = reverse("events:events-list")
+        res = self.client.get(url, {"pagination": "cursor", "limit": 2})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", res.data)
+        seen_ids = [item["id"] for item in res.data["results"]]
+        while res.data["next"]:
+            res = self.client.get(res.data["next"])
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            seen_ids.extend(item["id"] for item in res.data["results"])
+        self.assertEqual(seen_ids, [event.id for event in events])
+
+    def test_list_keyset_pagination_rejects_invalid_cursor(self) -> None:
+        self.authenticate()
+        url = reverse("events:events-list")
+        res = self.client.get(url, {"cursor": "not-a-cursor"})
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_participants_keyset_pagination(self) -> None:
+        self.authenticate()
+        event = EventFactory()
+        users = UserFactory.create_batch(3)
+        for user in users:
+            EventRegistration.objects.create(event=event, participant=user)
+        url = reverse("events:events-participants", args=[event.id])
+        res = self.client.get(url, {"pagination": "cursor", "limit": 2})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["id"] for item in res.data["results"]], [users[0].id, users[1].id])
+        res2 = self.client.get(res.data["next"])
+        self.assertEqual([item["id"] for item in res2.data["results"]], [users[2].id])
+        self.assertIsNone(res2.data["next"])
+
+    def test_participants_page_over_registrations_without_count(self) -> None:
+        self.authenticate()
+        event = EventFactory()
+        users = UserFactory.create_batch(3)
+        for user in users:
+            EventRegistration.objects.create(event=event, participant=user)
+        Event.objects.filter(pk=event.pk).update(participants_count=3)
+        url = reverse("events:events-participants", args=[event.id])
+        self.client.get(url)  # warm the authentication cache
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url, {"limit": 2})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 2)  # event + one page of registrations joined to users
+        self.assertFalse([q for q in queries if "DISTINCT" in q["sql"] or "COUNT(" in q["sql"]])
+        self.assertEqual(res.data["count"], 3)
+        self.assertEqual([item["id"] for item in res.data["results"]], [users[0].id, users[1].id])
+        self.assertEqual(set(res.data["results"][0]), {"id", "username", "email", "registered_at"})
+
+        res = self.client.get(url, {"ids_only": "true", "pagination": "cursor"})
+        self.assertEqual(res.data["results"], [user.id for user in users])
+
+    def test_search_matches_event_fields_and_organizer_prefixes(self) -> None:
+        self.authenticate()
+        organizer = UserFactory(username="jazzorganizer", first_name="Miles")
+        jazz = EventFactory(title="Summer Jazz Night", organizer=organizer, location="Lviv")
+        EventFactory(title="Chess Club", location="Kyiv")
+        url = reverse("events:events-list")
+        for term in ("jazz", "summ nig", "jazzorg", "miles", "lviv"):
+            res = self.client.get(url, {"search": term})
+            self.assertEqual([item["id"] for item in res.data["results"]], [jazz.id], term)
+
+    def test_search_follows_organizer_rename(self) -> None:
+        self.authenticate()
+        organizer = UserFactory(username="before_rename")
+        event = EventFactory(organizer=organizer)
+        organizer.username = "afterwards"
+        organizer.save()
+        res = self.client.get(reverse("events:events-list"), {"search": "afterwards"})
+        self.assertEqual([item["id"] for item in res.data["results"]], [event.id])
+
+    def test_search_relevance_ordering(self) -> None:
+        self.authenticate()
+        weak = EventFactory(title="Meetup", description="with a short talk on rust")
+        strong = EventFactory(title="Rust Conference", description="rust rust")
+        res = self.client.get(reverse("events:events-list"), {"search": "rust", "ordering": "relevance"})
+        self.assertEqual([item["id"] for item in res.data["results"]], [strong.id, weak.id])
+
+    @patch("apps.events.services.registration.queue_registration_emails")
+    def test_register_and_unregister_maintain_participants_count(self, mock_task) -> None:
+        self.authenticate()
+        event = EventFactory()
+        users = UserFactory.create_batch(3)
+        register_url = reverse("events:events-register", args=[event.id])
+        self.client.post(register_url, {"participant_ids": [u.id for u in users]}, format="json")
+        self.client.post(register_url, {"participant_ids": [users[0].id]}, format="json")
+        res = self.client.get(reverse("events:events-detail", args=[event.id]))
+        self.assertEqual(res.data["participants_count"], 3)
+        unregister_url = reverse("events:events-unregister", args=[event.id])
+        self.client.post(unregister_url, {"participant_ids": [users[0].id, users[1].id]}, format="json")
+        event.refresh_from_db()
+        self.assertEqual(event.participants_count, 1)
+
+    @patch("apps.events.services.registration.queue_registration_emails")
+    def test_register_rejects_over_capacity(self, mock_task) -> None:
+        self.authenticate()
+        event = EventFactory(capacity=2)
+        users = UserFactory.create_batch(3)
+        register_url = reverse("events:events-register", args=[event.id])
+        res = self.client.post(register_url, {"participant_ids": [u.id for u in users]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(EventRegistration.objects.filter(event=event).exists())
+        event.refresh_from_db()
+        self.assertEqual(event.participants_count, 0)
+
+    def test_rebuild_participants_count_command_fixes_drift(self) -> None:
+        event = EventFactory()
+        EventRegistration.objects.create(event=event, participant=UserFactory())
+        Event.objects.filter(pk=event.pk).update(participants_count=7)
+        out = StringIO()
+        call_command("rebuild_participants_count", stdout=out)
+        event.refresh_from_db()
+        self.assertEqual(event.participants_count, 1)
+        self.assertIn("fixed: 1", out.getvalue())
+
+    def test_list_is_served_from_cache_and_honours_if_none_match(self) -> None:
+        self.authenticate()
+        EventFactory.create_batch(2)
+        url = reverse("events:events-list")
+        first = self.client.get(url)
+        self.assertIn("ETag", first)
+        with self.assertNumQueries(0):  # the user comes from the authentication cache too
+            cached = self.client.get(url)
+        self.assertEqual(cached.data, first.data)
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @override_settings(ALLOWED_HOSTS=["testserver", "api.example.com"])
+    def test_cached_responses_are_kept_per_host_and_scheme(self) -> None:
+        self.authenticate()
+        EventFactory()
+        url = reverse("events:events-list")
+        etags = {
+            self.client.get(url)["ETag"],
+            self.client.get(url, HTTP_HOST="api.example.com")["ETag"],
+            self.client.get(url, HTTP_HOST="api.example.com", secure=True)["ETag"],
+        }
+        self.assertEqual(len(etags), 3)
+
+    def test_event_write_invalidates_cached_responses(self) -> None:
+        self.authenticate()
+        event = EventFactory(title="Old title")
+        detail_url = reverse("events:events-detail", args=[event.id])
+        first = self.client.get(detail_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.patch(detail_url, {"title": "New title"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        second = self.client.get(detail_url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data["title"], "New title")
+
+    def test_organizer_rename_invalidates_cached_responses(self) -> None:
+        self.authenticate()
+        event = EventFactory()
+        detail_url = reverse("events:events-detail", args=[event.id])
+        self.client.get(detail_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            event.organizer.username = "renamed_organizer"
+            event.organizer.save()
+        res = self.client.get(detail_url)
+        self.assertEqual(res.data["organizer"]["username"], "renamed_organizer")
+
+    def test_export_streams_filtered_events_as_ndjson(self) -> None:
+        self.authenticate()
+        organizer = UserFactory()
+        events = EventFactory.create_batch(3, organizer=organizer)
+        EventFactory()
+        res = self.client.get(reverse("events:events-export"), {"organizer": organizer.id})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in b"".join(res.streaming_content).decode().splitlines()]
+        self.assertEqual([row["id"] for row in rows], [event.id for event in events])
+        self.assertEqual(rows[0]["organizer_username"], organizer.username)
+
+    def test_export_registrations_as_csv(self) -> None:
+        self.authenticate()
+        event = EventFactory()
+        users = UserFactory.create_batch(2)
+        for user in users:
+            EventRegistration.objects.create(event=event, participant=user)
+        url = reverse("events:events-export-registrations", args=[event.id])
+        res = self.client.get(url, {"export_format": "csv"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        rows = list(csv.reader(b"".join(res.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[0][:3], ["id", "event_id", "participant_id"])
+        self.assertEqual([int(row[2]) for row in rows[1:]], [user.id for user in users])
+
+    def test_csv_export_neutralizes_formulas(self) -> None:
+        self.authenticate()
+        organizer = UserFactory()
+        event = EventFactory(
+            organizer=organizer, title='=HYPERLINK("http://example.com")', location="-2+3", description="ok"
+        )
+        res = self.client.get(reverse("events:events-export"), {"organizer": organizer.id, "export_format": "csv"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        header, row = csv.reader(b"".join(res.streaming_content).decode().splitlines())
+        values = dict(zip(header, row))
+        self.assertEqual(values["title"], "'" + event.title)
+        self.assertEqual(values["location"], "'-2+3")
+        self.assertEqual(values["description"], "ok")
+
+    def test_export_rejects_unknown_format(self) -> None:
+        self.authenticate()
+        res = self.client.get(reverse("events:events-export"), {"export_format": "xml"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def bulk_event_payload(self, title: str) -> dict:
+        return {"title": title, "date": (timezone.now() + timedelta(days=3)).isoformat(), "location": "Kyiv"}
+
+    def test_bulk_create_is_all_or_nothing_by_default(self) -> None:
+        self.authenticate()
+        url = reverse("events:events-bulk")
+        items = [self.bulk_event_payload("Bulk A"), {"title": "No date"}]
+        res = self.client.post(url, {"items": items}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data["failed"], 1)
+        self.assertEqual(res.data["results"][0]["index"], 1)
+        self.assertFalse(Event.objects.exists())
+
+    def test_bulk_create_partial_success(self) -> None:
+        self.authenticate()
+        url = reverse("events:events-bulk")
+        items = [self.bulk_event_payload("Bulk Jazz"), {"title": "No date"}, self.bulk_event_payload("Bulk B")]
+        res = self.client.post(url, {"items": items, "atomic": False}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual([item["status"] for item in res.data["results"]], ["created", "error", "created"])
+        created = Event.objects.get(pk=res.data["results"][0]["id"])
+        self.assertEqual(created.organizer_id, self._auth_user.id)
+        search = self.client.get(reverse("events:events-list"), {"search": "jazz"})
+        self.assertEqual([item["id"] for item in search.data["results"]], [created.id])
+
+    def test_bulk_update_and_delete(self) -> None:
+        self.authenticate()
+        events = EventFactory.create_batch(2)
+        url = reverse("events:events-bulk")
+        items = [{"id": events[0].id, "title": "Renamed"}, {"id": events[1].id, "location": "Odesa"}]
+        res = self.client.patch(url, {"items": items}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(Event.objects.get(pk=events[0].id).title, "Renamed")
+        self.assertEqual(Event.objects.get(pk=events[1].id).location, "Odesa")
+        res2 = self.client.delete(url, {"ids": [events[0].id, 999999]}, format="json")
+        self.assertEqual(res2.status_code, status.HTTP_400_BAD_REQUEST)
+        res3 = self.client.delete(url, {"ids": [events[0].id, 999999], "atomic": False}, format="json")
+        self.assertEqual(res3.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(list(Event.objects.values_list("id", flat=True)), [events[1].id])
+
+    def test_capacity_below_participants_count_needs_the_waitlist(self) -> None:
+        self.authenticate()
+        event = EventFactory(capacity=5, participants_count=3)
+        detail_url = reverse("events:events-detail", args=[event.id])
+        res = self.client.patch(detail_url, {"capacity": 2}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("capacity", res.data)
+        items = [{"id": event.id, "capacity": 2}]
+        res = self.client.patch(reverse("events:events-bulk"), {"items": items}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("capacity", res.data["results"][0]["errors"])
+        event.refresh_from_db()
+        self.assertEqual(event.capacity, 5)
+
+        res = self.client.patch(detail_url, {"capacity": 2, "waitlist_enabled": True}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["capacity"], 2)
+
+    def test_bulk_update_reports_invalid_and_repeated_ids(self) -> None:
+        self.authenticate()
+        event = EventFactory(title="Original")
+        url = reverse("events:events-bulk")
+        items = [
+            {"id": [event.id], "title": "List"},
+            {"id": True, "title": "Bool"},
+            {"id": event.id, "title": "First"},
+            {"id": event.id, "title": "Repeated"},
+        ]
+        res = self.client.patch(url, {"items": items}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([item["status"] for item in res.data["results"]], ["error", "error", "error"])
+        self.assertEqual([item["index"] for item in res.data["results"]], [0, 1, 3])
+        self.assertEqual(Event.objects.get(pk=event.id).title, "Original")
+        res = self.client.patch(url, {"items": items, "atomic": False}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual([item["status"] for item in res.data["results"]], ["error", "error", "updated", "error"])
+        self.assertEqual(Event.objects.get(pk=event.id).title, "First")
+
+    @patch("apps.events.services.registration.queue_registration_emails")
+    def test_register_reports_missing_users_without_writing(self, mock_queue) -> None:
+        self.authenticate()
+        event = EventFactory()
+        user = UserFactory()
+        register_url = reverse("events:events-register", args=[event.id])
+        res = self.client.post(register_url, {"participant_ids": [user.id, 999999]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("999999", str(res.data["participant_ids"]))
+        self.assertFalse(EventRegistration.objects.filter(event=event).exists())
+
+    def test_participant_ids_validation(self) -> None:
+        self.authenticate()
+        event = EventFactory()
+        user = UserFactory()
+        unregister_url = reverse("events:events-unregister", args=[event.id])
+        res = self.client.post(unregister_url, {"participant_ids": [user.id, "x", 0, True, 2**63]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("[1, 2, 3, 4]", str(res.data["participant_ids"]))
+        with self.settings(EVENTS_PARTICIPANTS_MAX_IDS=2):
+            res = self.client.post(unregister_url, {"participant_ids": [user.id] * 3}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        res = self.client.post(unregister_url, {"participant_ids": [str(user.id), user.id]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["not_found_ids"], [user.id])
+
+    @patch("apps.events.services.registration.queue_registration_emails")
+    def test_large_id_batches_use_one_array_parameter(self, mock_queue) -> None:
+        self.authenticate()
+        event = EventFactory()
+        users = UserFactory.create_batch(3)
+        ids = [u.id for u in users]
+        self.client.post(reverse("events:events-register", args=[event.id]), {"participant_ids": ids}, format="json")
+        unregister_url = reverse("events:events-unregister", args=[event.id])
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(unregister_url, {"participant_ids": ids[:2] + [ids[2]] * 20_000}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["deleted_ids"], ids)
+        sql = [q["sql"] for q in queries if "= ANY(" in q["sql"]]
+        self.assertEqual(len(sql), 2)  # user existence check and DELETE ... RETURNING
+        self.assertFalse([q for q in queries if " IN (" in q["sql"]])
+        event.refresh_from_db()
+        self.assertEqual(event.participants_count, 0)
+
+    @patch("apps.events.services.registration.queue_registration_emails")
+    def test_register_with_idempotency_key_replays_stored_result(self, mock_queue) -> None:
+        self.authenticate()
+        event = EventFactory()
+        users = UserFactory.create_batch(2)
+        register_url = reverse("events:events-register", args=[event.id])
+        payload = {"participant_ids": [u.id for u in users]}
+        first = self.client.post(register_url, payload, format="json", HTTP_IDEMPOTENCY_KEY="retry-1")
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        retry = self.client.post(register_url, payload, format="json", HTTP_IDEMPOTENCY_KEY="retry-1")
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        reused = self.client.post(
+            register_url, {"participant_ids": [users[0].id]}, format="json", HTTP_IDEMPOTENCY_KEY="retry-1"
+        )
+        self.assertEqual(reused.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        event.refresh_from_db()
+        self.assertEqual(event.participants_count, 2)
+
+    @patch("apps.events.services.registration.queue_registration_emails")
+    def test_idempotency_key_stored_while_acquiring_the_lock_is_replayed(self, mock_queue) -> None:
+        self.authenticate()
+        event = EventFactory()
+        register_url = reverse("events:events-register", args=[event.id])
+        payload = {"participant_ids": [UserFactory().id]}
+        first = self.client.post(register_url, payload, format="json", HTTP_IDEMPOTENCY_KEY="retry-2")
+        # the retry's first read misses, as if it ran just before the first request stored its response
+        real_get, reads = cache.get, []
+
+        def racing_get(key, *args, **kwargs):
+            if key.startswith("idempotency:"):
+                reads.append(key)
+                if len(reads) == 1:
+                    return None
+            return real_get(key, *args, **kwargs)
+
+        with patch("apps.events.idempotency.cache.get", side_effect=racing_get):
+            retry = self.client.post(register_url, payload, format="json", HTTP_IDEMPOTENCY_KEY="retry-2")
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(len(reads), 2)
+
+    def test_my_events_filters_by_date_and_pages_by_keyset(self) -> None:
+        self.authenticate()
+        now = timezone.now()
+        past = [EventFactory(organizer=self._auth_user, date=now - timedelta(days=d)) for d in (1, 2)]
+        upcoming = [EventFactory(organizer=self._auth_user, date=now + timedelta(days=d)) for d in (1, 2, 3)]
+        EventFactory(date=now + timedelta(days=1))  # someone else's
+        url = reverse("users:my-events")
+
+        res = self.client.get(url, {"upcoming": "true", "limit": 2})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", res.data)
+        seen = [item["id"] for item in res.data["results"]]
+        res = self.client.get(res.data["next"])
+        seen += [item["id"] for item in res.data["results"]]
+        self.assertIsNone(res.data["next"])
+        self.assertEqual(seen, [event.id for event in upcoming])
+
+        res = self.client.get(url, {"upcoming": "false"})
+        self.assertEqual([item["id"] for item in res.data["results"]], [event.id for event in past])
+
+    def test_my_registrations_lists_events_most_recent_first(self) -> None:
+        self.authenticate()
+        now = timezone.now()
+        past_event = EventFactory(date=now - timedelta(days=1))
+        upcoming_events = EventFactory.create_batch(2, date=now + timedelta(days=1))
+        for event in (past_event, *upcoming_events):
+            EventRegistration.objects.create(event=event, participant=self._auth_user)
+        EventRegistration.objects.create(event=past_event, participant=UserFactory())
+        url = reverse("users:my-registrations")
+
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["event"]["id"] for item in res.data["results"]],
+            [upcoming_events[1].id, upcoming_events[0].id, past_event.id],
+        )
+        self.assertIn("registered_at", res.data["results"][0])
+        res = self.client.get(url, {"upcoming": "false"})
+        self.assertEqual([item["event"]["id"] for item in res.data["results"]], [past_event.id])
+
+    def test_list_filters_by_date_range_upcoming_and_location(self) -> None:
+        self.authenticate()
+        now = timezone.now()
+        march = EventFactory(date=now + timedelta(days=30), location="  Lviv ")
+        april = EventFactory(date=now + timedelta(days=60), location="Kyiv")
+        past = EventFactory(date=now - timedelta(days=30), location="lviv")
+        url = reverse("events:events-list")
+
+        def ids(params: dict) -> set[int]:
+            res = self.client.get(url, params)
+            self.assertEqual(res.status_code, status.HTTP_200_OK, res.data)
+            return {item["id"] for item in res.data["results"]}
+
+        window = {
+            "date_after": (now + timedelta(days=29)).isoformat(),
+            "date_before": (now + timedelta(days=31)).isoformat(),
+        }
+        self.assertEqual(ids(window), {march.id})
+        self.assertEqual(ids({"upcoming": "true"}), {march.id, april.id})
+        self.assertEqual(ids({"upcoming": "false"}), {past.id})
+        self.assertEqual(ids({"location": "LVIV "}), {march.id, past.id})
+        self.assertEqual(ids({"location_exact": "lviv"}), {past.id})
+        self.assertEqual(ids({"location": "lviv", "upcoming": "true"}), {march.id})
+        res = self.client.get(url, {"date_after": "not-a-date"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(EVENTS_PARTICIPANTS_JOB_CHUNK_SIZE=2)
+    @patch("apps.events.services.registration.queue_registration_emails")
+    def test_register_and_unregister_jobs_report_progress(self, mock_queue) -> None:
+        self.authenticate()
+        event = EventFactory(capacity=3)
+        users = UserFactory.create_batch(5)
+        ids = [u.id for u in users]
+        EventRegistration.objects.create(event=event, participant=users[0])
+        event.participants_count = 1
+        event.save(update_fields=["participants_count"])
+
+        res = self.client.post(
+            reverse("events:events-register", args=[event.id]),
+            {"participant_ids": ids + [999999], "job": True},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        status_url = reverse("events:events-jobs", kwargs={"job_id": res.data["job_id"]})
+        self.assertEqual(res["Location"], status_url)
+        job = self.client.get(status_url).data
+        self.assertEqual(job["status"], "succeeded")
+        self.assertEqual((job["processed"], job["total"], job["chunks_done"]), (6, 6, 3))
+        self.assertEqual(job["created_ids"], [ids[1], ids[4]])
+        self.assertEqual(job["already_registered_ids"], [ids[0]])
+        # the second chunk would overbook the event and is skipped as a whole, unknown users are skipped alone
+        self.assertEqual(job["capacity_exceeded_ids"], ids[2:4])
+        self.assertEqual(job["not_found_ids"], [999999])
+
+        res = self.client.post(
+            reverse("events:events-unregister", args=[event.id]), {"participant_ids": ids, "job": True}, format="json"
+        )
+        job = self.client.get(reverse("events:events-jobs", kwargs={"job_id": res.data["job_id"]})).data
+        self.assertEqual(job["deleted_ids"], [ids[0], ids[1], ids[4]])
+        self.assertEqual(job["not_found_ids"], ids[2:4])
+        event.refresh_from_db()
+        self.assertEqual(event.participants_count, 0)
+
+        self.authenticate()  # someone else
+        self.assertEqual(self.client.get(status_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(EVENTS_WAITLIST_PROMOTION_BATCH_SIZE=1)
+    @patch("apps.events.services.waitlist.queue_registration_emails")
+    @patch("apps.events.services.registration.queue_registration_emails")
+    def test_waitlist_fills_capacity_and_promotes_in_arrival_order(self, mock_queue, mock_promoted) -> None:
+        self.authenticate()
+        event = EventFactory(capacity=2, waitlist_enabled=True)
+        ids = [u.id for u in UserFactory.create_batch(5)]
+        register_url = reverse("events:events-register", args=[event.id])
+
+        res = self.client.post(register_url, {"participant_ids": ids[:3]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((res.data["created_ids"], res.data["waitlisted_ids"]), (ids[:2], [ids[2]]))
+        # the event is full: no seat is claimed, everyone queues behind the earlier arrival
+        res = self.client.post(register_url, {"participant_ids": [ids[4], ids[3], ids[0]]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["waitlisted_ids"], [ids[3], ids[4]])
+        self.assertEqual(res.data["already_registered_ids"], [ids[0]])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(
+                reverse("events:events-unregister", args=[event.id]),
+                {"participant_ids": [ids[0], ids[1], ids[4]]},
+                format="json",
+            )
+        self.assertEqual((res.data["deleted_ids"], res.data["left_waitlist_ids"]), (ids[:2], [ids[4]]))
+        self.assertEqual(
+            set(EventRegistration.objects.filter(event=event).values_list("participant_id", flat=True)),
+            {ids[2], ids[3]},
+        )
+        self.assertEqual(
+            [call.args for call in mock_promoted.call_args_list], [(event.id, [ids[2]]), (event.id, [ids[3]])]
+        )
+        self.assertFalse(event.waitlist_entries.exists())
+        event.refresh_from_db()
+        self.assertEqual(event.participants_count, 2)
+
+        # without a waitlist the capacity is still enforced all-or-nothing
+        self.client.patch(reverse("events:events-detail", args=[event.id]), {"waitlist_enabled": False}, format="json")
+        res = self.client.post(register_url, {"participant_ids": [ids[4]]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("apps.events.services.registration.queue_registration_emails")
+    def test_upcoming_feed_follows_events_registrations_and_organizers(self, mock_queue) -> None:
+        self.authenticate()
+        now = timezone.now()
+        later = EventFactory(date=now + timedelta(days=3))
+        sooner = EventFactory(date=now + timedelta(days=1))
+        EventFactory(date=now - timedelta(days=1))
+        url = reverse("events:events-upcoming")
+
+        res = self.client.get(url, {"limit": 1})
+        self.assertEqual([item["id"] for item in res.data["results"]], [sooner.id])
+        self.assertEqual(res.data["results"][0]["organizer"]["username"], sooner.organizer.username)
+        res = self.client.get(res.data["next"])
+        self.assertEqual([item["id"] for item in res.data["results"]], [later.id])
+        self.assertIsNone(res.data["next"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("events:events-register", args=[later.id]),
+                {"participant_ids": [self._auth_user.id]},
+                format="json",
+            )
+        later.organizer.username = "renamed_organizer"
+        later.organizer.save()
+        later.date = now + timedelta(hours=1)
+        later.save()
+        res = self.client.get(url)
+        first = res.data["results"][0]
+        self.assertEqual((first["id"], first["participants_count"]), (later.id, 1))
+        self.assertEqual(first["organizer"]["username"], "renamed_organizer")
+
+        later.date = now - timedelta(hours=1)
+        later.save()
+        res = self.client.get(url)
+        self.assertEqual([item["id"] for item in res.data["results"]], [sooner.id])
+
+    def test_feed_rows_written_from_a_newer_snapshot_are_kept(self) -> None:
+        event = EventFactory()
+        feed_row = UpcomingEvent.objects.filter(event=event)
+        # as if a refresh that started later than the next one had already written its values
+        feed_row.update(participants_count=7, refreshed_at=timezone.now() + timedelta(minutes=1))
+        refresh_upcoming_events([event.id])
+        self.assertEqual(feed_row.get().participants_count, 7)
+        feed_row.update(refreshed_at=timezone.now() - timedelta(minutes=1))
+        refresh_upcoming_events([event.id])
+        self.assertEqual(feed_row.get().participants_count, 0)
+
+    @patch("apps.events.services.waitlist.queue_registration_emails")
+    def test_waitlist_with_free_seats_is_promoted(self, mock_promoted) -> None:
+        self.authenticate()
+        event = EventFactory(capacity=1, waitlist_enabled=True)
+        waiting, newcomer, third = UserFactory.create_batch(3)
+        # left behind by a promotion that ran before this entry committed: a seat is free, yet someone waits
+        EventWaitlistEntry.objects.create(event=event, participant=waiting)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(
+                reverse("events:events-register", args=[event.id]), {"participant_ids": [newcomer.id]}, format="json"
+            )
+        self.assertEqual(res.data["waitlisted_ids"], [newcomer.id])
+        self.assertEqual(list(event.registrations.values_list("participant_id", flat=True)), [waiting.id])
+        self.assertEqual(list(event.waitlist_entries.values_list("participant_id", flat=True)), [newcomer.id])
+
+        # seats added through the bulk endpoint are offered to the waitlist too
+        EventWaitlistEntry.objects.create(event=event, participant=third)
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.patch(
+                reverse("events:events-bulk"), {"items": [{"id": event.id, "capacity": 3}]}, format="json"
+            )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(event.waitlist_entries.exists())
+        event.refresh_from_db()
+        self.assertEqual(event.participants_count, 3)
@@ -0,0 +1,76 @@
+import re
+import time
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.events.factories import EventFactory
+from apps.users.factories import UserFactory
+from event_management.metrics import request_metrics
+
+
+class RequestMetricsTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        request_metrics.reset()
+        self.user = UserFactory()
+        self.client.force_authenticate(self.user)
+        self.event = EventFactory(organizer=self.user)
+
+    def test_server_timing_header(self) -> None:
+        res = self.client.get(reverse("events:events-detail", args=[self.event.id]))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        match = re.fullmatch(
+            r'db;dur=[\d.]+;desc="(\d+) queries", serialize;dur=[\d.]+, total;dur=[\d.]+', res["Server-Timing"]
+        )
+        self.assertIsNotNone(match)
+        self.assertGreater(int(match[1]), 0)
+
+    def test_serializer_data_counts_as_serialization_time(self) -> None:
+        def slow_representation(instance) -> dict:
+            time.sleep(0.05)
+            return {"id": instance.id}
+
+        with patch("apps.events.serializers.EventSerializer.to_representation", side_effect=slow_representation):
+            res = self.client.get(reverse("events:events-detail", args=[self.event.id]))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        serialize_ms = float(re.search(r"serialize;dur=([\d.]+)", res["Server-Timing"])[1])
+        self.assertGreaterEqual(serialize_ms, 50)
+
+    def test_async_views_are_measured(self) -> None:
+        headers = {"Authorization": f"Bearer {RefreshToken.for_user(self.user).access_token}"}
+        res = self.client.get(reverse("events-async:events-detail", args=[self.event.id]), headers=headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertRegex(res["Server-Timing"], r'^db;dur=[\d.]+;desc="[1-9]\d* queries"')
+
+    def test_metrics_are_aggregated_per_view(self) -> None:
+        for _ in range(2):
+            self.client.get(reverse("events:events-list"))
+        self.client.get(reverse("events:events-detail", args=[0]))
+
+        res = self.client.get(reverse("metrics"))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        body = res.content.decode()
+        self.assertIn('http_request_duration_seconds_count{view="EventViewSet.list",method="GET",status="200"} 2', body)
+        self.assertIn('http_request_db_queries_count{view="EventViewSet.retrieve",method="GET",status="404"} 1', body)
+        self.assertRegex(
+            body, r'http_response_size_bytes_total\{view="EventViewSet.list",method="GET",status="200"} [1-9]'
+        )
+
+    def test_metrics_endpoint_is_local_only(self) -> None:
+        res = self.client.get(reverse("metrics"), REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(REQUEST_QUERY_BUDGET=0)
+    def test_query_budget_warning(self) -> None:
+        with self.assertLogs("event_management.middleware", "WARNING") as logs:
+            self.client.get(reverse("events:events-list"))
+        self.assertIn("EventViewSet.list", logs.output[0])
+        res = self.client.get(reverse("metrics"))
+        self.assertIn(
+            'http_request_query_budget_exceeded_total{view="EventViewSet.list",method="GET",status="200"} 1',
+            res.content.decode(),
+        )
@@ -0,0 +1,54 @@
+from unittest.mock import patch
+from django.core import mail
+from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
+from apps.events.factories import EventFactory
+from apps.events.services.registration_email import send_registration_confirmation_emails
+from apps.events.tasks import queue_registration_emails
+from apps.users.factories import UserFactory
+
+
+class RegistrationEmailTests(TestCase):
+    def test_bulk_send_loads_users_and_event_once(self) -> None:
+        event = EventFactory()
+        users = UserFactory.create_batch(5)
+        UserFactory(email="")
+        with self.assertNumQueries(2):
+            sent = send_registration_confirmation_emails([u.id for u in users], event.id, batch_size=2)
+        self.assertEqual(sent, 5)
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), sorted(u.email for u in users))
+        self.assertTrue(all(event.title in m.subject for m in mail.outbox))
+
+    def test_email_has_text_and_html_parts_rendered_once_per_event(self) -> None:
+        event = EventFactory(title="Rock & Roll")
+        users = [UserFactory(username="o'neil"), UserFactory()]
+        with patch("apps.events.services.mail.render_to_string", wraps=render_to_string) as mock_render:
+            send_registration_confirmation_emails([u.id for u in users], event.id)
+            send_registration_confirmation_emails([users[0].id], event.id)
+        self.assertEqual(mock_render.call_count, 1)
+        message = next(m for m in mail.outbox if m.to == [users[0].email])
+        self.assertEqual(message.subject, "Registration confirmed: Rock & Roll")
+        self.assertTrue(message.body.startswith("Hi o'neil,\n\nYou are registered for 'Rock & Roll'"))
+        html, mimetype = message.alternatives[0]
+        self.assertEqual(mimetype, "text/html")
+        self.assertIn("Hi o&#x27;neil,", html)
+        self.assertIn("Rock &amp; Roll", html)
+
+        event.title = "Jazz night"
+        event.save()
+        send_registration_confirmation_emails([users[1].id], event.id)
+        self.assertEqual(mail.outbox[-1].subject, "Registration confirmed: Jazz night")
+
+    def test_bulk_send_for_missing_event(self) -> None:
+        user = UserFactory()
+        self.assertEqual(send_registration_confirmation_emails([user.id], 0), 0)
+        self.assertEqual(mail.outbox, [])
+
+    @override_settings(REGISTRATION_EMAIL_CHUNK_SIZE=2)
+    @patch("apps.events.tasks.send_registration_emails")
+    def test_queue_registration_emails_chunks_ids(self, mock_task) -> None:
+        queue_registration_emails(7, [1, 2, 3, 4, 5])
+        self.assertEqual(
+            [call.args for call in mock_task.delay.call_args_list],
+            [(7, [1, 2]), (7, [3, 4]), (7, [5])],
+        )
@@ -0,0 +1,82 @@
+from datetime import timedelta
+from smtplib import SMTPException
+from unittest.mock import patch
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from apps.events.factories import EventFactory
+from apps.events.models import EventRegistration, EventReminderDelivery
+from apps.events.serializers import EventSerializer
+from apps.events.services.reminders import MAX_PARTICIPANT_ID, send_reminder_range
+from apps.events.tasks import schedule_event_reminders
+from apps.users.factories import UserFactory
+
+
+@override_settings(EVENT_REMINDER_LEAD_HOURS=24, EVENT_REMINDER_CHUNK_SIZE=2, EVENT_REMINDER_BATCH_SIZE=2)
+class EventReminderTests(TestCase):
+    def register(self, event, *users) -> None:
+        EventRegistration.objects.bulk_create(EventRegistration(event=event, participant=user) for user in users)
+
+    def test_due_events_are_reminded_once_per_registrant(self) -> None:
+        now = timezone.now()
+        due = EventFactory(date=now + timedelta(hours=2))
+        later = EventFactory(date=now + timedelta(hours=30))
+        started = EventFactory(date=now - timedelta(hours=1))
+        users = UserFactory.create_batch(3)
+        self.register(due, *users, UserFactory(email=""))
+        self.register(later, users[0])
+        self.register(started, users[0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(schedule_event_reminders.delay().get(), 1)
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), sorted(u.email for u in users))
+        self.assertTrue(all(due.title in m.subject for m in mail.outbox))
+        self.assertEqual(EventReminderDelivery.objects.filter(event=due, sent_at__isnull=False).count(), 3)
+        due.refresh_from_db()
+        self.assertIsNotNone(due.reminders_queued_at)
+
+        # reruns of the scheduler or of a chunk only reach registrants who were not reminded yet
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(schedule_event_reminders.delay().get(), 0)
+        self.assertEqual(send_reminder_range(due.id, 0, MAX_PARTICIPANT_ID), 0)
+        newcomer = UserFactory()
+        self.register(due, newcomer)
+        self.assertEqual(send_reminder_range(due.id, 0, MAX_PARTICIPANT_ID), 1)
+        self.assertEqual(len(mail.outbox), 4)
+
+    def test_failed_batch_stays_pending(self) -> None:
+        event = EventFactory(date=timezone.now() + timedelta(hours=2))
+        self.register(event, *UserFactory.create_batch(3))
+        with patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=SMTPException):
+            with self.assertRaises(SMTPException):
+                send_reminder_range(event.id, 0, MAX_PARTICIPANT_ID)
+        self.assertFalse(EventReminderDelivery.objects.filter(event=event, sent_at__isnull=False).exists())
+        self.assertEqual(send_reminder_range(event.id, 0, MAX_PARTICIPANT_ID), 3)
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_rescheduled_event_is_reminded_of_the_new_date(self) -> None:
+        now = timezone.now()
+        event = EventFactory(date=now + timedelta(hours=2))
+        self.register(event, UserFactory())
+        with self.captureOnCommitCallbacks(execute=True):
+            schedule_event_reminders.delay()
+        self.assertEqual(len(mail.outbox), 1)
+
+        def reschedule(date) -> None:
+            serializer = EventSerializer(event, data={"date": date.isoformat()}, partial=True)
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        # postponed beyond the lead time: nothing is due, and a chunk queued for the old date sends nothing
+        reschedule(now + timedelta(hours=48))
+        event.refresh_from_db()
+        self.assertIsNone(event.reminders_queued_at)
+        self.assertFalse(event.reminder_deliveries.exists())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(schedule_event_reminders.delay().get(), 0)
+        self.assertEqual(send_reminder_range(event.id, 0, MAX_PARTICIPANT_ID), 0)
+
+        reschedule(now + timedelta(hours=5))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(schedule_event_reminders.delay().get(), 1)
+        self.assertEqual(len(mail.outbox), 2)
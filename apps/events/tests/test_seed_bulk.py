@@ -0,0 +1,53 @@
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase
+from apps.events.management.commands.seed_bulk import copy_escape, zipf_counts
+from apps.events.models import Event, EventRegistration
+from apps.users.factories import UserFactory
+
+
+User = get_user_model()
+
+
+class SeedBulkCommandTests(TestCase):
+    def index_names(self) -> set[str]:
+        tables = [model._meta.db_table for model in (User, Event, EventRegistration)]
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT indexname FROM pg_indexes WHERE tablename = ANY(%s)", [tables])
+            indexes = {row[0] for row in cursor.fetchall()}
+            cursor.execute("SELECT conname FROM pg_constraint WHERE conrelid::regclass::text = ANY(%s)", [tables])
+            return indexes | {row[0] for row in cursor.fetchall()}
+
+    def test_zipf_counts_respect_total_and_cap(self) -> None:
+        counts = zipf_counts(1000, 50, 1.1, 40)
+        self.assertEqual(sum(counts), 1000)
+        self.assertLessEqual(max(counts), 40)
+        self.assertEqual(sum(zipf_counts(10_000, 3, 1.1, 5)), 15)
+
+    def test_copy_escape(self) -> None:
+        self.assertEqual(copy_escape(None), "\\N")
+        self.assertEqual(copy_escape(True), "t")
+        self.assertEqual(copy_escape("a\tb\\c\n"), "a\\tb\\\\c\\n")
+
+    def test_seed_bulk_loads_consistent_data_and_restores_indexes(self) -> None:
+        UserFactory(username="existing")
+        indexes_before = self.index_names()
+        call_command(
+            "seed_bulk", users=30, events=20, registrations=150, chunk_size=40, random_seed=1, stdout=StringIO()
+        )
+        self.assertEqual(self.index_names(), indexes_before)
+        self.assertEqual(User.objects.count(), 31)
+        self.assertEqual(Event.objects.count(), 20)
+        self.assertEqual(EventRegistration.objects.count(), 150)
+        counted = dict(
+            EventRegistration.objects.values("event").annotate(total=Count("id")).values_list("event", "total")
+        )
+        for event in Event.objects.all():
+            self.assertEqual(event.participants_count, counted.get(event.id, 0))
+            self.assertIsNotNone(event.search_vector)
+        seeded = User.objects.exclude(username="existing").first()
+        self.assertTrue(seeded.check_password("password123"))
+        self.assertTrue(UserFactory(username="after_seed").pk > seeded.pk)
@@ -0,0 +1,59 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from apps.events.factories import EventFactory
+from apps.events.models import Event, EventRegistration
+from apps.events.serializers import EventSerializer, MyRegistrationSerializer, ParticipantSerializer
+from apps.users.factories import UserFactory
+from event_management.renderers import ORJSONRenderer
+from event_management.serializers import CompiledListSerializer
+
+
+class CompiledListSerializerTests(TestCase):
+    def setUp(self) -> None:
+        organizer = UserFactory(username="Zoë")
+        EventFactory(organizer=organizer, title="Line\u2028separator\u2029", description="", location="Kraków")
+        EventFactory(organizer=organizer, date=timezone.now().replace(microsecond=0))
+        event = EventFactory(title='"quoted" \\ \t\n', date=datetime(2030, 1, 1, 12, tzinfo=UTC))
+        for participant in UserFactory.create_batch(2):
+            EventRegistration.objects.create(event=event, participant=participant)
+
+    def assert_same_bytes(self, serializer_class: type[serializers.ModelSerializer], instances: list) -> None:
+        self.assertIs(serializer_class(instances, many=True).__class__, CompiledListSerializer)
+        expected = JSONRenderer().render(serializers.ListSerializer(instances, child=serializer_class()).data)
+        self.assertEqual(ORJSONRenderer().render(serializer_class(instances, many=True).data), expected)
+
+    def test_output_matches_drf(self) -> None:
+        registrations = EventRegistration.objects.select_related("participant", "event__organizer")
+        for tz in ("UTC", "Europe/Warsaw", "America/St_Johns"):
+            with self.subTest(timezone=tz), timezone.override(tz):
+                self.assert_same_bytes(EventSerializer, list(Event.objects.select_related("organizer")))
+                self.assert_same_bytes(ParticipantSerializer, list(registrations))
+                self.assert_same_bytes(MyRegistrationSerializer, list(registrations))
+
+    def test_querysets_and_managers(self) -> None:
+        event = Event.objects.filter(registrations__isnull=False).first()
+        data = ParticipantSerializer(event.registrations, many=True).data
+        self.assertEqual(data, serializers.ListSerializer(event.registrations, child=ParticipantSerializer()).data)
+        self.assertEqual(len(data), 2)
+
+
+class ORJSONRendererTests(TestCase):
+    def test_matches_drf_renderer(self) -> None:
+        now = timezone.now()
+        payloads = (
+            {"date": now, "day": now.date(), "time": now.time(), "delta": timedelta(seconds=90)},
+            {"uuid": uuid.uuid4(), "price": Decimal("1.50"), "text": "é \x00", "nested": [1, None, True]},
+            {1: "non-string key", "big": 2**70},
+            [],
+        )
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                self.assertEqual(ORJSONRenderer().render(payload), JSONRenderer().render(payload))
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+        indented = ORJSONRenderer().render({"a": 1}, "application/json; indent=2")
+        self.assertEqual(indented, JSONRenderer().render({"a": 1}, "application/json; indent=2"))
@@ -1,89 +1,248 @@
-from django.contrib.auth import get_user_model
 from django.db import transaction
-from rest_framework import viewsets, status
+from django.db.models import QuerySet
+from django.http import Http404, StreamingHttpResponse
+from django.urls import reverse
+from rest_framework import generics, viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
 from rest_framework.request import Request
 from rest_framework.response import Response
-from apps.events.filters import EventFilter
+from apps.events.caching import CachedResponseMixin
+from apps.events.filters import EventFilter, MyEventFilter, MyRegistrationFilter
+from apps.events.idempotency import idempotent
 from apps.events.models import Event, EventRegistration
-from apps.events.serializers import EventSerializer, BulkParticipantsSerializer
-from apps.users.serializers import UserShortSerializer
-from apps.events.tasks import send_registration_email
+from apps.events.pagination import (
+    EventDateKeysetPagination,
+    EventKeysetPagination,
+    KnownCountLimitOffsetPagination,
+    RecentRegistrationKeysetPagination,
+    RegistrationKeysetPagination,
+    UpcomingEventKeysetPagination,
+    is_keyset_requested,
+)
+from apps.events.serializers import (
+    BulkEventsDeleteSerializer,
+    BulkEventsSerializer,
+    BulkParticipantsSerializer,
+    EventSerializer,
+    ExportFormatSerializer,
+    MyRegistrationSerializer,
+    ParticipantSerializer,
+    ParticipantsQuerySerializer,
+    RegisterParticipantsSerializer,
+    UpcomingEventSerializer,
+)
+from apps.events.services.bulk import BulkResult, bulk_create_events, bulk_delete_events, bulk_update_events
+from apps.events.services.export import export_events, export_registrations
+from apps.events.services.feed import get_upcoming_events
+from apps.events.services.participant_jobs import JOB_QUEUED, job_representation
+from apps.events.services.participants import CapacityExceeded, get_event_participants
+from apps.events.services.registration import ParticipantsNotFound, register_participants, unregister_participants
+from apps.events.tasks import get_participants_job, queue_participants_job, queue_waitlist_promotion
+from event_management.db_routing import ReplicaReadMixin
 
 
-User = get_user_model()
-
-
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(ReplicaReadMixin, CachedResponseMixin, viewsets.ModelViewSet):
     queryset = Event.objects.select_related("organizer")
     filterset_class = EventFilter
 
     def get_serializer_class(self):
         match self.action:
             case "participants":
-                return UserShortSerializer
-            case "register" | "unregister":
+                return ParticipantSerializer
+            case "register":
+                return RegisterParticipantsSerializer
+            case "unregister":
                 return BulkParticipantsSerializer
+            case "export" | "export_registrations":
+                return ExportFormatSerializer
+            case "bulk":
+                return BulkEventsDeleteSerializer if self.request.method == "DELETE" else BulkEventsSerializer
+            case "upcoming":
+                return UpcomingEventSerializer
             case _:
                 return EventSerializer
 
+    @property
+    def paginator(self) -> BasePagination | None:
+        if not hasattr(self, "_paginator"):
+            keyset = is_keyset_requested(getattr(self, "request", None))
+            if self.action == "participants":
+                self._paginator = RegistrationKeysetPagination() if keyset else KnownCountLimitOffsetPagination()
+            elif self.action == "upcoming":
+                self._paginator = UpcomingEventKeysetPagination()
+            elif keyset:
+                self._paginator = EventKeysetPagination()
+        return super().paginator
+
     def perform_create(self, serializer: EventSerializer) -> None:
         serializer.save(organizer=self.request.user)
 
+    def perform_update(self, serializer: EventSerializer) -> None:
+        previous_capacity = serializer.instance.capacity
+        event = serializer.save()
+        if event.waitlist_enabled and event.capacity != previous_capacity:
+            # a larger capacity frees seats for waiting users
+            transaction.on_commit(lambda: queue_waitlist_promotion(event.id))
+
     @action(detail=True, methods=["post"])
+    @idempotent("register")
     def register(self, request: Request, pk: int | None = None) -> Response:
         event: Event = self.get_object()
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        participant_ids: list[int] = serializer.validated_data["participant_ids"]
-        already_registered_ids: set[int] = set(
-            EventRegistration.objects.filter(event=event, participant_id__in=participant_ids).values_list(
-                "participant_id", flat=True
+        if serializer.validated_data["job"]:
+            return self.start_participants_job(event, "register", serializer.validated_data["participant_ids"])
+        try:
+            outcome = register_participants(
+                event.id, serializer.validated_data["participant_ids"], waitlist=event.waitlist_enabled
             )
-        )
-        to_create_ids: list[int] = [uid for uid in participant_ids if uid not in already_registered_ids]
-        if to_create_ids:
-            EventRegistration.objects.bulk_create(
-                [EventRegistration(event=event, participant_id=uid) for uid in to_create_ids], ignore_conflicts=True
-            )
-            transaction.on_commit(lambda: [send_registration_email.delay(uid, event.id) for uid in to_create_ids])
+        except ParticipantsNotFound as exc:
+            raise ValidationError({"participant_ids": f"Users not found: {exc.missing_ids}"})
+        except CapacityExceeded:
+            raise ValidationError({"participant_ids": "Event capacity exceeded."})
         return Response(
             {
                 "event_id": event.id,
-                "created_ids": to_create_ids,
-                "already_registered_ids": sorted(already_registered_ids),
-                "created_count": len(to_create_ids),
+                "created_ids": outcome.created_ids,
+                "already_registered_ids": outcome.already_registered_ids,
+                "waitlisted_ids": outcome.waitlisted_ids,
+                "created_count": len(outcome.created_ids),
             },
-            status=status.HTTP_201_CREATED if to_create_ids else status.HTTP_200_OK,
+            status=status.HTTP_201_CREATED if outcome.created_ids else status.HTTP_200_OK,
         )
 
     @action(detail=True, methods=["post"])
+    @idempotent("unregister")
     def unregister(self, request: Request, pk: int | None = None) -> Response:
         event: Event = self.get_object()
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        participant_ids: list[int] = serializer.validated_data["participant_ids"]
-        qs = EventRegistration.objects.filter(event=event, participant_id__in=participant_ids)
-        existing_ids: set[int] = set(qs.values_list("participant_id", flat=True))
-        deleted_count, _ = qs.delete()
-        not_found_ids = sorted(set(participant_ids) - existing_ids)
+        if serializer.validated_data["job"]:
+            return self.start_participants_job(event, "unregister", serializer.validated_data["participant_ids"])
+        outcome = unregister_participants(
+            event.id, serializer.validated_data["participant_ids"], waitlist=event.waitlist_enabled
+        )
         return Response(
             {
                 "event_id": event.id,
-                "deleted_ids": sorted(existing_ids),
-                "not_found_ids": not_found_ids,
-                "deleted_count": deleted_count,
+                "deleted_ids": outcome.deleted_ids,
+                "not_found_ids": outcome.not_found_ids,
+                "left_waitlist_ids": outcome.left_waitlist_ids,
+                "deleted_count": len(outcome.deleted_ids),
             },
             status=status.HTTP_200_OK,
         )
 
+    def start_participants_job(self, event: Event, operation: str, participant_ids: list[int]) -> Response:
+        progress = queue_participants_job(
+            event.id, operation, participant_ids, self.request.user.pk, waitlist=event.waitlist_enabled
+        )
+        location = reverse("events:events-jobs", kwargs={"job_id": progress["job_id"]})
+        return Response(
+            job_representation(JOB_QUEUED, progress) | {"status_url": self.request.build_absolute_uri(location)},
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": location},
+        )
+
+    @action(detail=False, methods=["get"], url_path=r"jobs/(?P<job_id>[0-9a-f-]{36})")
+    def jobs(self, request: Request, job_id: str) -> Response:
+        """Progress and partial results of a register/unregister job, visible to the user who started it."""
+        state, info = get_participants_job(job_id)
+        if state == "PENDING" or (isinstance(info, dict) and info.get("requested_by") != request.user.pk):
+            raise Http404
+        return Response(job_representation(state, info))
+
     @action(detail=True, methods=["get"])
     def participants(self, request: Request, pk: int | None = None) -> Response:
         event: Event = self.get_object()
-        users_qs = User.objects.filter(event_registrations__event=event).distinct()
-        page = self.paginate_queryset(users_qs)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True, context={"request": request})
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(users_qs, many=True, context={"request": request})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        params = ParticipantsQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        ids_only: bool = params.validated_data["ids_only"]
+        if isinstance(self.paginator, KnownCountLimitOffsetPagination):
+            # the maintained counter replaces a COUNT(*) over the registrations
+            self.paginator.known_count = event.participants_count
+        page = self.paginate_queryset(get_event_participants(event.id, ids_only=ids_only))
+        if ids_only:
+            return self.get_paginated_response([registration.participant_id for registration in page])
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    @action(detail=False, methods=["get"])
+    def upcoming(self, request: Request) -> Response:
+        """Events that have not started yet, soonest first, read from the precomputed feed table."""
+        page = self.paginate_queryset(get_upcoming_events())
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        queryset = self.filter_queryset(self.get_queryset())
+        return export_events(queryset, serializer.validated_data["export_format"])
+
+    @action(detail=True, methods=["get"], url_path="registrations/export")
+    def export_registrations(self, request: Request, pk: int | None = None) -> StreamingHttpResponse:
+        event: Event = self.get_object()
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return export_registrations(event, serializer.validated_data["export_format"])
+
+    @action(detail=False, methods=["post", "patch", "delete"])
+    def bulk(self, request: Request) -> Response:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        atomic: bool = serializer.validated_data["atomic"]
+        match request.method:
+            case "POST":
+                result = bulk_create_events(serializer.validated_data["items"], request.user, atomic=atomic)
+                success_status = status.HTTP_201_CREATED
+            case "PATCH":
+                result = bulk_update_events(serializer.validated_data["items"], atomic=atomic)
+                success_status = status.HTTP_200_OK
+            case _:
+                result = bulk_delete_events(serializer.validated_data["ids"], atomic=atomic)
+                success_status = status.HTTP_200_OK
+        return Response(
+            {"results": result.results, "succeeded": result.succeeded, "failed": result.failed},
+            status=self.get_bulk_status(result, success_status),
+        )
+
+    @staticmethod
+    def get_bulk_status(result: BulkResult, success_status: int) -> int:
+        if not result.failed:
+            return success_status
+        return status.HTTP_207_MULTI_STATUS if result.written else status.HTTP_400_BAD_REQUEST
+
+
+class MyEventsView(generics.ListAPIView):
+    """Events organized by the current user, soonest first (`?upcoming=false`: most recent past first)."""
+
+    serializer_class = EventSerializer
+    filterset_class = MyEventFilter
+    pagination_class = EventDateKeysetPagination
+
+    def get_queryset(self) -> QuerySet[Event]:
+        if getattr(self, "swagger_fake_view", False):
+            return Event.objects.none()
+        return self.request.user.organized_events.select_related("organizer")
+
+    @property
+    def paginator(self) -> EventDateKeysetPagination:
+        paginator = super().paginator
+        if self.request.query_params.get("upcoming", "").lower() in ("false", "0"):
+            paginator.ordering = ("-date", "-id")
+        return paginator
+
+
+class MyRegistrationsView(generics.ListAPIView):
+    """Registrations of the current user with their events, most recent first."""
+
+    serializer_class = MyRegistrationSerializer
+    filterset_class = MyRegistrationFilter
+    pagination_class = RecentRegistrationKeysetPagination
+
+    def get_queryset(self) -> QuerySet[EventRegistration]:
+        if getattr(self, "swagger_fake_view", False):
+            return EventRegistration.objects.none()
+        return self.request.user.event_registrations.select_related("event__organizer")
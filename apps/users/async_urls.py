@@ -0,0 +1,9 @@
+from django.urls import path
+from apps.users import async_views
+
+app_name = "users-async"
+
+urlpatterns = [
+    path("all/", async_views.user_list, name="all-users-list"),
+    path("all/<int:pk>/", async_views.user_detail, name="all-users-detail"),
+]
@@ -0,0 +1,25 @@
+"""Native async versions of the read-only `UserViewSet` endpoints, served under `/api/async/users/`."""
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.shortcuts import aget_object_or_404
+from rest_framework.request import Request
+from apps.users.serializers import UserShortSerializer
+from event_management.async_api import AsyncLimitOffsetPagination, async_api_view, render_response
+
+
+User = get_user_model()
+
+
+@async_api_view
+async def user_list(request: Request) -> HttpResponse:
+    paginator = AsyncLimitOffsetPagination()
+    page = await paginator.apaginate_queryset(User.objects.all(), request)
+    data = UserShortSerializer(page, many=True, context={"request": request}).data
+    return render_response(paginator.get_paginated_data(data))
+
+
+@async_api_view
+async def user_detail(request: Request, pk: int) -> HttpResponse:
+    user = await aget_object_or_404(User, pk=pk)
+    return render_response(UserShortSerializer(user, context={"request": request}).data)
@@ -0,0 +1,233 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import AuthUser, JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+USER_CACHE_KEY = "auth:user:{}"
+# bumped on every invalidation; entries stored under an older version are ignored
+USER_CACHE_VERSION_KEY = "auth:user-version:{}"
+# the non-secret user fields requests read (organizer payloads, permission checks); request.user loads any other
+# field from the database when read
+AUTH_USER_FIELDS = ("id", "username", "email", "is_active", "is_staff", "is_superuser")
+
+
+def normalize_user_id(user_id: Any) -> str:
+    # tokens carry the id claim as a string, model instances as an int
+    return str(user_id)
+
+
+class LocalUserCache:
+    """
+    Per-process LRU of user cache entries with a per-entry TTL. It cannot be invalidated from other processes, so
+    its TTL (`AUTH_USER_LOCAL_CACHE_TIMEOUT`) bounds how long another worker may keep serving a stale user.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: Any) -> Any:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return entry[1]
+
+    def set(self, user_id: Any, entry: Any) -> None:
+        timeout = getattr(settings, "AUTH_USER_LOCAL_CACHE_TIMEOUT", 30)
+        max_size = getattr(settings, "AUTH_USER_LOCAL_CACHE_SIZE", 10_000)
+        if timeout <= 0 or max_size <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + timeout, entry)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, user_id: Any) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+local_user_cache = LocalUserCache()
+
+
+def _version_key(user_id: str) -> str:
+    return USER_CACHE_VERSION_KEY.format(user_id)
+
+
+def build_user_cache_entry(user: AuthUser, version: int) -> dict:
+    """
+    What requests need from a user: the fields in AUTH_USER_FIELDS and a digest of the password for the revoke
+    claim, never the hash itself. `version` is the user's cache version read before the row was loaded.
+    """
+    return {
+        "version": version,
+        "fields": {name: getattr(user, name) for name in AUTH_USER_FIELDS},
+        "password_hash": get_md5_hash_password(user.password),
+    }
+
+
+def user_from_cache_entry(entry: dict) -> AuthUser:
+    # a fresh instance per request; the other fields are deferred and loaded from the database on first access
+    model = get_user_model()
+    fields = entry["fields"]
+    names = [field.attname for field in model._meta.concrete_fields if field.attname in fields]
+    user = model.from_db(DEFAULT_DB_ALIAS, names, [fields[name] for name in names])
+    user._auth_password_hash = entry["password_hash"]
+    return user
+
+
+def _current_entry(values: dict, user_id: str) -> tuple[dict | None, int]:
+    version = values.get(_version_key(user_id), 0)
+    entry = values.get(USER_CACHE_KEY.format(user_id))
+    if entry is None or entry["version"] != version:
+        return None, version
+    return entry, version
+
+
+def lookup_cached_user(user_id: Any) -> tuple[AuthUser | None, int]:
+    """
+    The cached user, if any, and the user's cache version. A miss must be stored with `cache_user` under that
+    version, so an entry loaded before a concurrent invalidation is ignored instead of served.
+    """
+    user_id = normalize_user_id(user_id)
+    entry = local_user_cache.get(user_id)
+    if entry is not None:
+        return user_from_cache_entry(entry), entry["version"]
+    values = cache.get_many([USER_CACHE_KEY.format(user_id), _version_key(user_id)])
+    entry, version = _current_entry(values, user_id)
+    if entry is None:
+        return None, version
+    local_user_cache.set(user_id, entry)
+    return user_from_cache_entry(entry), version
+
+
+async def alookup_cached_user(user_id: Any) -> tuple[AuthUser | None, int]:
+    user_id = normalize_user_id(user_id)
+    entry = local_user_cache.get(user_id)
+    if entry is not None:
+        return user_from_cache_entry(entry), entry["version"]
+    values = await cache.aget_many([USER_CACHE_KEY.format(user_id), _version_key(user_id)])
+    entry, version = _current_entry(values, user_id)
+    if entry is None:
+        return None, version
+    local_user_cache.set(user_id, entry)
+    return user_from_cache_entry(entry), version
+
+
+def get_cached_user(user_id: Any) -> AuthUser | None:
+    return lookup_cached_user(user_id)[0]
+
+
+def cache_user(user_id: Any, user: AuthUser, version: int) -> None:
+    # only the shared tier: the local one is filled from entries that passed the version check
+    entry = build_user_cache_entry(user, version)
+    timeout = getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 300)
+    cache.set(USER_CACHE_KEY.format(normalize_user_id(user_id)), entry, timeout=timeout)
+
+
+async def acache_user(user_id: Any, user: AuthUser, version: int) -> None:
+    entry = build_user_cache_entry(user, version)
+    timeout = getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 300)
+    await cache.aset(USER_CACHE_KEY.format(normalize_user_id(user_id)), entry, timeout=timeout)
+
+
+def invalidate_cached_user(user_id: Any) -> None:
+    user_id = normalize_user_id(user_id)
+    local_user_cache.delete(user_id)
+    try:
+        cache.incr(_version_key(user_id))
+    except ValueError:
+        cache.set(_version_key(user_id), 1, timeout=None)
+    cache.delete(USER_CACHE_KEY.format(user_id))
+
+
+def password_hash(user: AuthUser) -> str:
+    # users built from a cache entry carry the digest; their password field is deferred
+    cached = getattr(user, "_auth_password_hash", None)
+    return cached if cached is not None else get_md5_hash_password(user.password)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    `JWTAuthentication` that resolves users from the per-process LRU, then the shared cache (Redis), and only
+    then from Postgres. Entries are dropped when a user is saved or deleted and when they log out.
+    """
+
+    def get_user(self, validated_token: Token) -> AuthUser:
+        user_id = self.get_user_id(validated_token)
+        user, version = lookup_cached_user(user_id)
+        if user is None:
+            try:
+                user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist as e:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+            cache_user(user_id, user, version)
+        self.check_user(user, validated_token)
+        return user
+
+    @staticmethod
+    def get_user_id(validated_token: Token) -> Any:
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+    @staticmethod
+    def check_user(user: AuthUser, validated_token: Token) -> None:
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != password_hash(user):
+            raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+
+class AsyncJWTAuthentication(CachedJWTAuthentication):
+    """
+    `CachedJWTAuthentication` for async views: token validation is CPU-only, the user is loaded with `aget`,
+    so no worker thread is blocked on the database.
+    """
+
+    async def aauthenticate(self, request: HttpRequest) -> tuple[AuthUser, Token] | None:
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token: Token) -> AuthUser:
+        user_id = self.get_user_id(validated_token)
+        user, version = await alookup_cached_user(user_id)
+        if user is None:
+            try:
+                user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist as e:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+            await acache_user(user_id, user, version)
+        self.check_user(user, validated_token)
+        return user
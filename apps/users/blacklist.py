@@ -0,0 +1,137 @@
+import hashlib
+import math
+import threading
+import time
+from collections.abc import Iterable
+from datetime import datetime
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+RECENT_BLACKLIST_KEY = "auth:blacklist:{}"
+# `(built_at, BloomFilter)` written by the `rebuild_token_blacklist_filter` beat task and read by every process
+BLACKLIST_FILTER_KEY = "auth:blacklist-filter"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over one blake2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], capacity: int, error_rate: float) -> "BloomFilter":
+        bloom = cls(capacity, error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class TokenBlacklist:
+    """
+    Membership test for blacklisted token ids that rarely touches Postgres.
+
+    A Bloom filter over all unexpired blacklisted tokens is built every `TOKEN_BLACKLIST_FILTER_REFRESH` seconds
+    by the `rebuild_token_blacklist_filter` beat task and shared through the cache; each process re-reads it at
+    most once per interval, so the request path never scans the blacklist. Tokens blacklisted since the filter
+    was built are kept as expiring keys in the shared cache (Redis). Only filter hits (a real entry or a false
+    positive) are confirmed in the database, as is every lookup while no recent enough filter exists.
+    """
+
+    def __init__(self) -> None:
+        self._shared: tuple[float, BloomFilter] | None = None
+        self._fetched_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def refresh_interval(self) -> int:
+        return getattr(settings, "TOKEN_BLACKLIST_FILTER_REFRESH", 300)
+
+    @property
+    def max_filter_age(self) -> int:
+        # a build interval, one missed build and a process re-read; older filters are not trusted
+        return 3 * self.refresh_interval
+
+    def contains(self, jti: str) -> bool:
+        if cache.get(RECENT_BLACKLIST_KEY.format(jti)) is not None:
+            return True
+        bloom = self.get_filter()
+        if bloom is not None and jti not in bloom:
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        # the recent tier must outlive the oldest filter still in use, so that no entry falls between the tiers
+        timeout = min(self.max_filter_age, math.ceil((expires_at - timezone.now()).total_seconds()))
+        if timeout > 0:
+            cache.set(RECENT_BLACKLIST_KEY.format(jti), 1, timeout=timeout)
+        if self._shared is not None:
+            self._shared[1].add(jti)
+
+    def get_filter(self) -> BloomFilter | None:
+        """The shared filter, re-read from the cache once per refresh interval; None when missing or too old."""
+        now = time.monotonic()
+        if self._fetched_at is None or now - self._fetched_at > self.refresh_interval:
+            with self._lock:
+                if self._fetched_at is None or now - self._fetched_at > self.refresh_interval:
+                    self._shared = cache.get(BLACKLIST_FILTER_KEY)
+                    self._fetched_at = now
+        shared = self._shared
+        if shared is None or time.time() - shared[0] > self.max_filter_age:
+            return None
+        return shared[1]
+
+    def rebuild(self) -> int:
+        """Builds the filter from the blacklist table and shares it; returns the number of tokens it covers."""
+        # taken before the query: entries committed while it runs are still in the recent tier
+        built_at = time.time()
+        jtis = list(
+            BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now()).values_list("token__jti", flat=True)
+        )
+        error_rate = getattr(settings, "TOKEN_BLACKLIST_FILTER_ERROR_RATE", 0.001)
+        bloom = BloomFilter.from_items(jtis, max(2 * len(jtis), 1024), error_rate)
+        cache.set(BLACKLIST_FILTER_KEY, (built_at, bloom), timeout=None)
+        self.reset()
+        return len(jtis)
+
+    def reset(self) -> None:
+        self._shared = None
+        self._fetched_at = None
+
+
+token_blacklist = TokenBlacklist()
+
+
+def purge_expired_tokens(batch_size: int | None = None) -> int:
+    """
+    Deletes expired outstanding tokens (and, by cascade, their blacklist rows) in short transactions of
+    `batch_size` rows, so the token tables stay bounded without one long-running DELETE. Returns the number
+    of outstanding tokens removed.
+    """
+    batch_size = batch_size or getattr(settings, "TOKEN_PURGE_BATCH_SIZE", 5000)
+    expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now()).order_by("id")
+    purged = 0
+    while ids := list(expired.values_list("id", flat=True)[:batch_size]):
+        with transaction.atomic():
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            purged += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+    return purged
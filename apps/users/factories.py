@@ -1,5 +1,6 @@
 import factory
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.utils.crypto import get_random_string
 
 
@@ -17,6 +18,22 @@ class UserFactory(factory.django.DjangoModelFactory):
 
     @factory.post_generation
     def password(self, create, extracted, **kwargs):
+        if "hashed" in kwargs:
+            # bulk seeding shares one precomputed hash instead of hashing per user
+            self.password = kwargs["hashed"]
+            return
         raw_password = extracted or get_random_string(12)
         self.set_password(raw_password)
         self._raw_password = raw_password
+
+    @classmethod
+    def create_bulk(
+        cls, size: int, *, batch_size: int = 5000, raw_password: str = "password123", **kwargs
+    ) -> list[int]:
+        """Inserts users batch by batch with bulk_create and returns their ids."""
+        hashed = make_password(raw_password)
+        ids: list[int] = []
+        for start in range(0, size, batch_size):
+            users = cls.build_batch(min(batch_size, size - start), password__hashed=hashed, **kwargs)
+            ids.extend(user.pk for user in User.objects.bulk_create(users))
+        return ids
@@ -1,13 +1,21 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework_simplejwt import serializers as jwt_serializers
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import UntypedToken
+from apps.users.authentication import invalidate_cached_user
+from apps.users.blacklist import token_blacklist
+from apps.users.tokens import RefreshToken
+from event_management.serializers import CompiledListSerializer, MeasuredDataMixin
 
 
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(MeasuredDataMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("id", "username", "email", "password", "is_staff")
@@ -38,12 +46,33 @@ class LogoutSerializer(serializers.Serializer):
 
     def save(self, **kwargs: dict) -> None:
         try:
-            RefreshToken(self.token).blacklist()
+            token = RefreshToken(self.token)
+            token.blacklist()
         except TokenError as e:
             self.fail("bad_token")
+        invalidate_cached_user(token[api_settings.USER_ID_CLAIM])
 
 
-class UserShortSerializer(serializers.ModelSerializer):
+class UserShortSerializer(MeasuredDataMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("id", "username", "email")
+        list_serializer_class = CompiledListSerializer
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    token_class = RefreshToken
+
+
+class TokenVerifySerializer(jwt_serializers.TokenVerifySerializer):
+    def validate(self, attrs: dict) -> dict:
+        token = UntypedToken(attrs["token"])
+        # simplejwt's condition, with the lookup going through `token_blacklist`
+        if (
+            api_settings.BLACKLIST_AFTER_ROTATION
+            and "rest_framework_simplejwt.token_blacklist" in settings.INSTALLED_APPS
+        ):
+            jti = token.get(api_settings.JTI_CLAIM)
+            if jti is not None and token_blacklist.contains(jti):
+                raise serializers.ValidationError(_("Token is blacklisted"))
+        return {}
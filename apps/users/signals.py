@@ -0,0 +1,18 @@
+from functools import partial
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.settings import api_settings
+from apps.users.authentication import invalidate_cached_user
+
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User, dispatch_uid="users_invalidate_cached_user_on_save")
+@receiver(post_delete, sender=User, dispatch_uid="users_invalidate_cached_user_on_delete")
+def invalidate_cached_user_on_change(sender, instance: User, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    transaction.on_commit(partial(invalidate_cached_user, getattr(instance, api_settings.USER_ID_FIELD)))
@@ -0,0 +1,12 @@
+from celery import shared_task
+from apps.users.blacklist import purge_expired_tokens as purge_expired_token_rows, token_blacklist
+
+
+@shared_task(name="purge_expired_tokens")
+def purge_expired_tokens() -> int:
+    return purge_expired_token_rows()
+
+
+@shared_task(name="rebuild_token_blacklist_filter")
+def rebuild_token_blacklist_filter() -> int:
+    return token_blacklist.rebuild()
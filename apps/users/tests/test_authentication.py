@@ -0,0 +1,125 @@
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.users.authentication import (
+    LocalUserCache,
+    cache_user,
+    get_cached_user,
+    invalidate_cached_user,
+    local_user_cache,
+    lookup_cached_user,
+)
+from apps.users.models import User
+from apps.users.factories import UserFactory
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        local_user_cache.clear()
+        self.user = UserFactory()
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.refresh.access_token}")
+        self.url = reverse("users:manage")
+
+    def test_cached_user_skips_database(self) -> None:
+        # authentication, then the profile row itself
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(1):
+            res = self.client.get(self.url)
+        self.assertEqual(res.data["username"], self.user.username)
+
+        # a fresh process still skips Postgres thanks to the shared tier
+        local_user_cache.clear()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    def test_cache_holds_no_password_or_profile_fields(self) -> None:
+        self.client.get(self.url)
+        entry = cache.get(f"auth:user:{self.user.id}")
+        self.assertEqual(
+            set(entry["fields"]), {"id", "username", "email", "is_active", "is_staff", "is_superuser"}
+        )
+        self.assertNotIn(self.user.password, str(entry))
+
+    def test_profile_update_does_not_write_back_cached_fields(self) -> None:
+        self.client.get(self.url)
+        # changed behind the cache's back (no signal), as by another worker's in-flight write
+        User.objects.filter(pk=self.user.pk).update(is_active=False, password="changed-elsewhere")
+        res = self.client.patch(self.url, {"email": "changed@example.com"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
+        self.assertEqual(self.user.password, "changed-elsewhere")
+        self.assertEqual(self.user.email, "changed@example.com")
+
+    def test_cached_user_serves_the_fields_requests_read(self) -> None:
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            user = get_cached_user(self.user.id)
+            self.assertEqual((user.username, user.email), (self.user.username, self.user.email))
+            self.assertFalse(user.is_staff or user.is_superuser)
+
+    def test_authenticated_create_reads_no_user_row(self) -> None:
+        self.client.get(self.url)
+        payload = {"title": "Cached organizer", "date": "2030-01-01T10:00:00Z", "location": "Kyiv"}
+        # INSERT, search vector UPDATE and feed upsert; the organizer payload comes from the cached user
+        with self.assertNumQueries(3):
+            res = self.client.post(reverse("events:events-list"), payload, format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data["organizer"]["username"], self.user.username)
+
+    def test_entry_loaded_before_an_invalidation_is_ignored(self) -> None:
+        _, version = lookup_cached_user(self.user.id)
+        invalidate_cached_user(self.user.id)
+        cache_user(self.user.id, self.user, version)
+        self.assertIsNone(get_cached_user(self.user.id))
+
+    def test_deactivation_invalidates_cache(self) -> None:
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertIsNone(get_cached_user(self.user.id))
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_profile_update_is_visible_immediately(self) -> None:
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.patch(self.url, {"email": "changed@example.com"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(self.url).data["email"], "changed@example.com")
+
+    def test_logout_invalidates_cache(self) -> None:
+        self.client.get(self.url)
+        self.assertIsNotNone(get_cached_user(self.user.id))
+        res = self.client.post(reverse("users:logout"), {"refresh": str(self.refresh)}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertIsNone(get_cached_user(self.user.id))
+
+
+class LocalUserCacheTests(TestCase):
+    @override_settings(AUTH_USER_LOCAL_CACHE_SIZE=2)
+    def test_evicts_least_recently_used(self) -> None:
+        users = LocalUserCache()
+        users.set(1, "a")
+        users.set(2, "b")
+        users.get(1)
+        users.set(3, "c")
+        self.assertIsNone(users.get(2))
+        self.assertEqual(users.get(1), "a")
+        self.assertEqual(users.get(3), "c")
+
+    @override_settings(AUTH_USER_LOCAL_CACHE_TIMEOUT=30)
+    def test_entries_expire(self) -> None:
+        users = LocalUserCache()
+        with patch("apps.users.authentication.time.monotonic", return_value=100.0):
+            users.set(1, "a")
+            self.assertEqual(users.get(1), "a")
+        with patch("apps.users.authentication.time.monotonic", return_value=131.0):
+            self.assertIsNone(users.get(1))
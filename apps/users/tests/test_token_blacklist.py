@@ -0,0 +1,91 @@
+import time
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.users import serializers as user_serializers
+from apps.users.blacklist import RECENT_BLACKLIST_KEY, BloomFilter, purge_expired_tokens, token_blacklist
+from apps.users.factories import UserFactory
+from apps.users.tasks import purge_expired_tokens as purge_expired_tokens_task, rebuild_token_blacklist_filter
+
+
+class BloomFilterTests(TestCase):
+    def test_membership(self) -> None:
+        items = [str(uuid.uuid4()) for _ in range(1000)]
+        bloom = BloomFilter.from_items(items, capacity=1000, error_rate=0.01)
+        self.assertTrue(all(item in bloom for item in items))
+        false_positives = sum(str(uuid.uuid4()) in bloom for _ in range(10_000))
+        self.assertLess(false_positives, 300)
+
+
+class TokenBlacklistTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        token_blacklist.reset()
+        self.user = UserFactory()
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.refresh.access_token}")
+
+    def refresh_access(self):
+        return self.client.post(reverse("users:token_refresh"), {"refresh": str(self.refresh)}, format="json")
+
+    def verify(self):
+        return self.client.post(reverse("users:token_verify"), {"token": str(self.refresh)}, format="json")
+
+    def test_refresh_of_valid_token_skips_blacklist_table(self) -> None:
+        rebuild_token_blacklist_filter.delay()
+        with CaptureQueriesContext(connection) as queries:
+            res = self.refresh_access()
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse([q for q in queries if "token_blacklist_blacklistedtoken" in q["sql"]])
+
+    def test_logout_blocks_refresh(self) -> None:
+        self.refresh_access()
+        res = self.client.post(reverse("users:logout"), {"refresh": str(self.refresh)}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.refresh_access().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_verify_checks_the_blacklist_only_after_rotation(self) -> None:
+        # as in simplejwt: verify consults the blacklist only when BLACKLIST_AFTER_ROTATION is on
+        self.client.post(reverse("users:logout"), {"refresh": str(self.refresh)}, format="json")
+        self.assertEqual(self.verify().status_code, status.HTTP_200_OK)
+        with patch.object(user_serializers.api_settings, "BLACKLIST_AFTER_ROTATION", True):
+            self.assertEqual(self.verify().status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_older_entries_are_found_through_the_filter(self) -> None:
+        self.client.post(reverse("users:logout"), {"refresh": str(self.refresh)}, format="json")
+        rebuild_token_blacklist_filter.delay()
+        cache.delete(RECENT_BLACKLIST_KEY.format(self.refresh["jti"]))  # the recent tier has expired
+        self.assertEqual(self.refresh_access().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_request_path_never_rebuilds_the_filter(self) -> None:
+        with patch.object(token_blacklist, "rebuild", side_effect=AssertionError("rebuilt on the request path")):
+            self.assertEqual(self.refresh_access().status_code, status.HTTP_200_OK)
+        rebuild_token_blacklist_filter.delay()
+        token_blacklist.reset()
+        with patch("apps.users.blacklist.time.time", return_value=time.time() + 4 * token_blacklist.refresh_interval):
+            # a filter the beat stopped refreshing is not trusted: lookups fall back to the table
+            self.assertIsNone(token_blacklist.get_filter())
+
+    def test_purge_deletes_expired_tokens_in_batches(self) -> None:
+        self.client.post(reverse("users:logout"), {"refresh": str(self.refresh)}, format="json")
+        expired = []
+        for _ in range(5):
+            token = RefreshToken.for_user(self.user)
+            expired.append(token["jti"])
+            token.blacklist()
+        OutstandingToken.objects.filter(jti__in=expired).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(purge_expired_tokens(batch_size=2), 5)
+        self.assertFalse(OutstandingToken.objects.filter(jti__in=expired).exists())
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+        self.assertEqual(purge_expired_tokens_task(), 0)
@@ -0,0 +1,20 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+from apps.users.blacklist import token_blacklist
+
+
+class RefreshToken(BaseRefreshToken):
+    """Refresh token whose blacklist checks and writes go through `token_blacklist`."""
+
+    def check_blacklist(self) -> None:
+        if token_blacklist.contains(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> tuple[BlacklistedToken, bool]:
+        result = super().blacklist()
+        token_blacklist.add(self.payload[api_settings.JTI_CLAIM], datetime_from_epoch(self.payload["exp"]))
+        return result
@@ -1,6 +1,7 @@
 from django.urls import path, include
 from rest_framework import routers
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView, TokenVerifyView
+from apps.events.views import MyEventsView, MyRegistrationsView
 from apps.users.views import CreateUserView, ManageUserView, LogoutAPIView, UserViewSet
 
 app_name = "users"
@@ -13,6 +14,8 @@ urlpatterns = [
     path("", CreateUserView.as_view(), name="create"),
     path("login/", TokenObtainPairView.as_view(), name="login"),
     path("me/", ManageUserView.as_view(), name="manage"),
+    path("me/events/", MyEventsView.as_view(), name="my-events"),
+    path("me/registrations/", MyRegistrationsView.as_view(), name="my-registrations"),
     path("logout/", LogoutAPIView.as_view(), name="logout"),
     path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("token/verify/", TokenVerifyView.as_view(), name="token_verify"),
@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from apps.users.models import User
 from apps.users.serializers import UserSerializer, LogoutSerializer, UserShortSerializer
+from event_management.db_routing import ReplicaReadMixin
 
 
 class CreateUserView(generics.CreateAPIView):
@@ -16,7 +17,8 @@ class ManageUserView(generics.RetrieveUpdateAPIView):
     serializer_class = UserSerializer
 
     def get_object(self) -> User:
-        return self.request.user
+        # request.user comes from the auth cache with most fields deferred; updates must start from the current row
+        return User.objects.get(pk=self.request.user.pk)
 
 
 class LogoutAPIView(APIView):
@@ -29,6 +31,6 @@ class LogoutAPIView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class UserViewSet(viewsets.ReadOnlyModelViewSet):
+class UserViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserShortSerializer
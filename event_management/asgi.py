@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "event_management.settings")
+# persistent connections are not supported under ASGI; settings close them after every request instead
+os.environ["DJANGO_SERVING_ASGI"] = "1"
 
 application = get_asgi_application()
@@ -0,0 +1,99 @@
+"""
+Small async counterparts of the DRF machinery used by the read-only endpoints served under `/api/async/`:
+JWT authentication, exception handling, limit/offset pagination and JSON rendering. Payloads are rendered
+with the project's `ORJSONRenderer`, so they match the synchronous endpoints byte for byte.
+"""
+
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any
+from django.core.exceptions import PermissionDenied
+from django.db.models import Model, QuerySet
+from django.http import Http404, HttpRequest, HttpResponse
+from rest_framework import exceptions, status
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.request import Request
+from apps.users.authentication import AsyncJWTAuthentication
+from event_management.metrics import measure_serialization
+from event_management.renderers import ORJSONRenderer
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+AsyncView = Callable[..., Awaitable[HttpResponse]]
+
+
+def render_response(data: Any, status_code: int = status.HTTP_200_OK, headers: dict | None = None) -> HttpResponse:
+    with measure_serialization():
+        body = b"" if data is None else ORJSONRenderer().render(data)
+    return HttpResponse(body, status=status_code, content_type="application/json", headers=headers)
+
+
+def exception_response(exc: Exception) -> HttpResponse | None:
+    """Async twin of `rest_framework.views.exception_handler`."""
+    if isinstance(exc, Http404):
+        exc = exceptions.NotFound(*exc.args)
+    elif isinstance(exc, PermissionDenied):
+        exc = exceptions.PermissionDenied(*exc.args)
+    if not isinstance(exc, exceptions.APIException):
+        return None
+    headers = {}
+    if getattr(exc, "auth_header", None):
+        headers["WWW-Authenticate"] = exc.auth_header
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+    return render_response(data, exc.status_code, headers)
+
+
+def async_api_view(view: AsyncView) -> AsyncView:
+    """
+    Wraps an async read-only view: rejects unsafe methods, authenticates the bearer token (authentication is
+    required, as with the default `IsAuthenticated` permission) and turns API exceptions into responses.
+    The view receives a DRF `Request` so serializers, filters and paginators work unchanged.
+    """
+
+    @wraps(view)
+    async def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if request.method not in SAFE_METHODS:
+            response = exception_response(exceptions.MethodNotAllowed(request.method))
+            response["Allow"] = ", ".join(SAFE_METHODS)
+            return response
+        authenticator = AsyncJWTAuthentication()
+        try:
+            result = await authenticator.aauthenticate(request)
+            if result is None:
+                raise exceptions.NotAuthenticated()
+            api_request = Request(request)
+            api_request.user, api_request.auth = result
+            return await view(api_request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+                exc.auth_header = authenticator.authenticate_header(request)
+            return exception_response(exc)
+        except (Http404, PermissionDenied) as exc:
+            return exception_response(exc)
+
+    return wrapper
+
+
+class AsyncLimitOffsetPagination(LimitOffsetPagination):
+    # set by views that already know the total, to skip COUNT(*)
+    known_count: int | None = None
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request) -> list[Model] | None:
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.count = self.known_count if self.known_count is not None else await queryset.acount()
+        self.offset = self.get_offset(request)
+        if self.count == 0 or self.offset > self.count:
+            return []
+        return [obj async for obj in queryset[self.offset : self.offset + self.limit]]
+
+    def get_paginated_data(self, data: list) -> dict:
+        return {
+            "count": self.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
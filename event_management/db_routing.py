@@ -0,0 +1,83 @@
+import random
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+PRIMARY_DB = "default"
+
+# set for the duration of a request whose reads may go to a replica
+replica_reads_enabled: ContextVar[bool] = ContextVar("replica_reads_enabled", default=False)
+
+
+def pick_replica() -> str:
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+def _pin_key(user_id: int) -> str:
+    return f"db:primary-pin:{user_id}"
+
+
+def pin_to_primary(user_id: int) -> None:
+    """Sends the user's reads to the primary until the replicas have caught up with their write."""
+    cache.set(_pin_key(user_id), 1, timeout=getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 10))
+
+
+def is_pinned_to_primary(user_id: int) -> bool:
+    return cache.get(_pin_key(user_id)) is not None
+
+
+class PrimaryReplicaRouter:
+    """
+    Writes, migrations and reads outside replica-enabled views use the primary. Reads of views using
+    `ReplicaReadMixin` go to a random alias of `DATABASE_REPLICAS`, when any is configured.
+    """
+
+    def db_for_read(self, model: type[Model], **hints) -> str:
+        if replica_reads_enabled.get() and getattr(settings, "DATABASE_REPLICAS", ()):
+            return pick_replica()
+        return PRIMARY_DB
+
+    def db_for_write(self, model: type[Model], **hints) -> str:
+        return PRIMARY_DB
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints) -> bool:
+        # replicas mirror the primary, so objects read from any of them can be related
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: str | None = None, **hints) -> bool:
+        return db == PRIMARY_DB
+
+
+class ReplicaReadMixin:
+    """
+    Serves safe requests of a DRF view from the replicas, unless the user wrote through such a view in the last
+    `DATABASE_REPLICA_STICKY_SECONDS` (read-your-writes). Successful unsafe requests start that window.
+    Streamed response bodies are produced after the view returns and therefore read from the primary.
+    """
+
+    def initial(self, request: Request, *args, **kwargs) -> None:
+        super().initial(request, *args, **kwargs)
+        if request.method not in SAFE_METHODS or not getattr(settings, "DATABASE_REPLICAS", ()):
+            return
+        if request.user.is_authenticated and is_pinned_to_primary(request.user.pk):
+            return
+        self._replica_reads_token = replica_reads_enabled.set(True)
+
+    def finalize_response(self, request: Request, response: Response, *args, **kwargs) -> Response:
+        token = getattr(self, "_replica_reads_token", None)
+        if token is not None:
+            replica_reads_enabled.reset(token)
+            self._replica_reads_token = None
+        elif (
+            request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and getattr(settings, "DATABASE_REPLICAS", ())
+            and request.user.is_authenticated
+        ):
+            pin_to_primary(request.user.pk)
+        return super().finalize_response(request, response, *args, **kwargs)
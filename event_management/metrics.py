@@ -0,0 +1,165 @@
+"""
+In-process request metrics, exposed in the Prometheus text format at `/metrics`. Every worker process keeps its own
+registry, so scrape each worker (or run a single one behind the scraper).
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+
+@dataclass
+class Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(init=False)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.total}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+@dataclass
+class ViewMetrics:
+    duration: Histogram = field(default_factory=lambda: Histogram(DURATION_BUCKETS))
+    queries: Histogram = field(default_factory=lambda: Histogram(QUERY_BUCKETS))
+    db_seconds: float = 0.0
+    serialize_seconds: float = 0.0
+    response_bytes: int = 0
+    budget_exceeded: int = 0
+
+
+@dataclass
+class RequestSample:
+    view: str
+    method: str
+    status: int = 0
+    duration: float = 0.0
+    queries: int = 0
+    db_seconds: float = 0.0
+    serialize_seconds: float = 0.0
+    response_bytes: int = 0
+    over_budget: bool = False
+
+
+# set by `RequestMetricsMiddleware`; context variables follow the request into `sync_to_async` threads
+current_sample: ContextVar[RequestSample | None] = ContextVar("current_sample", default=None)
+
+
+def count_query(execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+    """Database execute wrapper adding each query and its duration to the current request's sample."""
+    sample = current_sample.get()
+    if sample is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        sample.queries += 1
+        sample.db_seconds += time.perf_counter() - started
+
+
+@contextmanager
+def measure_serialization() -> Iterator[None]:
+    """Adds the time spent in the block to the request's serialization time."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        sample = current_sample.get()
+        if sample is not None:
+            sample.serialize_seconds += time.perf_counter() - started
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._views: dict[tuple[str, str, int], ViewMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sample: RequestSample) -> None:
+        key = (sample.view, sample.method, sample.status)
+        with self._lock:
+            metrics = self._views.setdefault(key, ViewMetrics())
+            metrics.duration.observe(sample.duration)
+            metrics.queries.observe(sample.queries)
+            metrics.db_seconds += sample.db_seconds
+            metrics.serialize_seconds += sample.serialize_seconds
+            metrics.response_bytes += sample.response_bytes
+            metrics.budget_exceeded += sample.over_budget
+
+    def reset(self) -> None:
+        with self._lock:
+            self._views.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            views = sorted(self._views.items())
+            lines = [
+                "# HELP http_request_duration_seconds Time spent handling the request.",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for key, metrics in views:
+                lines += metrics.duration.render("http_request_duration_seconds", self._labels(*key))
+            lines += [
+                "# HELP http_request_db_queries SQL queries executed per request.",
+                "# TYPE http_request_db_queries histogram",
+            ]
+            for key, metrics in views:
+                lines += metrics.queries.render("http_request_db_queries", self._labels(*key))
+            for name, attribute, help_text in (
+                ("http_request_db_seconds_total", "db_seconds", "Time spent executing SQL."),
+                (
+                    "http_response_serialization_seconds_total",
+                    "serialize_seconds",
+                    "Time spent building serializer data and rendering responses.",
+                ),
+                ("http_response_size_bytes_total", "response_bytes", "Bytes of non-streaming response bodies."),
+                ("http_request_query_budget_exceeded_total", "budget_exceeded", "Requests over REQUEST_QUERY_BUDGET."),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                lines += [f"{name}{{{self._labels(*key)}}} {getattr(metrics, attribute)}" for key, metrics in views]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _labels(view: str, method: str, status: int) -> str:
+        view = view.replace("\\", "\\\\").replace('"', '\\"')
+        return f'view="{view}",method="{method}",status="{status}"'
+
+
+request_metrics = MetricsRegistry()
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Prometheus scrape endpoint, answering only addresses listed in `METRICS_ALLOWED_IPS`."""
+    if request.META.get("REMOTE_ADDR") not in getattr(settings, "METRICS_ALLOWED_IPS", ("127.0.0.1", "::1")):
+        raise Http404
+    return HttpResponse(request_metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
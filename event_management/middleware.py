@@ -0,0 +1,115 @@
+import logging
+import time
+from collections.abc import Callable
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.template.response import SimpleTemplateResponse
+from event_management.metrics import RequestSample, count_query, current_sample, request_metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+def install_query_counter(connection, **kwargs) -> None:
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+
+connection_created.connect(install_query_counter)
+
+
+def get_view_label(view_func: Callable, method: str) -> str:
+    """`ViewSet.action` for DRF viewsets, the class name for other class-based views, else the function path."""
+    cls = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+    if cls is None:
+        return f"{view_func.__module__}.{view_func.__qualname__}"
+    actions = getattr(view_func, "actions", None) or {}
+    # viewsets answer HEAD with the GET action
+    action = actions.get(method.lower()) or (actions.get("get") if method == "HEAD" else None)
+    return f"{cls.__name__}.{action}" if action else cls.__name__
+
+
+class RequestMetricsMiddleware:
+    """
+    Measures every request: SQL query count and time (on all database aliases), serialization time (building
+    serializer `.data`, timed by `MeasuredDataMixin`, and rendering the response), response size and total time.
+    They are sent back in a `Server-Timing` header, aggregated per view for `/metrics`, and a warning is logged
+    when a request runs more than `REQUEST_QUERY_BUDGET` queries. Keep it first in `MIDDLEWARE` (the settings insert
+    the debug toolbar after it) so the timings cover the whole stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        # connections opened before this middleware was loaded never sent `connection_created`
+        for connection in connections.all(initialized_only=True):
+            install_query_counter(connection)
+        sample = RequestSample(view="unresolved", method=request.method)
+        token = current_sample.set(sample)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_sample.reset(token)
+        return self.finish(request, response, sample, started)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        sample = RequestSample(view="unresolved", method=request.method)
+        token = current_sample.set(sample)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_sample.reset(token)
+        return self.finish(request, response, sample, started)
+
+    def process_view(self, request: HttpRequest, view_func: Callable, view_args: tuple, view_kwargs: dict) -> None:
+        sample = current_sample.get()
+        if sample is not None:
+            sample.view = get_view_label(view_func, request.method)
+
+    def process_template_response(self, request: HttpRequest, response: SimpleTemplateResponse):
+        # DRF responses are rendered right after this hook, still inside the middleware call
+        sample = current_sample.get()
+        if sample is not None:
+            render_started = time.perf_counter()
+
+            def record_render(rendered: SimpleTemplateResponse) -> None:
+                sample.serialize_seconds += time.perf_counter() - render_started
+
+            response.add_post_render_callback(record_render)
+        return response
+
+    def finish(self, request: HttpRequest, response: HttpResponse, sample: RequestSample, started: float):
+        sample.duration = time.perf_counter() - started
+        sample.status = response.status_code
+        if not isinstance(response, StreamingHttpResponse):
+            sample.response_bytes = len(response.content)
+        budget = getattr(settings, "REQUEST_QUERY_BUDGET", 20)
+        if sample.queries > budget:
+            sample.over_budget = True
+            logger.warning(
+                "%s %s (%s) ran %d queries, over the budget of %d",
+                request.method,
+                request.path,
+                sample.view,
+                sample.queries,
+                budget,
+            )
+        request_metrics.record(sample)
+        response.headers["Server-Timing"] = (
+            f'db;dur={sample.db_seconds * 1000:.2f};desc="{sample.queries} queries", '
+            f"serialize;dur={sample.serialize_seconds * 1000:.2f}, total;dur={sample.duration * 1000:.2f}"
+        )
+        return response
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt.token_blacklist",
     "drf_spectacular",
@@ -53,6 +54,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "event_management.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -64,6 +66,11 @@ MIDDLEWARE = [
 
 INTERNAL_IPS = ["127.0.0.1"]
 
+# request metrics: SQL queries per request above which a warning is logged, and client addresses allowed to
+# scrape /metrics
+REQUEST_QUERY_BUDGET = int(os.getenv("REQUEST_QUERY_BUDGET", "20"))
+METRICS_ALLOWED_IPS = os.getenv("METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",")
+
 
 # added only to see debug toolbar in docker
 def show_toolbar(request) -> bool:
@@ -81,9 +88,11 @@ if not TESTING:
         *INSTALLED_APPS,
         "debug_toolbar",
     ]
+    # after RequestMetricsMiddleware, which has to stay first to time the whole stack
     MIDDLEWARE = [
+        MIDDLEWARE[0],
         "debug_toolbar.middleware.DebugToolbarMiddleware",
-        *MIDDLEWARE,
+        *MIDDLEWARE[1:],
     ]
 
 ROOT_URLCONF = "event_management.urls"
@@ -110,16 +119,86 @@ WSGI_APPLICATION = "event_management.wsgi.application"
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
 
-DATABASES = {
-    "default": {
+# connections are either pooled by psycopg (POSTGRES_POOL=1, recommended under ASGI) or kept open per thread for
+# POSTGRES_CONN_MAX_AGE seconds; both are checked with a cheap query before their first use in a request
+POSTGRES_POOL = os.getenv("POSTGRES_POOL", "0") == "1"
+# set by asgi.py: async views run in a fresh thread per request, so persistent connections would only pile up
+SERVING_ASGI = os.getenv("DJANGO_SERVING_ASGI", "0") == "1"
+
+
+def postgres_database(host: str | None) -> dict:
+    database = {
         "ENGINE": "django.db.backends.postgresql",
-        "HOST": os.getenv("POSTGRES_HOST"),
+        "HOST": host,
         "NAME": os.getenv("POSTGRES_NAME"),
         "USER": os.getenv("POSTGRES_USER"),
         "PASSWORD": os.getenv("POSTGRES_PASSWORD"),
         "PORT": os.getenv("POSTGRES_PORT"),
+        "CONN_MAX_AGE": 0 if POSTGRES_POOL or SERVING_ASGI else int(os.getenv("POSTGRES_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+        # PgBouncer in transaction mode cannot keep server-side cursors open between transactions
+        "DISABLE_SERVER_SIDE_CURSORS": os.getenv("POSTGRES_DISABLE_SERVER_SIDE_CURSORS", "0") == "1",
     }
-}
+    if POSTGRES_POOL:
+        database["OPTIONS"] = {
+            "pool": {
+                "min_size": int(os.getenv("POSTGRES_POOL_MIN_SIZE", "2")),
+                "max_size": int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+                "timeout": float(os.getenv("POSTGRES_POOL_TIMEOUT", "10")),
+            }
+        }
+    return database
+
+
+DATABASES = {"default": postgres_database(os.getenv("POSTGRES_HOST"))}
+# read replicas (comma-separated hosts) serving the reads of ReplicaReadMixin views; tests only use the primary
+for number, replica_host in enumerate(filter(None, os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",")), start=1):
+    DATABASES[f"replica{number}"] = {**postgres_database(replica_host.strip()), "TEST": {"MIRROR": "default"}}
+DATABASE_REPLICAS = () if TESTING else tuple(alias for alias in DATABASES if alias != "default")
+DATABASE_ROUTERS = ["event_management.db_routing.PrimaryReplicaRouter"]
+# seconds a user's reads stay on the primary after a write (should exceed the replication lag)
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv("DATABASE_REPLICA_STICKY_SECONDS", "10"))
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+REDIS_HOST = os.getenv("REDIS_HOST")
+REDIS_PORT = os.getenv("REDIS_PORT", "6379")
+
+if TESTING or not REDIS_HOST:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_CACHE_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}/1"),
+        }
+    }
+
+# seconds a cached /api/events/ list or detail payload lives (writes invalidate it earlier)
+EVENTS_CACHE_TIMEOUT = int(os.getenv("EVENTS_CACHE_TIMEOUT", "300"))
+# rows fetched per server-side cursor round trip by the streaming export endpoints
+EVENTS_EXPORT_CHUNK_SIZE = int(os.getenv("EVENTS_EXPORT_CHUNK_SIZE", "2000"))
+# items accepted by /api/events/bulk/ and rows per INSERT/UPDATE statement
+EVENTS_BULK_MAX_ITEMS = int(os.getenv("EVENTS_BULK_MAX_ITEMS", "5000"))
+EVENTS_BULK_BATCH_SIZE = int(os.getenv("EVENTS_BULK_BATCH_SIZE", "1000"))
+# most user ids accepted by one register/unregister request
+EVENTS_PARTICIPANTS_MAX_IDS = int(os.getenv("EVENTS_PARTICIPANTS_MAX_IDS", "50000"))
+# user ids per transaction in register/unregister jobs (`"job": true`)
+EVENTS_PARTICIPANTS_JOB_CHUNK_SIZE = int(os.getenv("EVENTS_PARTICIPANTS_JOB_CHUNK_SIZE", "1000"))
+# waitlisted users registered per transaction when seats free up
+EVENTS_WAITLIST_PROMOTION_BATCH_SIZE = int(os.getenv("EVENTS_WAITLIST_PROMOTION_BATCH_SIZE", "500"))
+# seconds between removals of started events from the upcoming-events feed, and rows removed per transaction
+UPCOMING_EVENTS_PRUNE_INTERVAL = int(os.getenv("UPCOMING_EVENTS_PRUNE_INTERVAL", str(15 * 60)))
+UPCOMING_EVENTS_PRUNE_BATCH_SIZE = int(os.getenv("UPCOMING_EVENTS_PRUNE_BATCH_SIZE", "5000"))
+# reminder emails: hours before an event they go out, seconds between scans for due events, registrants per
+# Celery task and messages per SMTP batch/transaction
+EVENT_REMINDER_LEAD_HOURS = int(os.getenv("EVENT_REMINDER_LEAD_HOURS", "24"))
+EVENT_REMINDER_SCAN_INTERVAL = int(os.getenv("EVENT_REMINDER_SCAN_INTERVAL", "60"))
+EVENT_REMINDER_CHUNK_SIZE = int(os.getenv("EVENT_REMINDER_CHUNK_SIZE", "1000"))
+EVENT_REMINDER_BATCH_SIZE = int(os.getenv("EVENT_REMINDER_BATCH_SIZE", "100"))
+# seconds a response stored under an Idempotency-Key header is replayed to retries
+IDEMPOTENCY_KEY_TTL = int(os.getenv("IDEMPOTENCY_KEY_TTL", str(24 * 60 * 60)))
 
 
 # Password validation
@@ -162,10 +241,14 @@ USE_TZ = True
 STATIC_URL = "static/"
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("apps.users.authentication.CachedJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "event_management.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
     "PAGE_SIZE": 25,
 }
@@ -187,7 +270,21 @@ SPECTACULAR_SETTINGS = {
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=5),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=30),
+    "TOKEN_REFRESH_SERIALIZER": "apps.users.serializers.TokenRefreshSerializer",
+    "TOKEN_VERIFY_SERIALIZER": "apps.users.serializers.TokenVerifySerializer",
 }
+# JWT user lookups: users kept per process, seconds in the per-process LRU (bounds staleness across workers)
+# and seconds in the shared cache
+AUTH_USER_LOCAL_CACHE_SIZE = int(os.getenv("AUTH_USER_LOCAL_CACHE_SIZE", "10000"))
+AUTH_USER_LOCAL_CACHE_TIMEOUT = int(os.getenv("AUTH_USER_LOCAL_CACHE_TIMEOUT", "30"))
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv("AUTH_USER_CACHE_TIMEOUT", "300"))
+# token blacklist: seconds between beat rebuilds of the shared Bloom filter (recent entries stay in Redis for
+# three times as long) and its false positive rate
+TOKEN_BLACKLIST_FILTER_REFRESH = int(os.getenv("TOKEN_BLACKLIST_FILTER_REFRESH", "300"))
+TOKEN_BLACKLIST_FILTER_ERROR_RATE = float(os.getenv("TOKEN_BLACKLIST_FILTER_ERROR_RATE", "0.001"))
+# expired outstanding/blacklisted tokens: seconds between purges and rows deleted per transaction
+TOKEN_PURGE_INTERVAL = int(os.getenv("TOKEN_PURGE_INTERVAL", str(60 * 60)))
+TOKEN_PURGE_BATCH_SIZE = int(os.getenv("TOKEN_PURGE_BATCH_SIZE", "5000"))
 
 # celery settings
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
@@ -195,6 +292,29 @@ CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND")
 CELERY_TIMEZONE = "Europe/Kiev"
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60
+if TESTING:
+    # tasks run inline and keep their results in memory, so jobs can be followed without a broker
+    CELERY_TASK_ALWAYS_EAGER = True
+    CELERY_TASK_STORE_EAGER_RESULT = True
+    CELERY_RESULT_BACKEND = "cache+memory://"
+CELERY_BEAT_SCHEDULE = {
+    "purge-expired-tokens": {
+        "task": "purge_expired_tokens",
+        "schedule": timedelta(seconds=TOKEN_PURGE_INTERVAL),
+    },
+    "rebuild-token-blacklist-filter": {
+        "task": "rebuild_token_blacklist_filter",
+        "schedule": timedelta(seconds=TOKEN_BLACKLIST_FILTER_REFRESH),
+    },
+    "schedule-event-reminders": {
+        "task": "schedule_event_reminders",
+        "schedule": timedelta(seconds=EVENT_REMINDER_SCAN_INTERVAL),
+    },
+    "prune-upcoming-events": {
+        "task": "prune_upcoming_events",
+        "schedule": timedelta(seconds=UPCOMING_EVENTS_PRUNE_INTERVAL),
+    },
+}
 
 # email settings
 EMAIL_BACKEND = os.getenv("EMAIL_BACKEND")
@@ -204,3 +324,9 @@ EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "1") == "1"
+# registration ids per Celery task / messages per SMTP send_messages call
+REGISTRATION_EMAIL_CHUNK_SIZE = int(os.getenv("REGISTRATION_EMAIL_CHUNK_SIZE", "500"))
+REGISTRATION_EMAIL_BATCH_SIZE = int(os.getenv("REGISTRATION_EMAIL_BATCH_SIZE", "100"))
+# open SMTP connections a worker process keeps for reuse, and seconds one may sit idle before it is closed
+EMAIL_POOL_SIZE = int(os.getenv("EMAIL_POOL_SIZE", "2"))
+EMAIL_POOL_MAX_IDLE = int(os.getenv("EMAIL_POOL_MAX_IDLE", "60"))
@@ -19,11 +19,15 @@ from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from event_management.metrics import metrics_view
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/users/", include("apps.users.urls", namespace="users")),
     path("api/events/", include("apps.events.urls", namespace="events")),
+    path("api/async/users/", include("apps.users.async_urls", namespace="users-async")),
+    path("api/async/events/", include("apps.events.async_urls", namespace="events-async")),
+    path("metrics", metrics_view, name="metrics"),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     # Optional UI:
     path("api/doc/swagger/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger"),